@@ -6,6 +6,7 @@ and menu context for templates.
 """
 
 import json
+from functools import lru_cache
 from importlib import import_module
 
 from django.conf import settings
@@ -17,8 +18,7 @@ from horilla.menu.main_section_menu import get_main_section_menu
 from horilla.menu.my_settings_menu import get_my_settings_menu
 from horilla.menu.settings_menu import get_settings_menu
 from horilla.menu.sub_section_menu import get_sub_section_menu
-from horilla_core.models import Company, RecentlyViewed
-from horilla_notifications.models import Notification
+from horilla_core.shell_context import get_shell_context
 
 
 def get_module_version_info(module_name):
@@ -37,8 +37,9 @@ def get_module_version_info(module_name):
         return None
 
 
-def collect_all_versions(request):
-    """Collect version info for all top-level Horilla modules."""
+@lru_cache(maxsize=None)
+def get_all_versions():
+    """Version info of every top-level Horilla module, read once per process."""
 
     versions = [
         {
@@ -62,14 +63,21 @@ def collect_all_versions(request):
 
             seen.add(top_level)
 
+    return versions
+
+
+def collect_all_versions(request):
+    """Collect version info for all top-level Horilla modules."""
     return {
-        "HORILLA_VERSIONS": versions,
+        "HORILLA_VERSIONS": get_all_versions(),
     }
 
 
 def company_list(request):
     """Return all available companies."""
-    return {"available_companies": Company.objects.all()}
+    if not request.user.is_authenticated:
+        return {"available_companies": []}
+    return {"available_companies": get_shell_context(request).companies}
 
 
 def allowed_languages(request):
@@ -94,26 +102,23 @@ def recently_viewed_items(request):
     Return the user's 6 most recently viewed items, cleaning invalid references.
     """
     if request.user.is_authenticated:
-        items = []
-        for rv in RecentlyViewed.objects.filter(user=request.user).order_by(
-            "-viewed_at"
-        )[:6]:
-            try:
-                if rv.content_object:
-                    items.append(rv)
-            except Exception:
-                rv.delete()
-        return {"recently_viewed_items": items}
+        return {
+            "recently_viewed_items": get_shell_context(request).recently_viewed_items
+        }
     return {}
 
 
 def unread_notifications(request):
-    """Return unread notifications for the current user."""
+    """
+    Return the newest unread notifications of the current user (their
+    ``count`` is the total number of unread notifications) and the newest
+    notifications for the notification sidebar.
+    """
     if request.user.is_authenticated:
+        shell_context = get_shell_context(request)
         return {
-            "unread_notifications": Notification.objects.filter(
-                user=request.user, read=False
-            ).order_by("-created_at")
+            "unread_notifications": shell_context.unread_notifications,
+            "all_notifications": shell_context.notifications,
         }
     return {}
 
@@ -145,15 +150,14 @@ def currency_context(request):
     if not request.user.is_authenticated:
         return {}
 
-    from horilla_core.models import MultipleCurrency
-
-    user_currency = MultipleCurrency.get_user_currency(request.user)
-    default_currency = None
+    from horilla_core.currency import get_currency_context
 
-    if hasattr(request.user, "company") and request.user.company:
-        default_currency = MultipleCurrency.get_default_currency(request.user.company)
+    # Shared with the currency cells rendered in the same request.
+    context = get_currency_context(
+        getattr(request.user, "company_id", None), request.user
+    )
 
     return {
-        "user_currency": user_currency,
-        "default_currency": default_currency,
+        "user_currency": context.user_currency,
+        "default_currency": context.default_currency,
     }
@@ -1,6 +1,8 @@
 # horilla/menu/floating_menu.py
 from typing import Any, Dict, List, Type
 
+from horilla.menu.menu_cache import get_compiled, get_filtered, get_permission_key
+
 floating_registry: List[Any] = []
 
 
@@ -10,36 +12,48 @@ def register(cls: Type[Any]):
     return cls
 
 
-def get_floating_menu(request=None) -> List[Dict]:
-    """Return all registered pages as dicts (optionally filter by request)."""
-    pages = []
+def _compile_floating_menu() -> List[tuple]:
+    """``(perm_list, data)`` of every registered page."""
+    entries = []
     for cls in floating_registry:
         obj = cls()
         items = getattr(obj, "items", {}) or {}
 
         perm_list = []
-        if "perm" in items:
+        if not callable(items) and "perm" in items:
             if isinstance(items["perm"], str):
                 perm_list = [items["perm"]]
             elif isinstance(items["perm"], (list, tuple)):
                 perm_list = items["perm"]
 
-        if callable(items):
-            items = items(request) or {}
-
         data = {
             "title": getattr(obj, "title", None),
             "url": getattr(obj, "url", None),
             "icon": getattr(obj, "icon", None),
             "items": items,
         }
+        entries.append((perm_list, data))
+    return entries
 
-        if (
-            request
-            and request.user.is_authenticated
-            and perm_list
-            and request.user.has_perms(perm_list)
-        ):
-            pages.append(data)
 
-    return pages
+def get_floating_menu(request=None) -> List[Dict]:
+    """
+    Return all registered pages as dicts (optionally filter by request).
+    Built once per process and permission set; the list must not be
+    modified. Pages are listed only for the permissions in their items.
+    """
+    if not (request and request.user.is_authenticated):
+        return []
+
+    entries = get_compiled("floating_menu", floating_registry, _compile_floating_menu)
+
+    def build():
+        return [
+            data
+            for perm_list, data in entries
+            if perm_list and request.user.has_perms(perm_list)
+        ]
+
+    return get_filtered(
+        "floating_menu", floating_registry, get_permission_key(request.user), build
+    )
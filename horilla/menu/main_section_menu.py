@@ -4,6 +4,8 @@ This module defines a registry for managing main section menu entries in Horilla
 
 from typing import Any, Dict, List, Type
 
+from horilla.menu.menu_cache import get_compiled
+
 # Registry to hold all main section menu classes
 main_section_menu: List[Any] = []
 
@@ -14,13 +16,7 @@ def register(cls: Type[Any]):
     return cls
 
 
-def get_main_section_menu(request=None) -> List[Dict]:
-    """
-    Return all registered main section menu items.
-
-    Returns:
-        A list of dictionaries representing menu items, sorted by position.
-    """
+def _build_main_section_menu() -> List[Dict]:
     pages = []
     for cls in main_section_menu:
         obj = cls()
@@ -44,3 +40,16 @@ def get_main_section_menu(request=None) -> List[Dict]:
         )
     )
     return pages
+
+
+def get_main_section_menu(request=None) -> List[Dict]:
+    """
+    Return all registered main section menu items.
+
+    Returns:
+        A list of dictionaries representing menu items, sorted by position.
+        The list is built once per process and must not be modified.
+    """
+    return get_compiled(
+        "main_section_menu", main_section_menu, _build_main_section_menu
+    )
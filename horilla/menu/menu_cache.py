@@ -0,0 +1,54 @@
+"""
+Process-wide caches for the menu registries.
+
+Menu classes are registered at import time and only hold static attributes,
+so each registry is compiled into plain dicts (instantiated and sorted) once
+per process, and compiled again only when more classes get registered.
+Permission-filtered menus are also kept per permission set: users with the
+same permissions share the filtered menu, and a change of permissions gives
+a different key.
+"""
+
+from typing import Any, Callable, Hashable, List, Optional
+
+MAX_FILTERED_MENUS = 256
+
+_compiled = {}
+_filtered = {}
+
+
+def get_compiled(name: str, registry: List[Any], build: Callable[[], Any]) -> Any:
+    """Return ``build()`` for ``registry``, built once per registry size."""
+    entry = _compiled.get(name)
+    if entry is None or entry[0] != len(registry):
+        entry = (len(registry), build())
+        _compiled[name] = entry
+    return entry[1]
+
+
+def get_permission_key(user) -> Optional[Hashable]:
+    """
+    Hashable key of what ``user.has_perm`` answers, or ``None`` when there
+    is no user to filter for.
+    """
+    if user is None:
+        return None
+    if not user.is_authenticated:
+        return ("anonymous",)
+    if not user.is_active:
+        return ("inactive",)
+    if user.is_superuser:
+        return ("superuser",)
+    return frozenset(user.get_all_permissions())
+
+
+def get_filtered(
+    name: str, registry: List[Any], permission_key: Hashable, build: Callable[[], Any]
+) -> Any:
+    """Return ``build()`` for one permission set of a registry."""
+    key = (name, len(registry), permission_key)
+    if key not in _filtered:
+        if len(_filtered) >= MAX_FILTERED_MENUS:
+            _filtered.clear()
+        _filtered[key] = build()
+    return _filtered[key]
@@ -1,5 +1,7 @@
 from typing import Any, List, Type
 
+from horilla.menu.menu_cache import get_compiled, get_filtered, get_permission_key
+
 my_settings_menu: List[Any] = []
 
 
@@ -9,23 +11,11 @@ def register(cls: Type[Any]):
     return cls
 
 
-def get_my_settings_menu(request=None) -> list[dict]:
-    items = []
+def _compile_my_settings_menu() -> list[tuple]:
+    """``(condition, permissions, item)`` of every registered page, sorted."""
+    entries = []
     for cls in my_settings_menu:
         obj = cls()
-
-        condition = getattr(obj, "condition", True)
-        if callable(condition):
-            if not request or not condition(request):
-                continue
-        elif not condition:
-            continue
-
-        perms = getattr(obj, "permissions", [])
-        if perms and request:
-            if not request.user.is_authenticated or not request.user.has_perms(perms):
-                continue
-
         data = {
             "title": getattr(obj, "title", None),
             "url": getattr(obj, "url", None),
@@ -34,16 +24,55 @@ def get_my_settings_menu(request=None) -> list[dict]:
             "order": getattr(obj, "order", 100),
             "attrs": getattr(obj, "attrs", {}),
         }
-        items.append(data)
+        entries.append(
+            (getattr(obj, "condition", True), getattr(obj, "permissions", []), data)
+        )
 
     return sorted(
-        items,
+        entries,
         key=lambda x: (
             (
                 0
-                if x["order"] is not None and x["order"] >= 0
-                else 1 if x["order"] is None else 2
+                if x[2]["order"] is not None and x[2]["order"] >= 0
+                else 1 if x[2]["order"] is None else 2
             ),
-            x["order"] if x["order"] is not None else 0,
+            x[2]["order"] if x[2]["order"] is not None else 0,
         ),
     )
+
+
+def get_my_settings_menu(request=None) -> list[dict]:
+    """
+    Return the registered My Settings pages the request may see. Pages with
+    a callable condition are checked on every call; the others are filtered
+    once per permission set.
+    """
+    entries = get_compiled(
+        "my_settings_menu", my_settings_menu, _compile_my_settings_menu
+    )
+
+    def visible(entry, check_conditions):
+        condition, perms, _data = entry
+        if callable(condition):
+            if check_conditions and (not request or not condition(request)):
+                return False
+        elif not condition:
+            return False
+
+        if perms and request:
+            if not request.user.is_authenticated or not request.user.has_perms(perms):
+                return False
+        return True
+
+    permission_key = get_permission_key(request.user) if request else None
+    static_visible = get_filtered(
+        "my_settings_menu",
+        my_settings_menu,
+        permission_key,
+        lambda: [visible(entry, check_conditions=False) for entry in entries],
+    )
+    return [
+        entry[2]
+        for entry, is_visible in zip(entries, static_visible)
+        if is_visible and (not callable(entry[0]) or visible(entry, True))
+    ]
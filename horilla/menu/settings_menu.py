@@ -1,6 +1,8 @@
 # horilla/settings_page.py
 from typing import Any, Callable, Dict, List, Type
 
+from horilla.menu.menu_cache import get_compiled, get_filtered, get_permission_key
+
 settings_registry: List[Any] = []
 
 
@@ -10,8 +12,14 @@ def register(cls: Type[Any]):
     return cls
 
 
-def get_settings_menu(request=None) -> List[Dict]:
-    """Return all registered settings pages as dicts (optionally filter by request)."""
+def _is_dynamic(condition, items) -> bool:
+    return callable(condition) or any(
+        callable(item) or callable(item.get("condition", True)) for item in items
+    )
+
+
+def _compile_settings_menu() -> List[Dict]:
+    """Every registered settings page with its items sorted, in page order."""
     pages = []
 
     for cls in sorted(
@@ -26,21 +34,10 @@ def get_settings_menu(request=None) -> List[Dict]:
         ),
     ):
         obj = cls()
-
         condition = getattr(obj, "condition", True)
-        if callable(condition):
-            if not request or not condition(request):
-                continue
-        elif not condition:
+        if not callable(condition) and not condition:
             continue
 
-        data = {
-            "title": getattr(obj, "title", None),
-            "icon": getattr(obj, "icon", None),
-            "items": [],
-        }
-
-        perm_list = []
         items = getattr(obj, "items", [])
         items = sorted(
             items,
@@ -49,34 +46,89 @@ def get_settings_menu(request=None) -> List[Dict]:
                 i.get("order", 0),
             ),
         )
+        page = {
+            "condition": condition,
+            "title": getattr(obj, "title", None),
+            "icon": getattr(obj, "icon", None),
+            "items": items,
+            "dynamic": _is_dynamic(condition, items),
+        }
+        if not page["dynamic"]:
+            page["data"], page["perm_list"] = _build_page(page, None)
+        pages.append(page)
+
+    return pages
+
+
+def _build_page(page, request):
+    """Return the ``(data, perm_list)`` of a compiled page for ``request``."""
+    data = {
+        "title": page["title"],
+        "icon": page["icon"],
+        "items": [],
+    }
 
-        for item in items:
-            if callable(item):
-                item = item(request) or {}
-                if not item:
-                    continue
-
-            item_condition = item.get("condition", True)
-            if callable(item_condition):
-                if not request or not item_condition(request):
-                    continue
-            elif not item_condition:
+    perm_list = []
+    for item in page["items"]:
+        if callable(item):
+            item = item(request) or {}
+            if not item:
                 continue
 
-            data["items"].append(item)
+        item_condition = item.get("condition", True)
+        if callable(item_condition):
+            if not request or not item_condition(request):
+                continue
+        elif not item_condition:
+            continue
+
+        data["items"].append(item)
+
+        if isinstance(item, dict) and item.get("perm") and isinstance(item["perm"], str):
+            perm_list.append(item["perm"])
+
+    return data, perm_list
+
+
+def get_settings_menu(request=None) -> List[Dict]:
+    """
+    Return all registered settings pages as dicts (optionally filter by
+    request). Pages without callables are built once per process and
+    filtered once per permission set; the others are built on every call.
+    """
+    if not request:
+        return []
+
+    compiled = get_compiled("settings_menu", settings_registry, _compile_settings_menu)
+    user = request.user
 
-            if (
-                isinstance(item, dict)
-                and item.get("perm")
-                and isinstance(item["perm"], str)
-            ):
-                perm_list.append(item["perm"])
+    def is_visible(perm_list):
+        return user.is_authenticated and (
+            not perm_list or user.has_any_perms(perm_list)
+        )
+
+    static_visible = get_filtered(
+        "settings_menu",
+        settings_registry,
+        get_permission_key(user),
+        lambda: [
+            not page["dynamic"] and is_visible(page["perm_list"]) for page in compiled
+        ],
+    )
+
+    pages = []
+    for page, visible in zip(compiled, static_visible):
+        if not page["dynamic"]:
+            if visible:
+                pages.append(page["data"])
+            continue
+
+        condition = page["condition"]
+        if callable(condition) and not condition(request):
+            continue
 
-        if (
-            request
-            and request.user.is_authenticated
-            and (not perm_list or request.user.has_any_perms(perm_list))
-        ):
+        data, perm_list = _build_page(page, request)
+        if is_visible(perm_list):
             pages.append(data)
 
     return pages
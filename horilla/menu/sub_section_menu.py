@@ -3,7 +3,9 @@ Module that provides a registry for managing and retrieving sub-section in the s
 """
 
 from collections import defaultdict
-from typing import Any, Dict, List, Type
+from typing import Any, Dict, List, Tuple, Type
+
+from horilla.menu.menu_cache import get_compiled, get_filtered, get_permission_key
 
 # Registry to hold all subsection menu classes
 sub_section_menu: List[Any] = []
@@ -15,14 +17,13 @@ def register(cls: Type[Any]):
     return cls
 
 
-def get_sub_section_menu(request=None) -> Dict[str, List[Dict]]:
+def _compile_sub_section_menu() -> List[Tuple[str, int, Dict]]:
     """
-    Return all registered main sub-sections grouped by section name,
-    filtered by user permissions.
+    ``(section_name, registration_index, item)`` of every registered
+    sub-section, sorted by position within each section.
     """
     sections = defaultdict(list)
-
-    for cls in sub_section_menu:
+    for index, cls in enumerate(sub_section_menu):
         obj = cls()
         section_name = getattr(obj, "section", None)
         perm = getattr(obj, "perm", [])
@@ -30,19 +31,6 @@ def get_sub_section_menu(request=None) -> Dict[str, List[Dict]]:
         if isinstance(perm, str):
             perm = [perm]
 
-        all_perms = getattr(obj, "all_perms", False)
-
-        # Skip items if user doesn't have required perms
-        if request and request.user:
-            if all_perms:
-                # user must have ALL permissions
-                if not all(request.user.has_perm(p) for p in perm):
-                    continue
-            else:
-                # user must have at least ONE permission
-                if perm and not any(request.user.has_perm(p) for p in perm):
-                    continue
-
         item = {
             "label": getattr(obj, "verbose_name", None),
             "icon": getattr(obj, "icon", None),
@@ -51,20 +39,92 @@ def get_sub_section_menu(request=None) -> Dict[str, List[Dict]]:
             "app_label": getattr(obj, "app_label", None),
             "perm": {
                 "perms": perm,
-                "all_perms": all_perms,
+                "all_perms": getattr(obj, "all_perms", False),
             },
             "position": getattr(obj, "position", None),
             "attrs": getattr(obj, "attrs", {}),
         }
 
         if section_name:
-            sections[section_name].append(item)
+            sections[section_name].append((index, item))
+
+    entries = []
+    for section_name, items in sections.items():
+        items.sort(key=lambda x: (x[1]["position"] is None, x[1]["position"]))
+        entries.extend((section_name, index, item) for index, item in items)
+    return entries
+
+
+def _build_sub_section_menu(user=None) -> Dict[str, List[Dict]]:
+    visible = []
+    for section_name, index, item in get_compiled(
+        "sub_section_menu", sub_section_menu, _compile_sub_section_menu
+    ):
+        perm = item["perm"]["perms"]
+
+        # Skip items if user doesn't have required perms
+        if user:
+            if item["perm"]["all_perms"]:
+                # user must have ALL permissions
+                if not all(user.has_perm(p) for p in perm):
+                    continue
+            else:
+                # user must have at least ONE permission
+                if perm and not any(user.has_perm(p) for p in perm):
+                    continue
+
+        visible.append((section_name, index, item))
+
+    # Sections come in the order their first visible item was registered
+    first_index = {}
+    for section_name, index, _item in visible:
+        first_index[section_name] = min(index, first_index.get(section_name, index))
 
-    for items in sections.values():
-        items.sort(key=lambda x: (x["position"] is None, x["position"]))
+    sections = defaultdict(list)
+    for section_name in sorted(first_index, key=first_index.get):
+        sections[section_name] = [
+            item for name, _index, item in visible if name == section_name
+        ]
     return sections
 
 
+def _compile_app_sections() -> Dict[str, str]:
+    app_to_section = {}
+    for cls in sub_section_menu:
+        obj = cls()
+        app_label = getattr(obj, "app_label", None)
+        section = getattr(obj, "section", None)
+        if app_label and section:
+            app_to_section[app_label] = section
+    return app_to_section
+
+
+def get_app_section_mapping() -> Dict[str, str]:
+    """
+    Return the mapping of app_label -> section of the registered
+    sub-sections, built once per process. Must not be modified.
+    """
+    return get_compiled(
+        "sub_section_app_sections", sub_section_menu, _compile_app_sections
+    )
+
+
+def get_sub_section_menu(request=None) -> Dict[str, List[Dict]]:
+    """
+    Return all registered main sub-sections grouped by section name,
+    filtered by user permissions. The menu is built once per process and
+    permission set, and must not be modified.
+    """
+    user = getattr(request, "user", None) if request else None
+    permission_key = get_permission_key(user) if user else None
+    return get_filtered(
+        "sub_section_menu",
+        sub_section_menu,
+        permission_key,
+        lambda: _build_sub_section_menu(user),
+    )
+
+
 # def get_sub_section_menu(request=None) -> Dict[str, List[Dict]]:
 #     """
 #     Return all registered main sub-sections grouped by section name.
@@ -372,6 +372,7 @@ AUDITLOG_EXCLUDE_TRACKING_MODELS = (
     "horilla_core.RecentlyViewed",
     "horilla_core.ActiveTab",
     "horilla_core.ListColumnVisibility",
+    "horilla_reports.ReportDataVersion",
 )
 
 
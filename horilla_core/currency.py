@@ -0,0 +1,188 @@
+"""
+Currency contexts and the dated conversion rate index.
+
+Dated conversion rates are kept in a process-wide index: per company, the
+start dates and rates of each currency as sorted lists, so the rate in force
+on a date is found with a binary search. The index of a company is rebuilt
+when its version, the count and latest update of the company's dated rates
+read from the database (once per request), changes, so an edit made in one
+worker process is seen by all of them.
+
+Currency cells are formatted once per row and column, and each one used to
+look up the company default currency, the user currency and the dated
+conversion rate. ``get_currency_context`` loads those once per request (per
+company shown) and keeps them on the request, so formatting a page of
+currency cells needs no further queries.
+"""
+
+from bisect import bisect_right
+from datetime import date
+from decimal import Decimal
+
+from horilla_core.models import DatedConversionRate, MultipleCurrency
+from horilla_utils.methods import get_data_stamp
+from horilla_utils.middlewares import get_current_request
+
+_rate_index = {}
+
+EMPTY_TIMELINE = ((), ())
+
+
+def _get_request_versions():
+    request = get_current_request()
+    if request is None:
+        return {}
+    return request.__dict__.setdefault("_rate_versions", {})
+
+
+def get_rate_version(company_id):
+    """Return the version of the dated conversion rates of a company."""
+    versions = _get_request_versions()
+    if company_id not in versions:
+        versions[company_id] = get_data_stamp(
+            DatedConversionRate.all_objects.filter(company_id=company_id)
+        )
+    return versions[company_id]
+
+
+def invalidate_conversion_rates(company_id):
+    """
+    Drop the indexed dated conversion rates of a company. Other processes
+    see the change in the version read from the database.
+    """
+    _rate_index.pop(company_id, None)
+    _get_request_versions().pop(company_id, None)
+
+
+def get_rate_timeline(company_id, currency_id):
+    """
+    Return ``(start_dates, rates)`` of a currency's dated conversion rates,
+    both sorted by start date.
+    """
+    version = get_rate_version(company_id)
+    entry = _rate_index.get(company_id)
+    if entry is None or entry[0] != version:
+        timelines = {}
+        for rate_currency_id, start_date, rate in (
+            DatedConversionRate.all_objects.filter(company_id=company_id)
+            .order_by("currency_id", "start_date")
+            .values_list("currency_id", "start_date", "conversion_rate")
+        ):
+            dates, rates = timelines.setdefault(rate_currency_id, ([], []))
+            dates.append(start_date)
+            rates.append(rate)
+        entry = (version, timelines)
+        _rate_index[company_id] = entry
+    return entry[1].get(currency_id, EMPTY_TIMELINE)
+
+
+def get_rate_for_date(timeline, conversion_date, default_rate):
+    """Rate of ``timeline`` in force on ``conversion_date``."""
+    dates, rates = timeline
+    index = bisect_right(dates, conversion_date)
+    return rates[index - 1] if index else default_rate
+
+
+def get_next_start_date(company_id, currency_id, start_date):
+    """Start date of the dated rate following ``start_date``, if any."""
+    dates, _ = get_rate_timeline(company_id, currency_id)
+    index = bisect_right(dates, start_date)
+    return dates[index] if index < len(dates) else None
+
+
+def convert_amounts(currency, amounts, dates=None, to_default=False):
+    """
+    Convert a column of amounts, each at the rate in force on its own date,
+    from the default currency to ``currency`` (or back with ``to_default``).
+
+    ``dates`` is a list parallel to ``amounts``, a single date for all of
+    them, or ``None`` for today. ``None`` amounts convert to ``0``.
+    """
+    timeline = get_rate_timeline(currency.company_id, currency.pk)
+    if dates is None or isinstance(dates, date):
+        dates = [dates or date.today()] * len(amounts)
+    converted = []
+    for amount, conversion_date in zip(amounts, dates):
+        if amount is None:
+            converted.append(Decimal("0"))
+            continue
+        rate = get_rate_for_date(
+            timeline, conversion_date or date.today(), currency.conversion_rate
+        )
+        amount = Decimal(str(amount))
+        if to_default:
+            converted.append(amount / rate if rate else Decimal("0"))
+        else:
+            converted.append(amount * rate)
+    return converted
+
+
+class CurrencyContext:
+    """
+    The default currency of a company, the currency a user reads amounts
+    in, and the dated conversion rates of that currency.
+    """
+
+    def __init__(self, company_id, user):
+        self.default_currency = self._get_default_currency(company_id)
+        self.user_currency = self._get_user_currency(user, company_id)
+        self._timeline = EMPTY_TIMELINE
+        if self.user_currency and self.user_currency != self.default_currency:
+            self._timeline = get_rate_timeline(
+                self.user_currency.company_id, self.user_currency.pk
+            )
+
+    def _get_default_currency(self, company_id):
+        if not company_id:
+            return None
+        return MultipleCurrency.objects.filter(
+            company_id=company_id, is_default=True
+        ).first()
+
+    def _get_user_currency(self, user, company_id):
+        """Same rules as ``MultipleCurrency.get_user_currency``."""
+        if not user or not user.is_authenticated:
+            return None
+        if getattr(user, "currency_id", None):
+            return user.currency
+        user_company_id = getattr(user, "company_id", None)
+        if user_company_id == company_id:
+            return self.default_currency
+        return self._get_default_currency(user_company_id)
+
+    def get_conversion_rate(self, conversion_date=None):
+        """Rate from the default currency to the user currency on a date."""
+        return get_rate_for_date(
+            self._timeline,
+            conversion_date or date.today(),
+            self.user_currency.conversion_rate,
+        )
+
+    def format_value(self, value):
+        """
+        Format an amount stored in the default currency, adding the user
+        currency amount when it differs, e.g. "USD 100.00 (EUR 85.00)".
+        """
+        if not self.default_currency:
+            return str(value)
+        default_display = self.default_currency.display_with_symbol(value)
+        if not self.user_currency or self.user_currency.pk == self.default_currency.pk:
+            return default_display
+        converted_amount = Decimal(str(value)) * self.get_conversion_rate()
+        user_display = self.user_currency.display_with_symbol(converted_amount)
+        return f"{default_display} ({user_display})"
+
+
+def get_currency_context(company_id, user):
+    """
+    Return the currency context of ``company_id`` and ``user``, built once
+    per request. Outside a request a new context is built on every call.
+    """
+    request = get_current_request()
+    if request is None:
+        return CurrencyContext(company_id, user)
+    contexts = request.__dict__.setdefault("_currency_contexts", {})
+    key = (company_id, getattr(user, "pk", None))
+    if key not in contexts:
+        contexts[key] = CurrencyContext(company_id, user)
+    return contexts[key]
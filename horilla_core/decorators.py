@@ -1,5 +1,6 @@
 from functools import wraps
 
+from asgiref.sync import iscoroutinefunction, sync_to_async
 from django.conf import settings
 from django.http import HttpResponse, HttpResponseForbidden
 from django.shortcuts import redirect, render
@@ -21,6 +22,32 @@ def permission_required_or_denied(
         perms = [perms]
 
     def decorator(view_func):
+        if iscoroutinefunction(view_func):
+
+            @wraps(view_func)
+            async def _async_wrapped_view(*args, **kwargs):
+                request = args[0] if hasattr(args[0], "user") else args[1]
+                user = await request.auser()
+
+                if not user.is_authenticated:
+                    login_url = (
+                        f"{reverse_lazy('horilla_core:login')}?next={request.path}"
+                    )
+                    return redirect(login_url)
+
+                if require_all:
+                    has_permission = await sync_to_async(user.has_perms)(perms)
+                else:
+                    has_permission = await sync_to_async(user.has_any_perms)(perms)
+
+                if has_permission:
+                    return await view_func(*args, **kwargs)
+                return await sync_to_async(render)(
+                    request, template_name, {"permissions": perms, "modal": modal}
+                )
+
+            return _async_wrapped_view
+
         @wraps(view_func)
         def _wrapped_view(*args, **kwargs):
 
@@ -95,6 +122,22 @@ def htmx_required(view_func, login=True):
 
 def htmx_required(view_func=None, login=True):
     def decorator(func):
+        if iscoroutinefunction(func):
+
+            @wraps(func)
+            async def _async_wrapped_view(request, *args, **kwargs):
+                if login and not (await request.auser()).is_authenticated:
+                    login_url = (
+                        f"{reverse_lazy('horilla_core:login')}?next={request.path}"
+                    )
+                    return redirect(login_url)
+                is_export = request.method == "POST" and "export_format" in request.POST
+                if not is_export and not request.headers.get("HX-Request") == "true":
+                    return await sync_to_async(render)(request, "error/405.html")
+                return await func(request, *args, **kwargs)
+
+            return _async_wrapped_view
+
         @wraps(func)
         def _wrapped_view(request, *args, **kwargs):
             if login and not request.user.is_authenticated:
@@ -0,0 +1,109 @@
+"""
+Compiled field-level permission matrices.
+
+The field permissions a user has on a model (their own, then their role's,
+then the model's ``default_field_permissions``) are compiled into one
+``{field_name: permission_type}`` dict per user, role and model, cached in
+the Django cache and kept on the request, so repeated lookups from views,
+forms and templates are plain dict reads.
+
+The cache key holds a version derived from the count and latest update of
+the FieldPermission rows, read once per request, and the user's current
+role. A permission granted or revoked in any worker process, or a role
+change, therefore applies from the next request of every process.
+"""
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db.models import Q
+
+from horilla_core.models import FieldPermission
+from horilla_utils.methods import get_data_stamp
+from horilla_utils.middlewares import get_current_request
+
+FIELD_PERMISSION_CACHE_TIMEOUT = getattr(
+    settings, "FIELD_PERMISSION_CACHE_TIMEOUT", 60 * 60
+)
+
+
+def _get_request_matrices():
+    request = get_current_request()
+    if request is None:
+        return {}
+    return request.__dict__.setdefault("_field_permission_matrices", {})
+
+
+def get_field_permission_version():
+    """
+    Return the version of the field permissions: the count and latest update
+    of the FieldPermission rows, read from the database once per request.
+    """
+    request = get_current_request()
+    version = getattr(request, "_field_permission_version", None)
+    if version is None:
+        count, latest = get_data_stamp(FieldPermission.objects.all())
+        version = f"{count}.{latest.timestamp() if latest else 0}"
+        if request is not None:
+            request._field_permission_version = version
+    return version
+
+
+def clear_field_permission_matrices():
+    """
+    Drop the matrices and the version read in the current request. Other
+    requests see the change in the version.
+    """
+    _get_request_matrices().clear()
+    request = get_current_request()
+    if request is not None:
+        request.__dict__.pop("_field_permission_version", None)
+
+
+def _compile_matrix(user_id, role_id, content_type, model):
+    owners = Q(user_id=user_id)
+    if role_id:
+        owners |= Q(role_id=role_id)
+    role_matrix = {}
+    user_matrix = {}
+    permissions = FieldPermission.objects.filter(
+        owners, content_type=content_type
+    ).values_list("user_id", "field_name", "permission_type")
+    for permission_user_id, field_name, permission_type in permissions:
+        if permission_user_id == user_id:
+            user_matrix[field_name] = permission_type
+        else:
+            role_matrix[field_name] = permission_type
+    # User permissions take precedence over role permissions.
+    matrix = {**role_matrix, **user_matrix}
+    for field_name, default_value in getattr(
+        model, "default_field_permissions", {}
+    ).items():
+        matrix.setdefault(field_name, default_value)
+    return matrix
+
+
+def get_field_permission_matrix(user, model):
+    """
+    Return the ``{field_name: permission_type}`` matrix of ``user`` on
+    ``model``. Fields missing from it are ``"readwrite"``. The returned dict
+    is shared and must not be modified.
+    """
+    content_type = ContentType.objects.get_for_model(model)
+    role_id = getattr(user, "role_id", None)
+    request_key = (user.pk, role_id, content_type.pk)
+
+    matrices = _get_request_matrices()
+    if request_key in matrices:
+        return matrices[request_key]
+
+    cache_key = (
+        f"field_permissions_{get_field_permission_version()}_"
+        f"{user.pk}_{role_id}_{content_type.pk}"
+    )
+    matrix = cache.get(cache_key)
+    if matrix is None:
+        matrix = _compile_matrix(user.pk, role_id, content_type, model)
+        cache.set(cache_key, matrix, FIELD_PERMISSION_CACHE_TIMEOUT)
+    matrices[request_key] = matrix
+    return matrix
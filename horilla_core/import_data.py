@@ -34,6 +34,8 @@ from horilla.exceptions import HorillaHttp404
 from horilla.registry.feature import FEATURE_REGISTRY
 from horilla_core.decorators import htmx_required, permission_required_or_denied
 from horilla_core.models import ImportHistory
+from horilla_core.signals import records_bulk_changed
+from horilla_generics.search_index import index_records
 from horilla_generics.views import HorillaListView, HorillaTabView
 
 logger = logging.getLogger(__name__)
@@ -2131,6 +2133,12 @@ class ImportStep4View(View):
                         )
                         updated_count += len(batch)
 
+            written_pks = [obj.pk for obj in created] + [
+                obj.pk for objs in updated_groups.values() for obj in objs
+            ]
+            index_records(model, written_pks)
+            records_bulk_changed.send(sender=model, pks=written_pks)
+
         # Generate error CSV if there are errors
         error_file_path = None
         if detailed_errors:
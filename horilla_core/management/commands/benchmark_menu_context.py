@@ -0,0 +1,176 @@
+"""
+Horilla management command to measure the per-request time of the menu
+context: the five menus of ``menu_context_processor`` and the module
+versions of ``collect_all_versions``.
+
+Run it against each build to compare, appending to one file::
+
+    python manage.py benchmark_menu_context --user admin --user sales \\
+        --label before --output menu_context.jsonl
+    python manage.py benchmark_menu_context --user admin --user sales \\
+        --label after --output menu_context.jsonl
+
+``--cold`` drops the process-wide menu caches before every request, which
+measures the menus built from scratch on every request in the same build.
+Each run prints the median and p95 per user, and a comparison with the other
+labels measured for the same users.
+"""
+
+import json
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.backends.cache import SessionStore
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+
+from horilla.context_processors import (
+    collect_all_versions,
+    get_all_versions,
+    menu_context_processor,
+)
+from horilla.menu import menu_cache
+from horilla_core.middlewares import ActiveCompanyMiddleware
+from horilla_utils.middlewares import _thread_local
+
+
+class Command(BaseCommand):
+    """
+    Horilla management command to measure the per-request time of the menu
+    context.
+    """
+
+    help = "Measures the per-request build time of the menu context"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            action="append",
+            default=[],
+            metavar="USERNAME",
+            help="User to build the menus for (repeatable), e.g. a superuser "
+            "and a permission-restricted user",
+        )
+        parser.add_argument(
+            "--requests", type=int, default=200, help="Requests per user"
+        )
+        parser.add_argument(
+            "--path", default="/", help="Path of the simulated requests"
+        )
+        parser.add_argument(
+            "--cold",
+            action="store_true",
+            help="Drop the process-wide menu caches before every request",
+        )
+        parser.add_argument(
+            "--label", default="run", help="Name of this run, e.g. before or after"
+        )
+        parser.add_argument(
+            "--output", help="JSON lines file the results are appended to"
+        )
+
+    def get_users(self, usernames):
+        """The users to measure, the first superuser by default."""
+        User = get_user_model()
+        if not usernames:
+            user = User.objects.filter(is_superuser=True, is_active=True).first()
+            if user is None:
+                raise CommandError("No active superuser, pass --user")
+            return [user]
+        users = []
+        for username in usernames:
+            try:
+                users.append(User.objects.get(username=username))
+            except User.DoesNotExist:
+                raise CommandError(f"Unknown user {username!r}")
+        return users
+
+    def build_request(self, user, path):
+        """A request as the middlewares leave it for ``user``."""
+        request = RequestFactory().get(path)
+        # Fresh instance: permissions are read again, as on a real request
+        request.user = type(user).objects.get(pk=user.pk)
+        request.session = SessionStore()
+        ActiveCompanyMiddleware(lambda request: None)(request)
+        return request
+
+    def measure(self, user, options):
+        """Median and p95 in milliseconds of the menu context of ``user``."""
+        timings = []
+        for _ in range(options["requests"]):
+            request = self.build_request(user, options["path"])
+            if options["cold"]:
+                menu_cache._compiled.clear()
+                menu_cache._filtered.clear()
+                get_all_versions.cache_clear()
+            _thread_local.request = request
+            try:
+                started = time.perf_counter()
+                menu_context_processor(request)
+                collect_all_versions(request)
+                timings.append(time.perf_counter() - started)
+            finally:
+                del _thread_local.request
+        timings.sort()
+        return {
+            "requests": len(timings),
+            "median_ms": round(statistics.median(timings) * 1000, 2),
+            "p95_ms": round(timings[int(len(timings) * 0.95) - 1] * 1000, 2),
+        }
+
+    def handle(self, *args, **options):
+        if options["requests"] < 1:
+            raise CommandError("--requests must be positive")
+
+        rows = []
+        for user in self.get_users(options["user"]):
+            # Warm up imports and the per-process caches of a running server
+            request = self.build_request(user, options["path"])
+            _thread_local.request = request
+            try:
+                menu_context_processor(request)
+            finally:
+                del _thread_local.request
+            result = self.measure(user, options)
+            rows.append(
+                {
+                    "label": options["label"],
+                    "user": user.get_username(),
+                    "superuser": user.is_superuser,
+                    "cold": options["cold"],
+                    **result,
+                }
+            )
+            self.stdout.write(
+                f"{user.get_username():<24} median {result['median_ms']:>8.2f} ms  "
+                f"p95 {result['p95_ms']:>8.2f} ms"
+            )
+
+        if not options["output"]:
+            return
+        with open(options["output"], "a", encoding="utf-8") as output:
+            for row in rows:
+                output.write(json.dumps(row) + "\n")
+        self.compare(options)
+
+    def compare(self, options):
+        """Print the median of every label measured for the same users."""
+        medians = {}
+        with open(options["output"], encoding="utf-8") as output:
+            for line in output:
+                row = json.loads(line)
+                label = f"{row['label']}{' (cold)' if row['cold'] else ''}"
+                # The latest run of each label wins
+                medians.setdefault(row["user"], {})[label] = row["median_ms"]
+
+        labels = sorted({label for runs in medians.values() for label in runs})
+        if len(labels) < 2:
+            return
+        self.stdout.write("\nmedian ms per request")
+        self.stdout.write(f"{'user':<24}" + "".join(f"{l:>16}" for l in labels))
+        for username, runs in medians.items():
+            self.stdout.write(
+                f"{username:<24}"
+                + "".join(f"{runs.get(label, '-'):>16}" for label in labels)
+            )
@@ -0,0 +1,222 @@
+"""
+Horilla management command to load test the high-traffic read endpoints.
+
+Start the server with a fixed number of workers, for example
+``UVICORN_WORKERS=4 uvicorn horilla.asgi:application --workers 4``, then run
+the same command against each build to compare, appending to one file::
+
+    python manage.py loadtest_endpoints --sessionid <id> --label sync \\
+        --workers 4 --output loadtest.jsonl
+    python manage.py loadtest_endpoints --sessionid <id> --label async \\
+        --workers 4 --output loadtest.jsonl
+
+Each run prints its throughput and latencies per endpoint, and a comparison
+with the other labels measured with the same worker count and concurrency.
+"""
+
+import json
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+
+
+class Command(BaseCommand):
+    """
+    Horilla management command to load test the high-traffic read endpoints.
+    """
+
+    help = "Measures the throughput of the high-traffic endpoints of a running server"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--base-url",
+            default="http://127.0.0.1:8000",
+            help="URL of the running server",
+        )
+        parser.add_argument(
+            "--sessionid", required=True, help="Session cookie of a logged in user"
+        )
+        parser.add_argument(
+            "--label", default="run", help="Name of this run, e.g. sync or async"
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            required=True,
+            help="Number of server workers, recorded with the results",
+        )
+        parser.add_argument(
+            "--concurrency", type=int, default=20, help="Concurrent clients"
+        )
+        parser.add_argument(
+            "--requests", type=int, default=200, help="Requests per endpoint"
+        )
+        parser.add_argument(
+            "--query", default="acme", help="Query of the global search typeahead"
+        )
+        parser.add_argument(
+            "--chart-component", type=int, help="Dashboard chart or KPI component id"
+        )
+        parser.add_argument(
+            "--table-component", type=int, help="Dashboard table component id"
+        )
+        parser.add_argument(
+            "--endpoint",
+            action="append",
+            default=[],
+            metavar="NAME=PATH",
+            help="Additional endpoint to measure",
+        )
+        parser.add_argument(
+            "--output", help="JSON lines file the results are appended to"
+        )
+
+    def get_endpoints(self, options):
+        """``(name, path, headers)`` of the endpoints to measure."""
+        endpoints = [
+            (
+                "calendar_events",
+                reverse("timeline:get_calendar_events"),
+                {"X-Requested-With": "XMLHttpRequest"},
+            ),
+            (
+                "notification_list",
+                reverse("horilla_notifications:notification_list"),
+                {},
+            ),
+            (
+                "global_search_typeahead",
+                f"{reverse('horilla_generics:global_search_typeahead')}"
+                f"?q={options['query']}",
+                {},
+            ),
+        ]
+        if options["chart_component"]:
+            endpoints.append(
+                (
+                    "dashboard_component_chart",
+                    reverse(
+                        "horilla_dashboard:component_chart",
+                        kwargs={"component_id": options["chart_component"]},
+                    ),
+                    {"HX-Request": "true"},
+                )
+            )
+        if options["table_component"]:
+            endpoints.append(
+                (
+                    "dashboard_component_table",
+                    reverse(
+                        "horilla_dashboard:component_table_data",
+                        kwargs={"component_id": options["table_component"]},
+                    )
+                    + "?page=1",
+                    {"HX-Request": "true"},
+                )
+            )
+        for endpoint in options["endpoint"]:
+            name, sep, path = endpoint.partition("=")
+            if not sep or not path.startswith("/"):
+                raise CommandError(f"Invalid endpoint {endpoint!r}, use NAME=/path/")
+            endpoints.append((name, path, {}))
+        return endpoints
+
+    def fetch(self, url, headers):
+        """Latency in seconds of one request, and whether it succeeded."""
+        started = time.perf_counter()
+        try:
+            with urlopen(Request(url, headers=headers), timeout=60) as response:
+                response.read()
+                ok = response.status == 200
+        except (HTTPError, URLError, TimeoutError):
+            ok = False
+        return time.perf_counter() - started, ok
+
+    def measure(self, url, headers, requests, concurrency):
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            # Warm up the workers and their caches
+            list(executor.map(lambda _: self.fetch(url, headers), range(concurrency)))
+            started = time.perf_counter()
+            results = list(
+                executor.map(lambda _: self.fetch(url, headers), range(requests))
+            )
+            elapsed = time.perf_counter() - started
+
+        latencies = sorted(latency for latency, _ok in results)
+        return {
+            "requests": requests,
+            "errors": sum(1 for _latency, ok in results if not ok),
+            "throughput": round(requests / elapsed, 2),
+            "p50_ms": round(statistics.median(latencies) * 1000, 2),
+            "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 2),
+        }
+
+    def handle(self, *args, **options):
+        if options["concurrency"] < 1 or options["requests"] < 1:
+            raise CommandError("--concurrency and --requests must be positive")
+
+        base_url = options["base_url"].rstrip("/")
+        rows = []
+        for name, path, headers in self.get_endpoints(options):
+            headers = {**headers, "Cookie": f"sessionid={options['sessionid']}"}
+            result = self.measure(
+                f"{base_url}{path}",
+                headers,
+                options["requests"],
+                options["concurrency"],
+            )
+            rows.append(
+                {
+                    "label": options["label"],
+                    "endpoint": name,
+                    "workers": options["workers"],
+                    "concurrency": options["concurrency"],
+                    **result,
+                }
+            )
+            self.stdout.write(
+                f"{name:<28} {result['throughput']:>9.2f} req/s  "
+                f"p50 {result['p50_ms']:>8.2f} ms  p95 {result['p95_ms']:>8.2f} ms  "
+                f"errors {result['errors']}"
+            )
+
+        if not options["output"]:
+            return
+        with open(options["output"], "a", encoding="utf-8") as output:
+            for row in rows:
+                output.write(json.dumps(row) + "\n")
+        self.compare(options)
+
+    def compare(self, options):
+        """Print the throughput of every label measured like this run."""
+        throughput = {}
+        with open(options["output"], encoding="utf-8") as output:
+            for line in output:
+                row = json.loads(line)
+                if (
+                    row["workers"] == options["workers"]
+                    and row["concurrency"] == options["concurrency"]
+                ):
+                    # The latest run of each label wins
+                    throughput.setdefault(row["endpoint"], {})[row["label"]] = row[
+                        "throughput"
+                    ]
+
+        labels = sorted({label for runs in throughput.values() for label in runs})
+        if len(labels) < 2:
+            return
+        self.stdout.write(
+            f"\nreq/s with {options['workers']} workers and "
+            f"{options['concurrency']} clients"
+        )
+        self.stdout.write(f"{'endpoint':<28}" + "".join(f"{l:>12}" for l in labels))
+        for endpoint, runs in throughput.items():
+            self.stdout.write(
+                f"{endpoint:<28}"
+                + "".join(f"{runs.get(label, '-'):>12}" for label in labels)
+            )
@@ -13,7 +13,7 @@ from django.utils import timezone
 
 from horilla.exceptions import HorillaHttp404
 
-from .models import Company
+from .shell_context import get_company
 
 
 class ActiveCompanyMiddleware:
@@ -27,14 +27,12 @@ class ActiveCompanyMiddleware:
         """Set the active company for the authenticated user."""
         request.active_company = None
         if request.user.is_authenticated:
+            # Companies are cached (see shell_context), so this usually
+            # only reads the company version.
             company_id = request.session.get("active_company_id")
-            if company_id:
-                try:
-                    request.active_company = Company.objects.get(id=company_id)
-                except Company.DoesNotExist:  # Fixed pylint complaint
-                    request.active_company = getattr(request.user, "company", None)
-            else:
-                request.active_company = getattr(request.user, "company", None)
+            request.active_company = get_company(company_id, request) or get_company(
+                getattr(request.user, "company_id", None), request
+            )
         return self.get_response(request)
 
 
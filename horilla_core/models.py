@@ -36,7 +36,7 @@ from djmoney.settings import CURRENCY_CHOICES
 from multiselectfield import MultiSelectField
 from pytz import common_timezones
 
-from horilla.menu.sub_section_menu import sub_section_menu
+from horilla.menu.sub_section_menu import get_app_section_mapping
 from horilla.registry.feature import feature_enabled
 from horilla.registry.permission_registry import permission_exempt_model
 from horilla.utils.choices import (
@@ -658,10 +658,13 @@ class MultipleCurrency(HorillaCoreModel):
                     company=self.company, is_default=True
                 ).exclude(pk=self.pk).update(is_default=False)
                 if self.company and self.company.currency != self.currency:
+                    from horilla_core.shell_context import invalidate_companies
+
                     Company.objects.filter(pk=self.company.pk).update(
-                        currency=self.currency
+                        currency=self.currency, updated_at=timezone.now()
                     )
                     self.company.currency = self.currency
+                    invalidate_companies()
 
             super().save(*args, **kwargs)
 
@@ -680,25 +683,19 @@ class MultipleCurrency(HorillaCoreModel):
         Returns:
             Decimal: The conversion rate
         """
+        from horilla_core.currency import get_rate_for_date, get_rate_timeline
+
         if conversion_date is None:
             conversion_date = date.today()
 
-        # Try to get dated conversion rate
-        dated_rate = (
-            DatedConversionRate.objects.filter(
-                company=self.company, currency=self, start_date__lte=conversion_date
-            )
-            .order_by("-start_date")
-            .first()
+        # Dated rates come from the in-memory index, falling back to the
+        # static conversion rate before the first dated rate.
+        return get_rate_for_date(
+            get_rate_timeline(self.company_id, self.pk),
+            conversion_date,
+            self.conversion_rate,
         )
 
-        if dated_rate:
-            # Check if this rate is still valid (no newer rate exists before conversion_date)
-            return dated_rate.conversion_rate
-
-        # Fall back to static conversion rate
-        return self.conversion_rate
-
     def format_amount(self, amount):
         """Format amount according to currency's decimal places and format"""
         if amount is None:
@@ -1208,27 +1205,95 @@ class ListColumnVisibility(models.Model):
         return f"{self.user.username} - {self.app_label}.{self.model_name}"
 
 
+# get_detail_* method names of each model, see RecentlyViewed.get_detail_url_methods
+_detail_url_methods = {}
+
+
 class RecentlyViewedManager(models.Manager):
+    KEEP_ITEMS = 20
+    MAX_ITEMS = 25
+
     def add_viewed_item(self, user, obj):
         """Add or update a recently viewed item for a user."""
         content_type = ContentType.objects.get_for_model(obj)
-        self.filter(user=user, content_type=content_type, object_id=obj.pk).delete()
+        if self.filter(
+            user=user, content_type=content_type, object_id=obj.pk
+        ).update(viewed_at=timezone.now()):
+            return
         self.create(user=user, content_type=content_type, object_id=obj.pk)
-        if self.filter(user=user).count() > 25:
-            recent_ids = (
+        # Only a new item can push the list over the limit
+        if self.filter(user=user).count() > self.MAX_ITEMS:
+            recent_ids = list(
                 self.filter(user=user)
                 .order_by("-viewed_at")
-                .values_list("id", flat=True)[:20]
+                .values_list("id", flat=True)[: self.KEEP_ITEMS]
             )
             self.filter(user=user).exclude(id__in=recent_ids).delete()
 
-    def get_recently_viewed(self, user, model_class=None, limit=20):
-        """Get recently viewed items for a user, optionally filtered by model class."""
+    def resolve_content_objects(self, items):
+        """
+        Load the content objects of ``items`` with one query per content type
+        and cache them on the items. Returns the items whose content type no
+        longer has a model.
+        """
+        content_object = self.model._meta.get_field("content_object")
+        by_content_type = {}
+        for item in items:
+            by_content_type.setdefault(item.content_type_id, []).append(item)
+
+        orphans = []
+        for content_type_id, group in by_content_type.items():
+            content_type = ContentType.objects.get_for_id(content_type_id)
+            model = content_type.model_class()
+            if model is None:
+                orphans.extend(group)
+                continue
+            for item in group:
+                item.content_type = content_type
+            objects = model._base_manager.in_bulk(
+                {item.object_id for item in group}
+            )
+            for item in group:
+                content_object.set_cached_value(item, objects.get(item.object_id))
+        return orphans
+
+    def get_recently_viewed_items(self, user, model_class=None, limit=20):
+        """
+        Get the newest ``limit`` recently viewed items of a user with their
+        content objects loaded, one query per content type. Items whose
+        object no longer exists are deleted.
+        """
         queryset = self.filter(user=user).order_by("-viewed_at")
         if model_class:
             content_type = ContentType.objects.get_for_model(model_class)
             queryset = queryset.filter(content_type=content_type)
-        return [item.content_object for item in queryset if item.content_object][:limit]
+        items = list(queryset[:limit])
+        orphans = self.resolve_content_objects(items)
+        stale = orphans + [
+            item for item in items if item not in orphans and not item.content_object
+        ]
+        if stale:
+            self.filter(pk__in=[item.pk for item in stale]).delete()
+        return [item for item in items if item not in stale]
+
+    def get_recently_viewed(self, user, model_class=None, limit=20):
+        """Get recently viewed items for a user, optionally filtered by model class."""
+        return [
+            item.content_object
+            for item in self.get_recently_viewed_items(user, model_class, limit)
+        ]
+
+    def get_recently_viewed_ids(self, user, model_class, limit=20):
+        """
+        Primary keys of the objects of ``model_class`` a user viewed most
+        recently, newest first, without loading the objects.
+        """
+        content_type = ContentType.objects.get_for_model(model_class)
+        return list(
+            self.filter(user=user, content_type=content_type)
+            .order_by("-viewed_at")
+            .values_list("object_id", flat=True)[:limit]
+        )
 
 
 @permission_exempt_model
@@ -1257,17 +1322,25 @@ class RecentlyViewed(models.Model):
 
     def get_app_section_mapping(self):
         """
-        Build a mapping of app_label -> section from registered sub_section_menu items.
+        Return the mapping of app_label -> section from registered sub_section_menu items.
         """
+        return get_app_section_mapping()
 
-        app_to_section = {}
-        for cls in sub_section_menu:
-            obj = cls()
-            app_label = getattr(obj, "app_label", None)
-            section = getattr(obj, "section", None)
-            if app_label and section:
-                app_to_section[app_label] = section
-        return app_to_section
+    @staticmethod
+    def get_detail_url_methods(model):
+        """
+        Names of the callable ``get_detail_*`` attributes of ``model``, in
+        ``dir`` order, looked up once per model.
+        """
+        methods = _detail_url_methods.get(model)
+        if methods is None:
+            methods = [
+                attr
+                for attr in dir(model)
+                if attr.startswith("get_detail_") and callable(getattr(model, attr))
+            ]
+            _detail_url_methods[model] = methods
+        return methods
 
     def get_detail_url(self):
         """
@@ -1279,15 +1352,12 @@ class RecentlyViewed(models.Model):
             return "#"
 
         base_url = None
-        for attr in dir(self.content_object):
-            if attr.startswith("get_detail_"):
-                method = getattr(self.content_object, attr)
-                if callable(method):
-                    try:
-                        base_url = method()
-                        break
-                    except Exception:
-                        continue
+        for attr in self.get_detail_url_methods(type(self.content_object)):
+            try:
+                base_url = getattr(self.content_object, attr)()
+                break
+            except Exception:
+                continue
 
         if not base_url or base_url == "#":
             return "#"
@@ -2249,16 +2319,9 @@ class DatedConversionRate(HorillaCoreModel):
         Returns the end date for this rate, which is the start date of the next rate for the same currency and company,
         or None if this is the latest rate.
         """
-        next_rate = (
-            DatedConversionRate.objects.filter(
-                company=self.company,
-                currency=self.currency,
-                start_date__gt=self.start_date,
-            )
-            .order_by("start_date")
-            .first()
-        )
-        return next_rate.start_date if next_rate else None
+        from horilla_core.currency import get_next_start_date
+
+        return get_next_start_date(self.company_id, self.currency_id, self.start_date)
 
     def save(self, *args, **kwargs):
         """
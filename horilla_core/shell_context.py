@@ -0,0 +1,150 @@
+"""
+Per-request data of the application shell (header and sidebar).
+
+Every full page renders the company switcher, the notification dropdown and
+the recently viewed list, and ``ActiveCompanyMiddleware`` resolves the
+active company. ``get_shell_context`` loads these once per request with a
+bounded number of queries:
+
+- companies are cached under a version derived from the count and latest
+  update of the Company rows, read once per request, so the active company
+  and the switcher list are usually read from the cache and a change made
+  in any worker process is seen by all of them;
+- unread notifications are the newest ``NOTIFICATION_DROPDOWN_LIMIT`` rows
+  with their total count, in one query, and the "All Notifications"
+  sidebar lists the newest ``NOTIFICATION_SIDEBAR_LIMIT`` notifications;
+- recently viewed records are loaded with one query per content type.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Window
+from django.utils.functional import cached_property
+
+from horilla_core.models import Company, RecentlyViewed
+from horilla_notifications.models import Notification
+from horilla_utils.methods import get_data_stamp
+from horilla_utils.middlewares import get_current_request
+
+COMPANY_CACHE_TIMEOUT = getattr(settings, "COMPANY_CACHE_TIMEOUT", 60 * 60)
+NOTIFICATION_DROPDOWN_LIMIT = getattr(settings, "NOTIFICATION_DROPDOWN_LIMIT", 30)
+NOTIFICATION_SIDEBAR_LIMIT = getattr(settings, "NOTIFICATION_SIDEBAR_LIMIT", 50)
+RECENTLY_VIEWED_LIMIT = 6
+
+
+def get_company_version(request=None):
+    """
+    Return the version of the cached companies: the count and latest update
+    of the Company rows, read once per request (``request`` defaults to the
+    current one).
+    """
+    request = request or get_current_request()
+    version = getattr(request, "_company_version", None)
+    if version is None:
+        count, latest = get_data_stamp(Company.objects.all())
+        version = f"{count}.{latest.timestamp() if latest else 0}"
+        if request is not None:
+            request._company_version = version
+    return version
+
+
+def invalidate_companies():
+    """Read the company version again for the rest of the current request."""
+    request = get_current_request()
+    if request is not None:
+        request.__dict__.pop("_company_version", None)
+
+
+def get_company(company_id, request=None):
+    """Return the company with ``company_id`` or ``None``, cached."""
+    if not company_id:
+        return None
+    key = f"company_{company_id}_{get_company_version(request)}"
+    company = cache.get(key)
+    if company is None:
+        # False marks a missing company, so it is not looked up again
+        company = Company.objects.filter(pk=company_id).first() or False
+        cache.set(key, company, COMPANY_CACHE_TIMEOUT)
+    return company or None
+
+
+def get_companies(request=None):
+    """Return all companies, cached."""
+    key = f"company_list_{get_company_version(request)}"
+    companies = cache.get(key)
+    if companies is None:
+        companies = list(Company.objects.all())
+        cache.set(key, companies, COMPANY_CACHE_TIMEOUT)
+    return companies
+
+
+class UnreadNotifications:
+    """
+    The newest unread notifications of a user and their total count, loaded
+    together with one query the first time either is read.
+    """
+
+    def __init__(self, user, limit=NOTIFICATION_DROPDOWN_LIMIT):
+        self.user = user
+        self.limit = limit
+
+    @cached_property
+    def _notifications(self):
+        return list(
+            Notification.objects.filter(user=self.user, read=False)
+            .select_related("sender")
+            .annotate(unread_total=Window(expression=Count("id")))
+            .order_by("-created_at")[: self.limit]
+        )
+
+    @cached_property
+    def count(self):
+        """Total number of unread notifications."""
+        notifications = self._notifications
+        return notifications[0].unread_total if notifications else 0
+
+    def __iter__(self):
+        return iter(self._notifications)
+
+    def __len__(self):
+        return len(self._notifications)
+
+    def __bool__(self):
+        return bool(self._notifications)
+
+
+class ShellContext:
+    """Shell data of one request, each part loaded on first use."""
+
+    def __init__(self, request):
+        self.request = request
+        self.user = request.user
+
+    @cached_property
+    def companies(self):
+        return get_companies(self.request)
+
+    @cached_property
+    def unread_notifications(self):
+        return UnreadNotifications(self.user)
+
+    @cached_property
+    def notifications(self):
+        return list(
+            Notification.objects.filter(user=self.user)
+            .select_related("sender")
+            .order_by("-created_at")[:NOTIFICATION_SIDEBAR_LIMIT]
+        )
+
+    @cached_property
+    def recently_viewed_items(self):
+        return RecentlyViewed.objects.get_recently_viewed_items(
+            self.user, limit=RECENTLY_VIEWED_LIMIT
+        )
+
+
+def get_shell_context(request):
+    """Return the shell context of ``request``, built once per request."""
+    if "_shell_context" not in request.__dict__:
+        request._shell_context = ShellContext(request)
+    return request._shell_context
@@ -18,11 +18,14 @@ from django.apps import apps
 from django.contrib.auth.models import Permission
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
-from django.db.models.signals import post_migrate, post_save
+from django.db.models.signals import post_delete, post_migrate, post_save
 from django.dispatch import Signal, receiver
 
+from horilla_core.currency import invalidate_conversion_rates
+from horilla_core.field_permissions import clear_field_permission_matrices
 from horilla_core.models import (
     Company,
+    DatedConversionRate,
     FieldPermission,
     FiscalYear,
     HorillaUser,
@@ -30,6 +33,7 @@ from horilla_core.models import (
     Role,
 )
 from horilla_core.services.fiscal_year_service import FiscalYearService
+from horilla_core.shell_context import invalidate_companies
 from horilla_utils.middlewares import _thread_local
 
 logger = logging.getLogger(__name__)
@@ -37,6 +41,9 @@ logger = logging.getLogger(__name__)
 
 company_currency_changed = Signal()
 company_created = Signal()
+# Sent with ``pks`` after records are written by bulk_create, bulk_update or
+# QuerySet.update, which send no post_save.
+records_bulk_changed = Signal()
 
 
 @receiver(post_save, sender="horilla_core.Company")
@@ -296,3 +303,29 @@ def role_default_field_permissions(sender, instance, created, **kwargs):
             )
 
     transaction.on_commit(assign_permissions)
+
+
+@receiver(post_save, sender=DatedConversionRate)
+@receiver(post_delete, sender=DatedConversionRate)
+def invalidate_dated_conversion_rates(sender, instance, **kwargs):
+    """
+    Rebuild the in-memory conversion rate index of the rate's company.
+    """
+    invalidate_conversion_rates(instance.company_id)
+
+
+@receiver(post_save, sender=FieldPermission)
+@receiver(post_delete, sender=FieldPermission)
+def invalidate_field_permission_matrices(sender, instance, **kwargs):
+    """
+    Recompile the field permission matrices of the current request, so the
+    change applies to the rest of it.
+    """
+    clear_field_permission_matrices()
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+def invalidate_cached_companies(sender, instance, **kwargs):
+    """Drop the cached companies (active company, company switcher)."""
+    invalidate_companies()
@@ -1,3 +1,142 @@
-from django.test import TestCase
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.sessions.backends.cache import SessionStore
+from django.core.cache import cache
+from django.template.loader import render_to_string
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+
+from horilla_core.field_permissions import get_field_permission_matrix
+from horilla_core.middlewares import ActiveCompanyMiddleware
+from horilla_core.models import Company, FieldPermission, HorillaUser, RecentlyViewed
+from horilla_core.shell_context import get_companies, get_company
+from horilla_notifications.models import Notification
+from horilla_utils.middlewares import (
+    _thread_local,
+    reset_current_request,
+    set_current_request,
+)
 
 # Create your core tests here.
+
+
+class BaseLayoutQueryBudgetTest(TestCase):
+    """
+    The application shell (header, sidebar, menus and middleware) must not
+    issue more queries as notifications, recently viewed records and
+    companies grow.
+    """
+
+    # Includes the company version read by ActiveCompanyMiddleware
+    QUERY_BUDGET = 11
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = Company.objects.create(
+            name="Main", no_of_employees=1, email="main@example.com"
+        )
+        for index in range(5):
+            Company.objects.create(
+                name=f"Branch {index}",
+                no_of_employees=1,
+                email=f"branch{index}@example.com",
+            )
+        cls.user = HorillaUser.objects.create_user(
+            "shell", "shell@example.com", "password", company=cls.company
+        )
+        cls.user.user_permissions.add(
+            Permission.objects.get(codename="can_switch_company")
+        )
+        sender = HorillaUser.objects.create_user(
+            "sender", "sender@example.com", "password"
+        )
+        Notification.objects.bulk_create(
+            Notification(user=cls.user, sender=sender, message=f"Message {index}")
+            for index in range(40)
+        )
+        for company in Company.objects.all():
+            RecentlyViewed.objects.add_viewed_item(cls.user, company)
+        RecentlyViewed.objects.add_viewed_item(cls.user, sender)
+
+    def render_base_layout(self):
+        request = RequestFactory().get("/")
+        request.user = HorillaUser.objects.get(pk=self.user.pk)
+        request.session = SessionStore()
+        request.session["active_company_id"] = self.company.pk
+        ActiveCompanyMiddleware(lambda request: None)(request)
+        _thread_local.request = request
+        try:
+            return render_to_string("index.html", request=request)
+        finally:
+            del _thread_local.request
+
+    def test_base_layout_query_budget(self):
+        cache.clear()
+        self.render_base_layout()
+        with self.assertNumQueries(self.QUERY_BUDGET):
+            html = self.render_base_layout()
+        self.assertIn("30+", html)
+        self.assertIn("Branch 4", html)
+
+
+class CompanyCacheVersionTest(TestCase):
+    """
+    A company changed by another worker process is seen by the next request
+    of every process, without relying on their local cache invalidation.
+    """
+
+    def test_company_change_invalidates_cached_company(self):
+        company = Company.objects.create(
+            name="Main", no_of_employees=1, email="main@example.com"
+        )
+        request = RequestFactory().get("/")
+        self.assertEqual(get_company(company.pk, request).currency, company.currency)
+        with self.assertNumQueries(0):
+            get_company(company.pk, request)
+
+        # Written by another process: no signal reaches this one
+        Company.objects.filter(pk=company.pk).update(
+            currency="EUR", updated_at=timezone.now()
+        )
+        request = RequestFactory().get("/")
+        self.assertEqual(get_company(company.pk, request).currency, "EUR")
+        self.assertEqual([item.currency for item in get_companies(request)], ["EUR"])
+
+
+class FieldPermissionMatrixCacheTest(TestCase):
+    """
+    Field permission matrices are reused across requests until a field
+    permission changes in any process.
+    """
+
+    def start_request(self):
+        token = set_current_request(RequestFactory().get("/"))
+        self.addCleanup(reset_current_request, token)
+
+    def test_matrix_cached_until_permissions_change(self):
+        user = HorillaUser.objects.create_user(
+            "fields", "fields@example.com", "password"
+        )
+        permission = FieldPermission.objects.create(
+            user=user,
+            content_type=ContentType.objects.get_for_model(Company),
+            field_name="email",
+            permission_type="hidden",
+        )
+        cache.clear()
+        self.start_request()
+        self.assertEqual(get_field_permission_matrix(user, Company)["email"], "hidden")
+
+        self.start_request()
+        # Only the permission version is read
+        with self.assertNumQueries(1):
+            matrix = get_field_permission_matrix(user, Company)
+        self.assertEqual(matrix["email"], "hidden")
+
+        # Changed by another process: no signal reaches this one
+        FieldPermission.objects.filter(pk=permission.pk).update(
+            permission_type="readonly", updated_at=timezone.now()
+        )
+        self.start_request()
+        matrix = get_field_permission_matrix(user, Company)
+        self.assertEqual(matrix["email"], "readonly")
@@ -12,6 +12,7 @@ from django.utils.translation import gettext_lazy as _
 from horilla_core.decorators import htmx_required
 from horilla_core.filters import HolidayFilter
 from horilla_core.models import Holiday
+from horilla_generics.navigation import get_navigation_signature
 from horilla_generics.views import (
     HorillaListView,
     HorillaModalDetailView,
@@ -89,11 +90,6 @@ class UserHolidayListView(LoginRequiredMixin, HorillaListView):
         else:
             queryset = queryset.none()
 
-        if self.store_ordered_ids:
-            self.request.session[f"ordered_ids_{self.model.__name__.lower()}"] = list(
-                queryset.values_list("pk", flat=True)
-            )
-
         return queryset
 
     @cached_property
@@ -101,7 +97,7 @@ class UserHolidayListView(LoginRequiredMixin, HorillaListView):
         query_params = {}
         if "section" in self.request.GET:
             query_params["section"] = self.request.GET.get("section")
-        query_string = self.request.session.get(self.ordered_ids_key, [])
+        query_string = get_navigation_signature(self.request, self.model)
         htmx_attrs = {
             "hx-get": f"{{get_user_detail_url}}?instance_ids={query_string}",
             "hx-target": "#detailModalBox",
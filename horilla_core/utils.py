@@ -3,11 +3,12 @@ import logging
 
 from dateutil.parser import parse
 from django.apps import apps
-from django.contrib.contenttypes.models import ContentType
 from django.db import models, transaction
 from django.db.models import QuerySet
 
-from horilla_core.models import FieldPermission, MultipleCurrency, RecycleBin
+from horilla_core.currency import get_currency_context
+from horilla_core.field_permissions import get_field_permission_matrix
+from horilla_core.models import RecycleBin
 from horilla_utils.middlewares import _thread_local
 
 logger = logging.getLogger(__name__)
@@ -290,29 +291,14 @@ def get_currency_display_value(obj, field_name, user):
     if value is None or value == "":
         return ""
 
-    company = getattr(obj, "company", None)
-    if not company and hasattr(user, "company"):
-        company = user.company
+    company_id = getattr(obj, "company_id", None)
+    if not company_id:
+        company_id = getattr(user, "company_id", None)
 
-    if not company:
+    if not company_id:
         return str(value)
 
-    # Get currencies
-    default_currency = MultipleCurrency.get_default_currency(company)
-    user_currency = MultipleCurrency.get_user_currency(user)
-
-    if not default_currency:
-        return str(value)
-
-    # If user currency is same as default or not set, just show default
-    if not user_currency or user_currency.pk == default_currency.pk:
-        return default_currency.display_with_symbol(value)
-
-    converted_amount = user_currency.convert_from_default(value)
-    user_display = user_currency.display_with_symbol(converted_amount)
-    default_display = default_currency.display_with_symbol(value)
-
-    return f"{default_display} ({user_display})"
+    return get_currency_context(company_id, user).format_value(value)
 
 
 def get_user_field_permission(user, model, field_name):
@@ -329,28 +315,7 @@ def get_user_field_permission(user, model, field_name):
     if user.is_superuser:
         return "readwrite"
 
-    content_type = ContentType.objects.get_for_model(model)
-
-    user_perm = FieldPermission.objects.filter(
-        user=user, content_type=content_type, field_name=field_name
-    ).first()
-
-    if user_perm:
-        return user_perm.permission_type
-
-    if hasattr(user, "role") and user.role:
-        role_perm = FieldPermission.objects.filter(
-            role=user.role, content_type=content_type, field_name=field_name
-        ).first()
-
-        if role_perm:
-            return role_perm.permission_type
-
-    model_defaults = getattr(model, "default_field_permissions", {})
-    if field_name in model_defaults:
-        return model_defaults[field_name]
-
-    return "readwrite"
+    return get_field_permission_matrix(user, model).get(field_name, "readwrite")
 
 
 def get_field_permissions_for_model(user, model):
@@ -358,34 +323,14 @@ def get_field_permissions_for_model(user, model):
     Get all field permissions for a model for a specific user
     Returns a dictionary: {field_name: permission_type}
 
-    This is optimized to reduce database queries by fetching
-    all permissions at once instead of one by one.
+    The permissions come from the cached permission matrix of the user,
+    see ``horilla_core.field_permissions``.
     """
 
     if user.is_superuser:
         return {}
 
-    content_type = ContentType.objects.get_for_model(model)
-    permissions_dict = {}
-
-    user_perms = FieldPermission.objects.filter(user=user, content_type=content_type)
-    for perm in user_perms:
-        permissions_dict[perm.field_name] = perm.permission_type
-
-    if hasattr(user, "role") and user.role:
-        role_perms = FieldPermission.objects.filter(
-            role=user.role, content_type=content_type
-        )
-        for perm in role_perms:
-            if perm.field_name not in permissions_dict:
-                permissions_dict[perm.field_name] = perm.permission_type
-
-    model_defaults = getattr(model, "default_field_permissions", {})
-    for field_name, default_value in model_defaults.items():
-        if field_name not in permissions_dict:
-            permissions_dict[field_name] = default_value
-
-    return permissions_dict
+    return dict(get_field_permission_matrix(user, model))
 
 
 def filter_hidden_fields(user, model, fields_list):
@@ -403,7 +348,7 @@ def filter_hidden_fields(user, model, fields_list):
     if user.is_superuser:
         return fields_list
 
-    field_permissions = get_field_permissions_for_model(user, model)
+    field_permissions = get_field_permission_matrix(user, model)
 
     return [
         field_name
@@ -439,7 +384,7 @@ def get_editable_fields(user, model, fields_list):
     if user.is_superuser:
         return fields_list
 
-    field_permissions = get_field_permissions_for_model(user, model)
+    field_permissions = get_field_permission_matrix(user, model)
 
     return [
         field_name
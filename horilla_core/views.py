@@ -40,6 +40,7 @@ from horilla_core.models import (
     MultipleCurrency,
     Role,
 )
+from horilla_generics.navigation import get_navigation_signature
 from horilla_generics.views import (
     HorillaListView,
     HorillaModalDetailView,
@@ -623,7 +624,7 @@ class HolidayListView(LoginRequiredMixin, HorillaListView):
         query_params = {}
         if "section" in self.request.GET:
             query_params["section"] = self.request.GET.get("section")
-        query_string = self.request.session.get(self.ordered_ids_key, [])
+        query_string = get_navigation_signature(self.request, self.model)
         attrs = {}
         if self.request.user.has_perm("horilla_core.view_holiday"):
             attrs = {
@@ -941,7 +942,7 @@ class BusinessHourListView(LoginRequiredMixin, HorillaListView):
         query_params = {}
         if "section" in self.request.GET:
             query_params["section"] = self.request.GET.get("section")
-        query_string = self.request.session.get(self.ordered_ids_key, [])
+        query_string = get_navigation_signature(self.request, self.model)
         attrs = {}
         attrs = {
             "hx-get": f"{{get_detail_url}}?instance_ids={query_string}",
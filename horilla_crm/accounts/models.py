@@ -12,7 +12,7 @@ from django.utils.translation import gettext_lazy as _
 
 from horilla.registry.feature import feature_enabled
 from horilla_core.models import HorillaCoreModel
-from horilla_crm.leads.utils import compute_score
+from horilla_crm.leads.scoring import score_instance
 from horilla_utils.middlewares import _thread_local
 
 
@@ -280,9 +280,9 @@ class Account(HorillaCoreModel):
 
 
 @receiver(pre_save, sender=Account)
-def update_account_score(sender, instance, **_kwargs):
+def update_account_score(sender, instance, **kwargs):
     """Update the account score before saving the account instance."""
-    instance.account_score = compute_score(instance)
+    score_instance(instance, kwargs.get("update_fields"))
 
 
 class PartnerAccountRelationship(HorillaCoreModel):
@@ -42,6 +42,7 @@ from horilla_crm.accounts.forms import (
 )
 from horilla_crm.accounts.models import Account, PartnerAccountRelationship
 from horilla_crm.contacts.models import ContactAccountRelationship
+from horilla_crm.leads.mixins import ScoreBreakdownMixin
 from horilla_generics.mixins import RecentlyViewedMixin
 from horilla_generics.views import (
     HorillaActivitySectionView,
@@ -464,7 +465,9 @@ class AccountDetailViewTabs(LoginRequiredMixin, HorillaDetailTabView):
     ),
     name="dispatch",
 )
-class AccountDetailsTab(LoginRequiredMixin, HorillaDetailSectionView):
+class AccountDetailsTab(
+    ScoreBreakdownMixin, LoginRequiredMixin, HorillaDetailSectionView
+):
     """
     Details Tab view of account detail view
     """
@@ -14,7 +14,7 @@ from djmoney.settings import CURRENCY_CHOICES
 from horilla.registry.feature import feature_enabled
 from horilla.utils.choices import LANGUAGE_CHOICES
 from horilla_core.models import HorillaCoreModel
-from horilla_crm.leads.utils import compute_score
+from horilla_crm.leads.scoring import score_instance
 from horilla_utils.middlewares import _thread_local
 
 CONTACT_SOURCE_CHOICES = [
@@ -219,12 +219,12 @@ class Contact(HorillaCoreModel):
 
 
 @receiver(pre_save, sender=Contact)
-def update_contact_score(sender, instance, **_kwargs):
+def update_contact_score(sender, instance, **kwargs):
     """
     Signal to update the contact's score before saving.
-    Computes and assigns a score using `compute_score`.
+    Computes and assigns a score using `score_instance`.
     """
-    instance.contact_score = compute_score(instance)
+    score_instance(instance, kwargs.get("update_fields"))
 
 
 class ContactAccountRelationship(HorillaCoreModel):
@@ -26,6 +26,7 @@ from horilla_core.utils import is_owner
 from horilla_crm.contacts.filters import ContactFilter
 from horilla_crm.contacts.models import Contact, ContactAccountRelationship
 from horilla_crm.contacts.signals import set_contact_account_id
+from horilla_crm.leads.mixins import ScoreBreakdownMixin
 from horilla_crm.opportunities.models import Opportunity, OpportunityContactRole
 from horilla_generics.mixins import RecentlyViewedMixin
 from horilla_generics.views import (
@@ -492,7 +493,9 @@ class ContactDetailViewTabs(LoginRequiredMixin, HorillaDetailTabView):
     ),
     name="dispatch",
 )
-class ContactDetailTab(LoginRequiredMixin, HorillaDetailSectionView):
+class ContactDetailTab(
+    ScoreBreakdownMixin, LoginRequiredMixin, HorillaDetailSectionView
+):
     """
     Details tab of contact detail view
     """
@@ -1,3 +1,129 @@
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
 from django.test import TestCase
 
+from horilla_core.models import HorillaUser
+from horilla_crm.forecast.models import ForecastType
+from horilla_crm.forecast.utils import ForecastCalculator
+from horilla_crm.opportunities.models import Opportunity, OpportunityStage
+
 # Create your forecasts tests here.
+
+
+class ForecastRollupTest(TestCase):
+    """
+    The rollups aggregated in SQL give the values the opportunities of each
+    owner and period added up to when they were bucketed in Python.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owners = [
+            HorillaUser.objects.create_user(
+                f"seller{index}", f"seller{index}@example.com", "password"
+            )
+            for index in range(2)
+        ]
+        cls.forecast_types = [
+            ForecastType.all_objects.create(
+                name=f"{kind} {include_best_case}",
+                forecast_type=kind,
+                include_best_case=include_best_case,
+                created_by=cls.owners[0],
+                updated_by=cls.owners[0],
+            )
+            for kind in (
+                "deal_revenue_amount",
+                "deal_revenue_expected_amount",
+                "deal_quantity",
+            )
+            for include_best_case in (True, False)
+        ]
+        stages = OpportunityStage.all_objects.bulk_create(
+            OpportunityStage(name=name, order=order, probability=10, stage_type=kind)
+            for order, (name, kind) in enumerate(
+                [("Open", "open"), ("Won", "won"), ("Lost", "lost")], start=1
+            )
+        )
+        cls.periods = [
+            SimpleNamespace(pk=pk, start_date=start_date, end_date=end_date)
+            for pk, start_date, end_date in [
+                (1, date(2026, 1, 1), date(2026, 1, 31)),
+                (2, date(2026, 2, 1), date(2026, 2, 28)),
+                (3, date(2026, 3, 1), date(2026, 3, 31)),
+            ]
+        ]
+        rows = [
+            # Period boundaries, a date outside every period and no date
+            (0, 0, "pipeline", date(2026, 1, 1), "100.00", "10.00"),
+            (0, 1, "closed", date(2026, 1, 31), "250.50", "250.50"),
+            (0, 0, "best_case", date(2026, 1, 15), None, "20.00"),
+            (0, 0, "commit", date(2026, 2, 1), "300.00", None),
+            (0, 1, "commit", date(2026, 2, 28), "40.00", "40.00"),
+            (0, 2, "omitted", date(2026, 2, 10), "999.00", "0.00"),
+            (0, 0, "pipeline", date(2026, 4, 1), "500.00", "50.00"),
+            (0, 0, "pipeline", None, "700.00", "70.00"),
+            (1, 0, "pipeline", date(2026, 1, 20), "80.00", "8.00"),
+            (1, 1, "closed", date(2026, 3, 31), "125.25", "125.25"),
+            (1, 0, "best_case", date(2026, 3, 5), "60.00", "6.00"),
+        ]
+        Opportunity.all_objects.bulk_create(
+            Opportunity(
+                name=f"Deal {category}",
+                owner=cls.owners[owner],
+                stage=stages[stage],
+                forecast_category=category,
+                close_date=close_date,
+                amount=None if amount is None else Decimal(amount),
+                expected_revenue=None if expected is None else Decimal(expected),
+            )
+            for owner, stage, category, close_date, amount, expected in rows
+        )
+
+    def bucket_in_python(self, forecast_type, owner, period):
+        """Values of the removed per-opportunity bucketing."""
+        values = {"pipeline": 0, "best_case": 0, "commit": 0, "closed": 0, "actual": 0}
+        included = {
+            "pipeline": forecast_type.include_pipeline,
+            "best_case": forecast_type.include_best_case,
+            "commit": forecast_type.include_commit,
+            "closed": forecast_type.include_closed,
+        }
+        for opp in Opportunity.all_objects.filter(owner=owner).select_related("stage"):
+            if not opp.close_date or not (
+                period.start_date <= opp.close_date <= period.end_date
+            ):
+                continue
+            if forecast_type.is_quantity_based:
+                value = 1
+            elif forecast_type.is_revenue_expected_based:
+                value = opp.expected_revenue or 0
+            else:
+                value = opp.amount or 0
+            if included.get(opp.forecast_category):
+                values[opp.forecast_category] += value
+            if opp.stage.stage_type == "won":
+                values["actual"] += value
+        return values
+
+    def test_rollups_match_python_bucketing(self):
+        calculator = ForecastCalculator()
+        for forecast_type in self.forecast_types:
+            rollups = calculator.get_forecast_rollups(
+                forecast_type, [owner.pk for owner in self.owners], self.periods
+            )
+            for owner in self.owners:
+                for period in self.periods:
+                    with self.subTest(
+                        forecast_type=forecast_type.name,
+                        owner=owner.username,
+                        period=period.pk,
+                    ):
+                        self.assertEqual(
+                            rollups.get(
+                                (owner.pk, period.pk), calculator.get_empty_values()
+                            ),
+                            self.bucket_in_python(forecast_type, owner, period),
+                        )
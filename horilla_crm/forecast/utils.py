@@ -9,12 +9,13 @@ Features:
 - Automatic generation and update of forecasts per user/period.
 - Supports bulk operations for performance.
 - Handles dynamic conditions with logical AND/OR grouping.
-- Computes pipeline, best case, commit, closed, and actual values.
+- Computes pipeline, best case, commit, closed, and actual values with one
+  aggregate query per forecast type, grouped by owner and period.
 - Fetches and applies targets automatically.
 - Caches condition queries for efficiency.
 """
 
-from django.db.models import Q, Sum
+from django.db.models import Case, Count, IntegerField, Q, Sum, Value, When
 
 from horilla_core.models import FiscalYearInstance, HorillaUser, Period
 from horilla_crm.forecast.models import Forecast, ForecastTarget, ForecastType
@@ -117,75 +118,23 @@ class ForecastCalculator:
         if not forecasts:
             return
 
-        # Group forecasts by user and period for efficient querying
-        user_period_forecasts = {}
+        # Read each period once
+        periods = {}
         for forecast in forecasts:
-            key = (forecast.owner_id, forecast.period_id)
-            user_period_forecasts[key] = forecast
+            if forecast.period_id not in periods:
+                periods[forecast.period_id] = forecast.period
 
-        # Get all opportunities for all users/periods in single query
-        user_ids = list(set(f.owner_id for f in forecasts))
-        period_data = {}
-        for forecast in forecasts:
-            if forecast.period_id not in period_data:
-                period_data[forecast.period_id] = {
-                    "start_date": forecast.period.start_date,
-                    "end_date": forecast.period.end_date,
-                }
-
-        # Build conditions query once and cache it
-        conditions_query = self.get_cached_conditions_query(forecast_type)
-
-        # Get all relevant opportunities in bulk
-        opportunities_query = Q(owner_id__in=user_ids)
-
-        # Add date range conditions for all periods
-        date_conditions = Q()
-        for period_info in period_data.values():
-            date_conditions |= Q(
-                close_date__range=[period_info["start_date"], period_info["end_date"]]
-            )
-        opportunities_query &= date_conditions
-
-        if conditions_query:
-            opportunities_query &= conditions_query
-
-        opportunities = Opportunity.objects.filter(opportunities_query).values(
-            "id",
-            "owner_id",
-            "close_date",
-            "amount",
-            "expected_revenue",
-            "forecast_category",
-            "stage__stage_type",
+        rollups = self.get_forecast_rollups(
+            forecast_type,
+            {forecast.owner_id for forecast in forecasts},
+            periods.values(),
         )
 
-        # Group opportunities by user and period
-        user_period_opportunities = {}
-        for opp in opportunities:
-            # Find which period this opportunity belongs to
-            for forecast in forecasts:
-                if (
-                    forecast.owner_id == opp["owner_id"]
-                    and forecast.period.start_date
-                    <= opp["close_date"]
-                    <= forecast.period.end_date
-                ):
-
-                    key = (opp["owner_id"], forecast.period_id)
-                    if key not in user_period_opportunities:
-                        user_period_opportunities[key] = []
-                    user_period_opportunities[key].append(opp)
-                    break
-
         # Calculate values for each forecast
         forecasts_to_update = []
         for forecast in forecasts:
-            key = (forecast.owner_id, forecast.period_id)
-            user_opportunities = user_period_opportunities.get(key, [])
-
-            values = self.calculate_values_from_opportunities(
-                user_opportunities, forecast_type
+            values = rollups.get(
+                (forecast.owner_id, forecast.period_id), self.get_empty_values()
             )
 
             # Update forecast fields based on type
@@ -239,25 +188,9 @@ class ForecastCalculator:
             )
         return self._conditions_cache[cache_key]
 
-    def calculate_values_from_opportunities(self, opportunities, forecast_type):
-        """
-        Calculate values from pre-fetched opportunity data
-        """
-
-        if forecast_type.is_quantity_based:
-            return self._calculate_quantity_values_from_data(
-                opportunities, forecast_type
-            )
-        elif forecast_type.is_revenue_expected_based:
-            return self._calculate_expected_amount_values_from_data(
-                opportunities, forecast_type
-            )
-        else:
-            return self._calculate_amount_values_from_data(opportunities, forecast_type)
-
-    def _calculate_quantity_values_from_data(self, opportunities, forecast_type):
-        """Calculate quantity values from opportunity data"""
-        values = {
+    def get_empty_values(self):
+        """Forecast values of a period without opportunities"""
+        return {
             "pipeline": 0,
             "best_case": 0,
             "commit": 0,
@@ -265,87 +198,84 @@ class ForecastCalculator:
             "actual": 0,
         }
 
-        for opp in opportunities:
-            if (
-                forecast_type.include_pipeline
-                and opp["forecast_category"] == "pipeline"
-            ):
-                values["pipeline"] += 1
-            if (
-                forecast_type.include_best_case
-                and opp["forecast_category"] == "best_case"
-            ):
-                values["best_case"] += 1
-            if forecast_type.include_commit and opp["forecast_category"] == "commit":
-                values["commit"] += 1
-            if forecast_type.include_closed and opp["forecast_category"] == "closed":
-                values["closed"] += 1
-            if opp["stage__stage_type"] == "won":
-                values["actual"] += 1
-
-        return values
-
-    def _calculate_expected_amount_values_from_data(self, opportunities, forecast_type):
-        """Calculate expected amount values from opportunity data"""
-        values = {
-            "pipeline": 0,
-            "best_case": 0,
-            "commit": 0,
-            "closed": 0,
-            "actual": 0,
-        }
+    def get_rollup_aggregates(self, forecast_type):
+        """
+        Conditional aggregates of the forecast values: the count of deals for
+        quantity based types, else the sum of the expected revenue or amount
+        (kept in the company currency) of each forecast category included
+        in the forecast type, and of the won deals for the actual value
+        """
+        if forecast_type.is_quantity_based:
 
-        for opp in opportunities:
-            expected_revenue = opp["expected_revenue"] or 0
-            if (
-                forecast_type.include_pipeline
-                and opp["forecast_category"] == "pipeline"
-            ):
-                values["pipeline"] += expected_revenue
-            if (
-                forecast_type.include_best_case
-                and opp["forecast_category"] == "best_case"
-            ):
-                values["best_case"] += expected_revenue
-            if forecast_type.include_commit and opp["forecast_category"] == "commit":
-                values["commit"] += expected_revenue
-            if forecast_type.include_closed and opp["forecast_category"] == "closed":
-                values["closed"] += expected_revenue
-            if opp["stage__stage_type"] == "won":
-                values["actual"] += expected_revenue
-
-        return values
-
-    def _calculate_amount_values_from_data(self, opportunities, forecast_type):
-        """Calculate amount values from opportunity data"""
-        values = {
-            "pipeline": 0,
-            "best_case": 0,
-            "commit": 0,
-            "closed": 0,
-            "actual": 0,
-        }
+            def total(condition):
+                return Count("id", filter=condition)
+
+        else:
+            field = (
+                "expected_revenue"
+                if forecast_type.is_revenue_expected_based
+                else "amount"
+            )
+
+            def total(condition):
+                return Sum(field, filter=condition)
+
+        aggregates = {"actual_value": total(Q(stage__stage_type="won"))}
+        for category, included in (
+            ("pipeline", forecast_type.include_pipeline),
+            ("best_case", forecast_type.include_best_case),
+            ("commit", forecast_type.include_commit),
+            ("closed", forecast_type.include_closed),
+        ):
+            if included:
+                aggregates[f"{category}_value"] = total(
+                    Q(forecast_category=category)
+                )
+        return aggregates
+
+    def get_forecast_rollups(self, forecast_type, user_ids, periods):
+        """
+        Forecast values of the opportunities of ``user_ids`` closing in each
+        of ``periods``, as ``{(owner_id, period_id): values}``, computed
+        with one aggregate query grouped by owner and period
+        """
+        periods = list(periods)
+        if not user_ids or not periods:
+            return {}
+
+        # Periods of a fiscal year do not overlap, so each opportunity
+        # falls in at most one of them
+        date_conditions = Q()
+        period_whens = []
+        for period in periods:
+            date_range = [period.start_date, period.end_date]
+            date_conditions |= Q(close_date__range=date_range)
+            period_whens.append(
+                When(close_date__range=date_range, then=Value(period.pk))
+            )
+
+        opportunities_query = Q(owner_id__in=user_ids) & date_conditions
+        conditions_query = self.get_cached_conditions_query(forecast_type)
+        if conditions_query:
+            opportunities_query &= conditions_query
 
-        for opp in opportunities:
-            amount = opp["amount"] or 0
-            if (
-                forecast_type.include_pipeline
-                and opp["forecast_category"] == "pipeline"
-            ):
-                values["pipeline"] += amount
-            if (
-                forecast_type.include_best_case
-                and opp["forecast_category"] == "best_case"
-            ):
-                values["best_case"] += amount
-            if forecast_type.include_commit and opp["forecast_category"] == "commit":
-                values["commit"] += amount
-            if forecast_type.include_closed and opp["forecast_category"] == "closed":
-                values["closed"] += amount
-            if opp["stage__stage_type"] == "won":
-                values["actual"] += amount
-
-        return values
+        rows = (
+            Opportunity.objects.filter(opportunities_query)
+            .annotate(
+                forecast_period_id=Case(*period_whens, output_field=IntegerField())
+            )
+            .order_by()
+            .values("owner_id", "forecast_period_id")
+            .annotate(**self.get_rollup_aggregates(forecast_type))
+        )
+
+        rollups = {}
+        for row in rows:
+            values = self.get_empty_values()
+            for key in values:
+                values[key] = row.get(f"{key}_value") or 0
+            rollups[(row["owner_id"], row["forecast_period_id"])] = values
+        return rollups
 
     # Keep the rest of your existing methods but with optimizations
     def generate_forecasts_for_user(self, user=None, forecast_type=None):
@@ -364,13 +294,24 @@ class ForecastCalculator:
         )
 
         for forecast_type_obj in forecast_types:
+            rollups = self.get_forecast_rollups(
+                forecast_type_obj, [target_user.pk], periods
+            )
             for period in periods:
                 self.create_or_update_period_forecast(
-                    target_user, forecast_type_obj, period
+                    target_user,
+                    forecast_type_obj,
+                    period,
+                    rollups.get((target_user.pk, period.pk), self.get_empty_values()),
                 )
 
-    def create_or_update_period_forecast(self, user, forecast_type, period):
-        """Create or update forecast for a specific period automatically"""
+    def create_or_update_period_forecast(
+        self, user, forecast_type, period, calculated_data=None
+    ):
+        """
+        Create or update forecast for a specific period automatically, with
+        the values of ``calculated_data`` when they are already computed
+        """
         forecast, created = Forecast.objects.get_or_create(
             company=getattr(user, "company", None),
             owner=user,
@@ -385,7 +326,10 @@ class ForecastCalculator:
             },
         )
 
-        calculated_data = self.calculate_forecast_values(user, period, forecast_type)
+        if calculated_data is None:
+            calculated_data = self.calculate_forecast_values(
+                user, period, forecast_type
+            )
 
         if forecast_type.is_quantity_based:
             forecast.pipeline_quantity = calculated_data["pipeline"]
@@ -415,22 +359,8 @@ class ForecastCalculator:
 
     def calculate_forecast_values(self, user, period, forecast_type):
         """Calculate forecast values based on opportunities in the period"""
-        base_query = Q(
-            owner=user, close_date__range=[period.start_date, period.end_date]
-        )
-
-        conditions_query = self.get_cached_conditions_query(forecast_type)
-        if conditions_query:
-            base_query &= conditions_query
-
-        opportunities = Opportunity.objects.filter(base_query)
-
-        if forecast_type.is_quantity_based:
-            return self._calculate_quantity_values(opportunities, forecast_type)
-        elif forecast_type.is_revenue_expected_based:
-            return self._calculate_expected_amount_values(opportunities, forecast_type)
-        else:
-            return self._calculate_amount_values(opportunities, forecast_type)
+        rollups = self.get_forecast_rollups(forecast_type, [user.pk], [period])
+        return rollups.get((user.pk, period.pk), self.get_empty_values())
 
     def build_conditions_query(self, forecast_type):
         """Build Django Q object from horilla_crm.forecastCondition records"""
@@ -526,136 +456,6 @@ class ForecastCalculator:
         except (ValueError, TypeError):
             return value
 
-    def _calculate_quantity_values(self, opportunities, forecast_type):
-        """Calculate quantity values (count of deals) by forecast category"""
-        values = {
-            "pipeline": 0,
-            "best_case": 0,
-            "commit": 0,
-            "closed": 0,
-            "actual": 0,
-        }
-
-        # Use database aggregation instead of Python loops for better performance
-        if forecast_type.include_pipeline:
-            values["pipeline"] = opportunities.filter(
-                forecast_category="pipeline"
-            ).count()
-        if forecast_type.include_best_case:
-            values["best_case"] = opportunities.filter(
-                forecast_category="best_case"
-            ).count()
-        if forecast_type.include_commit:
-            values["commit"] = opportunities.filter(forecast_category="commit").count()
-        if forecast_type.include_closed:
-            values["closed"] = opportunities.filter(forecast_category="closed").count()
-
-        values["actual"] = opportunities.filter(stage__stage_type="won").count()
-
-        return values
-
-    def _calculate_expected_amount_values(self, opportunities, forecast_type):
-        """Calculate expected amount values using expected_revenue field"""
-        values = {
-            "pipeline": 0,
-            "best_case": 0,
-            "commit": 0,
-            "closed": 0,
-            "actual": 0,
-        }
-
-        if forecast_type.include_pipeline:
-            values["pipeline"] = (
-                opportunities.filter(forecast_category="pipeline").aggregate(
-                    total=Sum("expected_revenue")
-                )["total"]
-                or 0
-            )
-
-        if forecast_type.include_best_case:
-            values["best_case"] = (
-                opportunities.filter(forecast_category="best_case").aggregate(
-                    total=Sum("expected_revenue")
-                )["total"]
-                or 0
-            )
-
-        if forecast_type.include_commit:
-            values["commit"] = (
-                opportunities.filter(forecast_category="commit").aggregate(
-                    total=Sum("expected_revenue")
-                )["total"]
-                or 0
-            )
-
-        if forecast_type.include_closed:
-            values["closed"] = (
-                opportunities.filter(forecast_category="closed").aggregate(
-                    total=Sum("expected_revenue")
-                )["total"]
-                or 0
-            )
-
-        values["actual"] = (
-            opportunities.filter(stage__stage_type="won").aggregate(
-                total=Sum("expected_revenue")
-            )["total"]
-            or 0
-        )
-
-        return values
-
-    def _calculate_amount_values(self, opportunities, forecast_type):
-        """Calculate actual amount values using amount field"""
-        values = {
-            "pipeline": 0,
-            "best_case": 0,
-            "commit": 0,
-            "closed": 0,
-            "actual": 0,
-        }
-
-        if forecast_type.include_pipeline:
-            values["pipeline"] = (
-                opportunities.filter(forecast_category="pipeline").aggregate(
-                    total=Sum("amount")
-                )["total"]
-                or 0
-            )
-
-        if forecast_type.include_best_case:
-            values["best_case"] = (
-                opportunities.filter(forecast_category="best_case").aggregate(
-                    total=Sum("amount")
-                )["total"]
-                or 0
-            )
-
-        if forecast_type.include_commit:
-            values["commit"] = (
-                opportunities.filter(forecast_category="commit").aggregate(
-                    total=Sum("amount")
-                )["total"]
-                or 0
-            )
-
-        if forecast_type.include_closed:
-            values["closed"] = (
-                opportunities.filter(forecast_category="closed").aggregate(
-                    total=Sum("amount")
-                )["total"]
-                or 0
-            )
-
-        values["actual"] = (
-            opportunities.filter(stage__stage_type="won").aggregate(
-                total=Sum("amount")
-            )["total"]
-            or 0
-        )
-
-        return values
-
     def get_target_for_period(self, user, period, target_type="amount"):
         """Get target amount or quantity for user in specific period"""
         target = ForecastTarget.objects.filter(
@@ -675,9 +475,24 @@ class ForecastCalculator:
         if not periods:
             periods = Period.objects.filter(quarter__fiscal_year=self.fiscal_year)
 
-        forecast_types = ForecastType.objects.filter(is_active=True)
+        users = list(users)
+        periods = list(periods)
+        forecast_types = list(ForecastType.objects.filter(is_active=True))
+        rollups = {
+            forecast_type.pk: self.get_forecast_rollups(
+                forecast_type, [user.pk for user in users], periods
+            )
+            for forecast_type in forecast_types
+        }
 
         for user in users:
             for forecast_type in forecast_types:
                 for period in periods:
-                    self.create_or_update_period_forecast(user, forecast_type, period)
+                    self.create_or_update_period_forecast(
+                        user,
+                        forecast_type,
+                        period,
+                        rollups[forecast_type.pk].get(
+                            (user.pk, period.pk), self.get_empty_values()
+                        ),
+                    )
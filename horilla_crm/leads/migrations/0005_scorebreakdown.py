@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("leads", "0004_scoringrule_scoringcriterion_scoringcondition_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ScoreBreakdown",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("object_id", models.PositiveIntegerField(verbose_name="Object Id")),
+                (
+                    "rule_version",
+                    models.BigIntegerField(verbose_name="Scoring Rule Version"),
+                ),
+                (
+                    "criteria",
+                    models.JSONField(default=list, verbose_name="Matched Criteria"),
+                ),
+                (
+                    "field_values",
+                    models.JSONField(default=dict, verbose_name="Field Values"),
+                ),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="contenttypes.contenttype",
+                        verbose_name="Content Type",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Score Breakdown",
+                "verbose_name_plural": "Score Breakdowns",
+                "unique_together": {("content_type", "object_id")},
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+"""
+View mixins of the Leads module shared with the other scored modules.
+"""
+
+from horilla_crm.leads.scoring import get_score_breakdown, get_score_field
+
+
+class ScoreBreakdownMixin:
+    """
+    Adds the criteria the score of the object is made of to the context of
+    a detail tab, unless the score field is hidden from the user.
+    """
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        score_field = get_score_field(self.model)
+        field_permissions = context.get("field_permissions") or {}
+        if field_permissions.get(score_field, "readwrite") != "hidden":
+            context["score_breakdown"] = get_score_breakdown(self.object)
+        return context
@@ -10,6 +10,7 @@ import logging
 
 from colorfield.fields import ColorField
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.core.validators import EmailValidator
 from django.db import models, transaction
@@ -362,9 +363,9 @@ class Lead(HorillaCoreModel):
 @receiver(pre_save, sender=Lead)
 def update_lead_score(sender, instance, **kwargs):
     """Signal to update lead score before saving a Lead instance."""
-    from horilla_crm.leads.utils import compute_score
+    from horilla_crm.leads.scoring import score_instance
 
-    instance.lead_score = compute_score(instance)
+    score_instance(instance, kwargs.get("update_fields"))
 
 
 class EmailToLeadConfig(HorillaCoreModel):
@@ -709,6 +710,34 @@ class ScoringCondition(HorillaCoreModel):
         ordering = ["order", "id"]
 
 
+@permission_exempt_model
+class ScoreBreakdown(models.Model):
+    """
+    Scoring criteria a record matched when it was last scored, with the
+    values of the fields they read, so a save only evaluates again the
+    criteria whose fields changed and the score can be explained without
+    evaluating the rules.
+    """
+
+    content_type = models.ForeignKey(
+        ContentType, on_delete=models.CASCADE, verbose_name=_("Content Type")
+    )
+    object_id = models.PositiveIntegerField(verbose_name=_("Object Id"))
+    rule_version = models.BigIntegerField(verbose_name=_("Scoring Rule Version"))
+    criteria = models.JSONField(default=list, verbose_name=_("Matched Criteria"))
+    field_values = models.JSONField(default=dict, verbose_name=_("Field Values"))
+
+    class Meta:
+        """Meta class for ScoreBreakdown"""
+
+        unique_together = ("content_type", "object_id")
+        verbose_name = _("Score Breakdown")
+        verbose_name_plural = _("Score Breakdowns")
+
+    def __str__(self):
+        return f"{self.content_type} #{self.object_id}"
+
+
 @permission_exempt_model
 class EmailActivityScoring(HorillaCoreModel):
     rule = models.ForeignKey(
@@ -0,0 +1,625 @@
+"""
+Compiled scoring rules.
+
+The active scoring rules of a module are compiled into a ``ScoringPlan``:
+the signed points of each criterion and its conditions, each condition
+turned into a test function with its value pre-processed (lower-cased,
+converted to a number). Evaluating a plan needs no queries, so scoring an
+instance on every save, or a list of instances at once, only reads their
+field values.
+
+Plans are kept in a process-wide dict per module and company (the scoring
+models are company filtered) and compiled again when the scoring rule
+version changes. The version is derived from the count and latest update
+of the ScoringRule, ScoringCriterion and ScoringCondition rows, so a rule
+edited in one worker process is used by all of them.
+
+Those changes also rescore every record of the module. ``schedule_rescoring``
+queues the ``rescore_module_task`` Celery task ``SCORING_RESCORE_DELAY``
+seconds after the commit; each edit supersedes the run queued by the
+previous one, so a burst of edits is rescored once. ``rescore_module``
+scores the records in chunks of primary keys with the compiled plan, one
+pass per chunk for all criteria, and records its progress in the cache.
+
+The criteria each record matched are stored in ``ScoreBreakdown`` with the
+values of the fields they read. ``score_instance`` evaluates on save only
+the criteria whose fields changed since, and ``get_score_breakdown``
+explains a score without evaluating the rules.
+"""
+
+import hashlib
+import logging
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from horilla_core.signals import records_bulk_changed
+from horilla_crm.leads.models import (
+    ScoreBreakdown,
+    ScoringCondition,
+    ScoringCriterion,
+    ScoringRule,
+)
+from horilla_utils.methods import get_data_stamp
+from horilla_utils.middlewares import get_current_request
+
+logger = logging.getLogger(__name__)
+
+SCORING_RESCORE_DELAY = getattr(settings, "SCORING_RESCORE_DELAY", 10)
+SCORING_RESCORE_CHUNK_SIZE = getattr(settings, "SCORING_RESCORE_CHUNK_SIZE", 1000)
+SCORING_RESCORE_TIMEOUT = 60 * 60
+
+SCORE_FIELDS = {
+    "lead": "lead_score",
+    "opportunity": "opportunity_score",
+    "account": "account_score",
+    "contact": "contact_score",
+}
+
+_plans = {}
+
+
+def get_scoring_rule_version():
+    """
+    Return the version of the scoring rules: a digest of the count and
+    latest update of the rules, criteria and conditions, read from the
+    database once per request, so every process sees the same version.
+    """
+    request = get_current_request()
+    version = getattr(request, "_scoring_rule_version", None)
+    if version is None:
+        stamps = [
+            get_data_stamp(model.all_objects.all())
+            for model in (ScoringRule, ScoringCriterion, ScoringCondition)
+        ]
+        digest = hashlib.sha256(repr(stamps).encode()).digest()
+        version = int.from_bytes(digest[:8], "big", signed=True)
+        if request is not None:
+            request._scoring_rule_version = version
+    return version
+
+
+def invalidate_scoring_rules():
+    """
+    Drop the compiled scoring plans and the version read in the current
+    request. Other processes see the change in the version.
+    """
+    _plans.clear()
+    request = get_current_request()
+    if request is not None:
+        request.__dict__.pop("_scoring_rule_version", None)
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _never(field_value):
+    return False
+
+
+def compile_condition_test(operator, value):
+    """
+    Test function of a condition, taking the field value as a string (``""``
+    for ``None``), with the same results as ``ScoringCondition.evaluate``.
+    """
+    lowered = value.lower()
+
+    if operator == "equals":
+        return lambda field_value: field_value == value
+    if operator == "not_equals":
+        return lambda field_value: field_value != value
+    if operator == "contains":
+        return lambda field_value: lowered in field_value.lower()
+    if operator == "not_contains":
+        return lambda field_value: lowered not in field_value.lower()
+    if operator == "starts_with":
+        return lambda field_value: field_value.lower().startswith(lowered)
+    if operator == "ends_with":
+        return lambda field_value: field_value.lower().endswith(lowered)
+    if operator in (
+        "greater_than",
+        "greater_than_equal",
+        "less_than",
+        "less_than_equal",
+    ):
+        target = _to_float(value)
+        if target is None:
+            return _never
+        compare = {
+            "greater_than": float.__gt__,
+            "greater_than_equal": float.__ge__,
+            "less_than": float.__lt__,
+            "less_than_equal": float.__le__,
+        }[operator]
+
+        def numeric_test(field_value):
+            number = _to_float(field_value)
+            return number is not None and compare(number, target)
+
+        return numeric_test
+    if operator == "is_empty":
+        return lambda field_value: not field_value or field_value.strip() == ""
+    if operator == "is_not_empty":
+        return lambda field_value: bool(field_value and field_value.strip())
+    return _never
+
+
+class ScoringPlan:
+    """
+    Evaluation plan of the active scoring rules of one module.
+
+    ``criteria`` is a tuple of ``(criterion_id, name, points, conditions)``,
+    points already negated for subtracting criteria, and ``conditions`` a
+    tuple of ``(field, test, logical_operator)`` in condition order, the
+    compiled form of ``ScoringCriterion.evaluate_conditions``.
+    """
+
+    def __init__(self, criteria, version=None):
+        self.criteria = criteria
+        self.version = version
+        self.criterion_fields = {
+            criterion_id: {field for field, _t, _o in conditions}
+            for criterion_id, _name, _points, conditions in criteria
+        }
+        self.fields = tuple(set().union(*self.criterion_fields.values()))
+        self.points = {
+            criterion_id: points for criterion_id, _name, points, _c in criteria
+        }
+        self.names = {criterion_id: name for criterion_id, name, _p, _c in criteria}
+
+    def get_values(self, instance):
+        """``{field: value as a string}`` of the fields the plan reads."""
+        values = {}
+        for field in self.fields:
+            try:
+                value = getattr(instance, field, None)
+            except Exception as e:
+                logger.error(f"Error reading {field} for scoring: {str(e)}")
+                value = None
+            values[field] = "" if value is None else str(value)
+        return values
+
+    def matches(self, conditions, values):
+        result = None
+        for field, test, logical_operator in conditions:
+            try:
+                condition_result = test(values[field])
+            except Exception as e:
+                logger.error(f"Error evaluating scoring condition on {field}: {e}")
+                condition_result = False
+            if result is None:
+                result = condition_result
+            elif logical_operator == "and":
+                result = result and condition_result
+            else:
+                result = result or condition_result
+        return bool(result)
+
+    def get_matched_criteria(self, values, previous=None):
+        """
+        Ids of the criteria matching ``values``, in plan order. With the
+        ``(values, matched criteria)`` of the previous evaluation, only the
+        criteria reading a field whose value changed are evaluated.
+        """
+        previous_values, previous_matched = previous or (None, ())
+        matched = []
+        for criterion_id, _name, _points, conditions in self.criteria:
+            if previous_values is not None and all(
+                previous_values.get(field) == values[field]
+                for field in self.criterion_fields[criterion_id]
+            ):
+                is_match = criterion_id in previous_matched
+            else:
+                is_match = self.matches(conditions, values)
+            if is_match:
+                matched.append(criterion_id)
+        return matched
+
+    def get_score(self, matched):
+        """Score of the matched criteria ids."""
+        return sum(self.points.get(criterion_id, 0) for criterion_id in matched)
+
+    def score(self, instance):
+        """Score of one instance."""
+        if not self.criteria:
+            return 0
+        return self.get_score(self.get_matched_criteria(self.get_values(instance)))
+
+    def evaluate_many(self, instances):
+        """
+        ``(values, matched criteria ids)`` of ``instances``, in order. Field
+        values are read once per instance and each condition is tested
+        column by column.
+        """
+        rows = [self.get_values(instance) for instance in instances]
+        matched = [[] for _row in rows]
+        for criterion_id, _name, _points, conditions in self.criteria:
+            column = None
+            for field, test, logical_operator in conditions:
+                results = []
+                for values in rows:
+                    try:
+                        results.append(bool(test(values[field])))
+                    except Exception as e:
+                        logger.error(
+                            f"Error evaluating scoring condition on {field}: {e}"
+                        )
+                        results.append(False)
+                if column is None:
+                    column = results
+                elif logical_operator == "and":
+                    column = [a and b for a, b in zip(column, results)]
+                else:
+                    column = [a or b for a, b in zip(column, results)]
+            for index, is_match in enumerate(column):
+                if is_match:
+                    matched[index].append(criterion_id)
+        return list(zip(rows, matched))
+
+    def score_many(self, instances):
+        """Scores of ``instances``, in order."""
+        if not self.criteria or not instances:
+            return [0] * len(instances)
+        return [
+            self.get_score(matched) for _values, matched in self.evaluate_many(instances)
+        ]
+
+
+def compile_scoring_plan(module, company_id=None):
+    """
+    Compile the active scoring rules of ``module`` with three queries. Like
+    the company filtered managers ``compute_score`` used before, only the
+    rules, criteria and conditions of ``company_id`` are used when given.
+    """
+    rules = ScoringRule.all_objects.filter(module=module, is_active=True)
+    criterion_queryset = ScoringCriterion.all_objects.all()
+    condition_queryset = ScoringCondition.all_objects.all()
+    if company_id is not None:
+        rules = rules.filter(company_id=company_id)
+        criterion_queryset = criterion_queryset.filter(company_id=company_id)
+        condition_queryset = condition_queryset.filter(company_id=company_id)
+
+    rule_ids = list(rules.values_list("id", flat=True))
+    if not rule_ids:
+        return ScoringPlan(())
+
+    conditions_by_criterion = {}
+    for condition in condition_queryset.filter(
+        criterion__rule_id__in=rule_ids
+    ).order_by("order", "id"):
+        conditions_by_criterion.setdefault(condition.criterion_id, []).append(
+            (
+                condition.field,
+                compile_condition_test(condition.operator, condition.value),
+                condition.logical_operator,
+            )
+        )
+
+    criteria = []
+    for criterion in criterion_queryset.filter(rule_id__in=rule_ids).order_by(
+        "order", "id"
+    ):
+        conditions = conditions_by_criterion.get(criterion.id)
+        # A criterion without conditions never matches
+        if not conditions:
+            continue
+        points = criterion.points
+        if criterion.operation_type == "sub":
+            points = -points
+        criteria.append(
+            (
+                criterion.id,
+                criterion.name or f"Criterion {criterion.pk}",
+                points,
+                tuple(conditions),
+            )
+        )
+    return ScoringPlan(tuple(criteria))
+
+
+def get_active_company_id():
+    """Primary key of the active company of the current request, if any."""
+    company = getattr(get_current_request(), "active_company", None)
+    return getattr(company, "pk", None)
+
+
+def get_scoring_plan(module, company_id=None):
+    """
+    Return the compiled scoring plan of ``module`` for ``company_id``, by
+    default the active company (all companies outside a request).
+    """
+    if company_id is None:
+        company_id = get_active_company_id()
+    key = (module, company_id)
+    version = get_scoring_rule_version()
+    entry = _plans.get(key)
+    if entry is None or entry[0] != version:
+        plan = compile_scoring_plan(module, company_id)
+        plan.version = version
+        entry = (version, plan)
+        _plans[key] = entry
+    return entry[1]
+
+
+def get_score_field(model):
+    """Name of the score field of ``model``, if it is scored."""
+    return SCORE_FIELDS.get(model._meta.model_name)
+
+
+def get_models_for_module(module):
+    """
+    Dynamically find models matching a module name (e.g., 'lead') across installed apps.
+    Only includes models that have a corresponding score field.
+    """
+    models = []
+    for app_config in apps.get_app_configs():
+        for model in app_config.get_models():
+            if model._meta.model_name == module:
+                score_field = get_score_field(model)
+                if score_field and score_field in [f.name for f in model._meta.fields]:
+                    models.append(model)
+    return models
+
+
+def _rescore_key(kind, module, company_id):
+    return f"scoring_rescore_{kind}_{module}_{company_id}"
+
+
+def get_rescoring_progress(module, company_id=None):
+    """
+    Progress of the last rescoring of ``module`` for a company: a dict with
+    ``status`` (pending, running, done or superseded), ``done`` and ``total``
+    records and ``changed`` scores, or None.
+    """
+    return cache.get(_rescore_key("progress", module, company_id))
+
+
+def _set_progress(module, company_id, **progress):
+    cache.set(
+        _rescore_key("progress", module, company_id),
+        progress,
+        SCORING_RESCORE_TIMEOUT,
+    )
+
+
+def is_rescoring_superseded(module, company_id, token):
+    """
+    True when a later rule edit queued another rescoring of the module.
+    Without a cache shared with the workers every run goes ahead.
+    """
+    if token is None:
+        return False
+    pending = cache.get(_rescore_key("pending", module, company_id))
+    return pending is not None and pending != token
+
+
+def schedule_rescoring(module):
+    """
+    Rescore the records of ``module`` for the active company once the
+    current transaction commits, coalescing with the edits that follow
+    within ``SCORING_RESCORE_DELAY`` seconds.
+    """
+    company_id = get_active_company_id()
+
+    def enqueue():
+        from horilla_crm.leads.tasks import rescore_module_task
+
+        token = time.time_ns()
+        cache.set(
+            _rescore_key("pending", module, company_id),
+            token,
+            SCORING_RESCORE_TIMEOUT,
+        )
+        _set_progress(module, company_id, status="pending", done=0, total=None)
+        try:
+            rescore_module_task.apply_async(
+                args=[module, company_id, token], countdown=SCORING_RESCORE_DELAY
+            )
+        except Exception as e:
+            logger.error(f"Could not queue rescoring of {module}, rescoring now: {e}")
+            rescore_module(module, company_id, token)
+
+    transaction.on_commit(enqueue)
+
+
+def _get_related_fields(model, fields):
+    related = []
+    for field in fields:
+        try:
+            model_field = model._meta.get_field(field)
+        except Exception:
+            continue
+        if model_field.many_to_one or model_field.one_to_one:
+            related.append(field)
+    return related
+
+
+def rescore_module(module, company_id=None, token=None, on_progress=None):
+    """
+    Recompute the score of every record of ``module`` (of ``company_id``
+    when given) in chunks of ``SCORING_RESCORE_CHUNK_SIZE`` primary keys,
+    writing only the scores that changed and the score breakdowns. Stops
+    early when superseded by a later edit. Returns the progress dict.
+
+    The plan is compiled from the current rules on every run rather than
+    taken from the process-wide plans, so a long-lived worker never rescores
+    with rules it compiled for an earlier run.
+    """
+    version = get_scoring_rule_version()
+    plan = compile_scoring_plan(module, company_id)
+    plan.version = version
+    progress = {"status": "running", "done": 0, "total": 0, "changed": 0}
+    querysets = []
+    for model in get_models_for_module(module):
+        queryset = model.all_objects.all()
+        if company_id is not None:
+            queryset = queryset.filter(company_id=company_id)
+        querysets.append((model, queryset))
+        progress["total"] += queryset.count()
+    _set_progress(module, company_id, **progress)
+
+    for model, queryset in querysets:
+        score_field = get_score_field(model)
+        related = _get_related_fields(model, plan.fields)
+        if related:
+            queryset = queryset.select_related(*related)
+        last_pk = None
+        while True:
+            if is_rescoring_superseded(module, company_id, token):
+                progress["status"] = "superseded"
+                _set_progress(module, company_id, **progress)
+                return progress
+
+            chunk = queryset.order_by("pk")
+            if last_pk is not None:
+                chunk = chunk.filter(pk__gt=last_pk)
+            instances = list(chunk[:SCORING_RESCORE_CHUNK_SIZE])
+            if not instances:
+                break
+            last_pk = instances[-1].pk
+
+            changed = []
+            breakdowns = []
+            for instance, (values, matched) in zip(
+                instances, plan.evaluate_many(instances)
+            ):
+                score = plan.get_score(matched)
+                if getattr(instance, score_field) != score:
+                    setattr(instance, score_field, score)
+                    changed.append(instance)
+                breakdowns.append(
+                    _get_breakdown_row(instance, plan.version, matched, values)
+                )
+            if changed:
+                now = timezone.now()
+                for instance in changed:
+                    instance.updated_at = now
+                model.all_objects.bulk_update(changed, [score_field, "updated_at"])
+                records_bulk_changed.send(
+                    sender=model, pks=[instance.pk for instance in changed]
+                )
+            if plan.criteria:
+                _save_breakdown_rows(breakdowns)
+
+            progress["done"] += len(instances)
+            progress["changed"] += len(changed)
+            _set_progress(module, company_id, **progress)
+            if on_progress:
+                on_progress(progress)
+
+    progress["status"] = "done"
+    _set_progress(module, company_id, **progress)
+    logger.info(
+        f"Rescored {progress['done']} {module} records, {progress['changed']} changed"
+    )
+    return progress
+
+
+def _get_breakdown_row(instance, version, matched, values):
+    return ScoreBreakdown(
+        content_type=ContentType.objects.get_for_model(type(instance)),
+        object_id=instance.pk,
+        rule_version=version,
+        criteria=matched,
+        field_values=values,
+    )
+
+
+def _save_breakdown_rows(rows):
+    ScoreBreakdown.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=["content_type", "object_id"],
+        update_fields=["rule_version", "criteria", "field_values"],
+    )
+
+
+def score_instance(instance, update_fields=None):
+    """
+    Set the score of ``instance`` before it is saved. The criteria matched
+    when the record was last scored with the same rules are reused for the
+    criteria whose fields did not change, and nothing is evaluated when
+    ``update_fields`` saves none of the fields the rules read.
+    """
+    instance.__dict__.pop("_score_breakdown", None)
+    score_field = get_score_field(type(instance))
+    plan = get_scoring_plan(instance._meta.model_name)
+    if (
+        update_fields is not None
+        and instance.pk is not None
+        and score_field not in update_fields
+        and not set(plan.fields).intersection(update_fields)
+    ):
+        return
+
+    if not plan.criteria:
+        setattr(instance, score_field, 0)
+        return
+
+    values = plan.get_values(instance)
+    previous = None
+    if instance.pk is not None:
+        previous = (
+            ScoreBreakdown.objects.filter(
+                content_type=ContentType.objects.get_for_model(type(instance)),
+                object_id=instance.pk,
+                rule_version=plan.version,
+            )
+            .values_list("field_values", "criteria")
+            .first()
+        )
+    matched = plan.get_matched_criteria(values, previous)
+    setattr(instance, score_field, plan.get_score(matched))
+    if previous != (values, matched):
+        instance._score_breakdown = (plan.version, matched, values)
+
+
+def save_score_breakdown(sender, instance, **kwargs):
+    """Store the score breakdown computed by ``score_instance`` once saved."""
+    breakdown = instance.__dict__.pop("_score_breakdown", None)
+    if breakdown is not None:
+        _save_breakdown_rows([_get_breakdown_row(instance, *breakdown)])
+
+
+def delete_score_breakdown(sender, instance, **kwargs):
+    """Drop the score breakdown of a deleted record."""
+    ScoreBreakdown.objects.filter(
+        content_type=ContentType.objects.get_for_model(sender),
+        object_id=instance.pk,
+    ).delete()
+
+
+def get_score_breakdown(instance):
+    """
+    ``[{"name": ..., "points": ...}]`` of the criteria the score of
+    ``instance`` is made of, read from its stored breakdown when it is
+    up to date with the rules, evaluated otherwise.
+    """
+    plan = get_scoring_plan(instance._meta.model_name)
+    if not plan.criteria:
+        return []
+    matched = (
+        ScoreBreakdown.objects.filter(
+            content_type=ContentType.objects.get_for_model(type(instance)),
+            object_id=instance.pk,
+            rule_version=plan.version,
+        )
+        .values_list("criteria", flat=True)
+        .first()
+    )
+    if matched is None:
+        matched = plan.get_matched_criteria(plan.get_values(instance))
+    return [
+        {"name": plan.names[criterion_id], "points": plan.points[criterion_id]}
+        for criterion_id in matched
+        if criterion_id in plan.points
+    ]
@@ -5,11 +5,7 @@ Handles automatic updates when company-related events occur, e.g., currency chan
 
 import logging
 
-from django.apps import apps
-from django.core.exceptions import FieldDoesNotExist
-from django.db import transaction
-from django.db.models import Case, F, IntegerField, Q, When
-from django.db.models.signals import post_save, pre_delete
+from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import Signal, receiver
 from django.http import HttpResponse
 from django.urls import reverse_lazy
@@ -22,6 +18,14 @@ from horilla_crm.leads.models import (
     ScoringCriterion,
     ScoringRule,
 )
+from horilla_crm.leads.scoring import (
+    SCORE_FIELDS,
+    delete_score_breakdown,
+    get_models_for_module,
+    invalidate_scoring_rules,
+    save_score_breakdown,
+    schedule_rescoring,
+)
 from horilla_keys.models import ShortcutKey
 
 logger = logging.getLogger(__name__)
@@ -98,175 +102,15 @@ def create_leads_shortcuts(sender, instance, created, **kwargs):
             )
 
 
-def get_score_field(model):
-    score_fields = {
-        "lead": "lead_score",
-        "opportunity": "opportunity_score",
-        "account": "account_score",
-        "contact": "contact_score",
-    }
-    return score_fields.get(model._meta.model_name)
-
-
-def get_models_for_module(module):
-    """
-    Dynamically find models matching a module name (e.g., 'lead') across installed apps.
-    Only includes models that have a corresponding score field.
-    """
-    models = []
-    for app_config in apps.get_app_configs():
-        for model in app_config.get_models():
-            if model._meta.model_name == module:
-                score_field = get_score_field(model)
-                if score_field and score_field in [f.name for f in model._meta.fields]:
-                    models.append(model)
-    return models
-
-
-def build_query_from_conditions(criterion, Model):
-    """
-    Build a Django ORM query to filter instances that match a criterion's conditions.
-
-    Args:
-        criterion: ScoringCriterion instance.
-        Model: The Django model class (e.g., Lead).
-
-    Returns:
-        Q object representing the combined conditions.
-    """
-    query = Q()
-    for condition in criterion.conditions.all().order_by("order"):
-        field = condition.field
-        operator = condition.operator
-        value = condition.value
-        logical_operator = condition.logical_operator
-
-        try:
-            Model._meta.get_field(field)
-            if operator == "equals":
-                if Model._meta.get_field(field).get_internal_type() == "ForeignKey":
-                    condition_query = Q(**{f"{field}_id__exact": value})
-                else:
-                    condition_query = Q(**{f"{field}__exact": value})
-            elif operator == "not_equals":
-                if Model._meta.get_field(field).get_internal_type() == "ForeignKey":
-                    condition_query = ~Q(**{f"{field}_id__exact": value})
-                else:
-                    condition_query = ~Q(**{f"{field}__exact": value})
-            elif operator == "contains":
-                condition_query = Q(**{f"{field}__icontains": value})
-            elif operator == "not_contains":
-                condition_query = ~Q(**{f"{field}__icontains": value})
-            elif operator == "starts_with":
-                condition_query = Q(**{f"{field}__istartswith": value})
-            elif operator == "ends_with":
-                condition_query = Q(**{f"{field}__iendswith": value})
-            elif operator == "greater_than":
-                try:
-                    condition_query = Q(**{f"{field}__gt": float(value)})
-                except (ValueError, TypeError):
-                    condition_query = Q(pk__in=[])
-            elif operator == "greater_than_equal":
-                try:
-                    condition_query = Q(**{f"{field}__gte": float(value)})
-                except (ValueError, TypeError):
-                    condition_query = Q(pk__in=[])
-            elif operator == "less_than":
-                try:
-                    condition_query = Q(**{f"{field}__lt": float(value)})
-                except (ValueError, TypeError):
-                    condition_query = Q(pk__in=[])
-            elif operator == "less_than_equal":
-                try:
-                    condition_query = Q(**{f"{field}__lte": float(value)})
-                except (ValueError, TypeError):
-                    condition_query = Q(pk__in=[])
-            elif operator == "is_empty":
-                condition_query = Q(**{field: None}) | Q(**{f"{field}__exact": ""})
-            elif operator == "is_not_empty":
-                condition_query = ~Q(**{field: None}) & ~Q(**{f"{field}__exact": ""})
-            else:
-                logger.warning(f"Unsupported operator {operator} for field {field}")
-                condition_query = Q(pk__in=[])
-            if logical_operator == "and":
-                query &= condition_query
-            else:
-                query |= condition_query
-        except FieldDoesNotExist:
-            logger.warning(f"Field {field} does not exist on {Model._meta.model_name}")
-            query &= Q(pk__in=[])
-
-    return query
-
-
-def update_all_scores_for_module(module):
-    """
-    Update score fields for instances matching active scoring rules' conditions
-    using direct database UPDATE queries.
-
-    Args:
-        module: String (e.g., 'lead', 'opportunity') indicating the module.
-    """
-    models = get_models_for_module(module)
-    for Model in models:
-        score_field = get_score_field(Model)
-        if not score_field:
-            continue
-
-        with transaction.atomic():
-            try:
-                Model.objects.update(**{score_field: 0})
-                logger.info(
-                    f"Reset {score_field} to 0 for all {Model._meta.model_name} instances"
-                )
-            except Exception as e:
-                logger.error(
-                    f"Error resetting {score_field} for {Model._meta.model_name}: {e}"
-                )
-                raise
-
-            rules = ScoringRule.objects.filter(module=module, is_active=True)
-            if not rules.exists():
-                continue
-
-            for rule in rules:
-                for criterion in rule.criteria.all().order_by("order"):
-                    query = build_query_from_conditions(criterion, Model)
-                    if not query:
-                        continue
-
-                    points = criterion.points
-                    if criterion.operation_type == "sub":
-                        points = -points
-
-                    try:
-                        Model.objects.filter(query).update(
-                            **{
-                                score_field: Case(
-                                    When(query, then=F(score_field) + points),
-                                    default=F(score_field),
-                                    output_field=IntegerField(),
-                                )
-                            }
-                        )
-                        logger.info(
-                            f"Updated {score_field} for {Model._meta.model_name} instances matching criterion {criterion.id}"
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Error updating {score_field} for {Model._meta.model_name} with criterion {criterion.id}: {e}"
-                        )
-                        raise
-
-
 @receiver(post_save, sender=ScoringRule)
 @receiver(pre_delete, sender=ScoringRule)
 def handle_rule_change(sender, instance, **kwargs):
     """
     Signal handler triggered when a scoring rule is created, updated, or deleted.
-    Automatically triggers recalculation of all scores for the associated module.
+    Schedules the recalculation of all scores for the associated module.
     """
-    update_all_scores_for_module(instance.module)
+    invalidate_scoring_rules()
+    schedule_rescoring(instance.module)
 
 
 @receiver(post_save, sender=ScoringCriterion)
@@ -274,9 +118,10 @@ def handle_rule_change(sender, instance, **kwargs):
 def handle_criterion_change(sender, instance, **kwargs):
     """
     Signal handler triggered when a scoring criterion is created, updated, or deleted.
-    Ensures scores are recalculated for all modules affected by this criterion.
+    Schedules the recalculation of scores for the module of this criterion.
     """
-    update_all_scores_for_module(instance.rule.module)
+    invalidate_scoring_rules()
+    schedule_rescoring(instance.rule.module)
 
 
 @receiver(post_save, sender=ScoringCondition)
@@ -284,6 +129,23 @@ def handle_criterion_change(sender, instance, **kwargs):
 def handle_condition_change(sender, instance, **kwargs):
     """
     Signal handler triggered when a scoring condition is created, updated, or deleted.
-    Rebuilds and applies scoring rules to update scores for affected module instances.
+    Schedules the recalculation of scores for the module of this condition.
     """
-    update_all_scores_for_module(instance.criterion.rule.module)
+    invalidate_scoring_rules()
+    schedule_rescoring(instance.criterion.rule.module)
+
+
+# Connected per scored model: a receiver for every sender would stop Django
+# from fast-deleting cascaded rows of unrelated models.
+for scored_module in SCORE_FIELDS:
+    for scored_model in get_models_for_module(scored_module):
+        post_save.connect(
+            save_score_breakdown,
+            sender=scored_model,
+            dispatch_uid=f"score_breakdown_save_{scored_model._meta.label_lower}",
+        )
+        post_delete.connect(
+            delete_score_breakdown,
+            sender=scored_model,
+            dispatch_uid=f"score_breakdown_delete_{scored_model._meta.label_lower}",
+        )
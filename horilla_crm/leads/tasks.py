@@ -14,6 +14,24 @@ from .models import EmailToLeadConfig, Lead, LeadStatus
 logger = logging.getLogger(__name__)
 
 
+@shared_task(bind=True)
+def rescore_module_task(self, module, company_id, token):
+    """
+    Recompute the scores of a module after its scoring rules changed,
+    unless a later rule edit queued another run.
+    """
+    from horilla_crm.leads.scoring import is_rescoring_superseded, rescore_module
+
+    if is_rescoring_superseded(module, company_id, token):
+        return {"status": "superseded"}
+
+    def on_progress(progress):
+        if self.request.id:
+            self.update_state(state="PROGRESS", meta=progress)
+
+    return rescore_module(module, company_id, token, on_progress=on_progress)
+
+
 @shared_task
 def fetch_emails_to_leads():
     """Fetch today's emails from all configured email accounts and create Leads."""
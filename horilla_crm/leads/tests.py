@@ -1,3 +1,113 @@
-from django.test import TestCase
+from unittest import mock
+
+from django.test import RequestFactory, TestCase
+
+from horilla_core.models import HorillaUser
+from horilla_crm.leads import scoring
+from horilla_crm.leads.models import (
+    Lead,
+    LeadStatus,
+    ScoreBreakdown,
+    ScoringCondition,
+    ScoringCriterion,
+    ScoringRule,
+)
+from horilla_utils.middlewares import (
+    get_current_request,
+    reset_current_request,
+    set_current_request,
+)
 
 # Create your leads tests here.
+
+
+class ScoreBreakdownVersionTest(TestCase):
+    """
+    Score breakdowns written by one process (the rescoring worker) must be
+    reused by the others, so their rule version has to be the same in
+    every process.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = HorillaUser.objects.create_user(
+            "scorer", "scorer@example.com", "password"
+        )
+        cls.status = LeadStatus.all_objects.create(
+            name="New", order=1, probability=10
+        )
+        rule = ScoringRule.all_objects.create(
+            name="Leads", module="lead", is_active=True
+        )
+        for order, (name, field, operator, value, points) in enumerate(
+            [
+                ("Has title", "title", "is_not_empty", "", 5),
+                ("New status", "lead_status", "equals", "New", 2),
+                ("In Paris", "city", "equals", "Paris", 1),
+            ],
+            start=1,
+        ):
+            criterion = ScoringCriterion.all_objects.create(
+                rule=rule,
+                name=name,
+                points=points,
+                operation_type="add",
+                order=order,
+            )
+            ScoringCondition.all_objects.create(
+                criterion=criterion,
+                field=field,
+                operator=operator,
+                value=value,
+                order=1,
+            )
+        cls.lead = Lead.all_objects.create(
+            lead_owner=cls.owner,
+            lead_status=cls.status,
+            title="Buyer",
+            first_name="Ada",
+            last_name="Lovelace",
+            email="ada@example.com",
+            lead_source="email",
+            lead_company="Engines",
+        )
+
+    def start_process(self):
+        """Forget everything a process keeps and start a new request."""
+        scoring.invalidate_scoring_rules()
+        token = set_current_request(RequestFactory().get("/"))
+        self.addCleanup(reset_current_request, token)
+
+    def test_rescored_breakdown_is_reused_by_other_processes(self):
+        ScoreBreakdown.objects.all().delete()
+        scoring.invalidate_scoring_rules()
+        scoring.rescore_module("lead")
+        breakdown = ScoreBreakdown.objects.get(object_id=self.lead.pk)
+
+        self.start_process()
+        self.assertEqual(breakdown.rule_version, scoring.get_scoring_rule_version())
+        lead = Lead.all_objects.get(pk=self.lead.pk)
+        with mock.patch.object(
+            scoring.ScoringPlan,
+            "matches",
+            autospec=True,
+            side_effect=scoring.ScoringPlan.matches,
+        ) as matches:
+            self.assertEqual(
+                [item["points"] for item in scoring.get_score_breakdown(lead)], [5, 2]
+            )
+            self.assertEqual(matches.call_count, 0)
+            lead.city = "Paris"
+            lead.save()
+            self.assertEqual(matches.call_count, 1)
+        self.assertEqual(lead.lead_score, 8)
+
+        self.start_process()
+        breakdown.refresh_from_db()
+        self.assertEqual(breakdown.rule_version, scoring.get_scoring_rule_version())
+        self.assertEqual(len(breakdown.criteria), 3)
+
+    def test_request_context_is_reset(self):
+        self.start_process()
+        self.doCleanups()
+        self.assertIsNone(get_current_request())
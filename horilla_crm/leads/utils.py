@@ -1,4 +1,4 @@
-from horilla_crm.leads.models import ScoringRule
+from horilla_crm.leads.scoring import get_scoring_plan
 
 
 def compute_score(instance):
@@ -13,21 +13,24 @@ def compute_score(instance):
         int: The computed score (sum of points from matching criteria).
 
     Logic:
-        - Filters active rules for the instance's module (e.g., 'lead').
+        - Uses the compiled plan of the active rules for the instance's module
+          (e.g., 'lead'), so no queries are made once the plan is compiled.
         - For each rule, evaluates criteria in order.
         - If a criterion's conditions are met, adds/subtracts points based on operation_type.
         - Returns the total score.
     """
     module = instance._meta.model_name  # e.g., 'lead', 'opportunity'
-    rules = ScoringRule.objects.filter(module=module, is_active=True)
-    score = 0
-
-    for rule in rules:
-        for criterion in rule.criteria.all().order_by("order"):
-            if criterion.evaluate_conditions(instance):
-                points = criterion.points
-                if criterion.operation_type == "sub":
-                    points = -points
-                score += points
-
-    return score
+    return get_scoring_plan(module).score(instance)
+
+
+def compute_scores(instances):
+    """
+    Compute the scores of a list of instances of one model at once.
+
+    Returns:
+        list: The scores, in the order of ``instances``.
+    """
+    if not instances:
+        return []
+    module = instances[0]._meta.model_name
+    return get_scoring_plan(module).score_many(list(instances))
@@ -30,6 +30,7 @@ from horilla_crm.leads.forms import (  # type: ignore
     LeadFormClass,
     LeadSingleForm,
 )
+from horilla_crm.leads.mixins import ScoreBreakdownMixin
 from horilla_crm.leads.models import Lead, LeadStatus
 from horilla_crm.opportunities.models import (
     Opportunity,
@@ -131,6 +132,7 @@ class LeadListView(LoginRequiredMixin, HorillaListView):
     search_url = reverse_lazy("leads:leads_list")
     main_url = reverse_lazy("leads:leads_view")
     max_visible_actions = 5
+    keyset_pagination = True
     bulk_update_fields = [
         "annual_revenue",
         "no_of_employees",
@@ -357,15 +359,15 @@ class LeadKanbanView(LoginRequiredMixin, HorillaKanbanView):
         if group_by == "lead_status" and "grouped_items" in context:
             filtered_grouped_items = {}
             num_columns = 0
+            final_stage_ids = set(
+                LeadStatus.objects.filter(
+                    pk__in=[key for key in context["grouped_items"] if key is not None],
+                    is_final=True,
+                ).values_list("pk", flat=True)
+            )
 
             for key, group_data in context["grouped_items"].items():
-                is_final_stage = False
-                if key is not None:
-                    try:
-                        lead_status = LeadStatus.objects.get(pk=key)
-                        is_final_stage = lead_status.is_final
-                    except LeadStatus.DoesNotExist:
-                        pass
+                is_final_stage = key in final_stage_ids
 
                 if not is_final_stage:
                     filtered_grouped_items[key] = group_data
@@ -483,7 +485,9 @@ class LeadDetailView(RecentlyViewedMixin, LoginRequiredMixin, HorillaDetailView)
     permission_required_or_denied(["leads.view_lead", "leads.view_own_lead"]),
     name="dispatch",
 )
-class LeadsDetailTab(LoginRequiredMixin, HorillaDetailSectionView):
+class LeadsDetailTab(
+    ScoreBreakdownMixin, LoginRequiredMixin, HorillaDetailSectionView
+):
     """Lead Detail Tab View"""
 
     model = Lead
@@ -24,7 +24,7 @@ from horilla_core.models import (
 from horilla_crm.accounts.models import Account
 from horilla_crm.campaigns.models import Campaign
 from horilla_crm.contacts.models import Contact
-from horilla_crm.leads.utils import compute_score
+from horilla_crm.leads.scoring import score_instance
 from horilla_utils.methods import render_template
 from horilla_utils.middlewares import _thread_local
 
@@ -476,7 +476,7 @@ def update_opportunity_score(sender, instance, **kwargs):
     """
     Computes and updates the opportunity score before saving the Opportunity instance.
     """
-    instance.opportunity_score = compute_score(instance)
+    score_instance(instance, kwargs.get("update_fields"))
 
 
 class OpportunityContactRole(HorillaCoreModel):
@@ -764,27 +764,37 @@ class OpportunitySettings(HorillaCoreModel):
         return settings
 
     @classmethod
-    def is_team_selling_enabled(cls, company=None):
-        """Quick check if team selling is enabled for a company"""
+    def get_active_settings(cls):
+        """
+        Settings of the active company, or None. Looked up once per request,
+        as the menus check them on every page.
+        """
         request = getattr(_thread_local, "request", None)
         company = getattr(request, "active_company", None)
-        settings = cls.objects.filter(company=company).first()
+        if request is None:
+            return cls.objects.filter(company=company).first()
+        active_settings = request.__dict__.setdefault("_opportunity_settings", {})
+        key = getattr(company, "pk", None)
+        if key not in active_settings:
+            active_settings[key] = cls.objects.filter(company=company).first()
+        return active_settings[key]
+
+    @classmethod
+    def is_team_selling_enabled(cls, company=None):
+        """Quick check if team selling is enabled for a company"""
+        settings = cls.get_active_settings()
         return settings.team_selling_enabled if settings else False
 
     @classmethod
     def is_split_enabled(cls, company=None):
         """Quick check if splits are enabled for a company"""
-        request = getattr(_thread_local, "request", None)
-        company = getattr(request, "active_company", None)
-        settings = cls.objects.filter(company=company).first()
+        settings = cls.get_active_settings()
         return settings.split_enabled if settings else False
 
     @classmethod
     def allow_all_users_in_splits_enabled(cls, company=None):
         """Quick check if all users can be added in splits for a company"""
-        request = getattr(_thread_local, "request", None)
-        company = getattr(request, "active_company", None)
-        settings = cls.objects.filter(company=company).first()
+        settings = cls.get_active_settings()
         return settings.allow_all_users_in_splits if settings else False
 
     def save(self, *args, **kwargs):
@@ -800,6 +810,9 @@ class OpportunitySettings(HorillaCoreModel):
                 pass
 
         super().save(*args, **kwargs)
+        request = getattr(_thread_local, "request", None)
+        if request is not None:
+            request.__dict__.pop("_opportunity_settings", None)
 
         # Create default split types when splits are enabled for the first time
         if self.split_enabled and (is_new or old_split_enabled is False):
@@ -16,6 +16,7 @@ from horilla_core.decorators import (
 )
 from horilla_core.utils import is_owner
 from horilla_crm.contacts.models import ContactAccountRelationship
+from horilla_crm.leads.mixins import ScoreBreakdownMixin
 from horilla_crm.opportunities.filters import OpportunityFilter
 from horilla_crm.opportunities.forms import OpportunityFormClass, OpportunitySingleForm
 from horilla_crm.opportunities.models import (
@@ -491,7 +492,9 @@ class OpportunityDetailViewTabView(LoginRequiredMixin, HorillaDetailTabView):
     ),
     name="dispatch",
 )
-class OpportunityDetailTab(LoginRequiredMixin, HorillaDetailSectionView):
+class OpportunityDetailTab(
+    ScoreBreakdownMixin, LoginRequiredMixin, HorillaDetailSectionView
+):
 
     model = Opportunity
     non_editable_fields = ["expected_revenue"]
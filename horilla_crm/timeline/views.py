@@ -3,8 +3,10 @@
 import datetime
 import json
 
+from asgiref.sync import sync_to_async
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db.models import Q
 from django.http import HttpResponse, JsonResponse
 from django.shortcuts import render
 from django.urls import reverse_lazy
@@ -19,6 +21,7 @@ from django.views.generic import TemplateView
 from horilla_core.decorators import htmx_required, permission_required_or_denied
 from horilla_core.utils import get_user_field_permission
 from horilla_crm.activity.models import Activity
+from horilla_generics.mixins import AsyncLoginRequiredMixin
 from horilla_generics.views import HorillaSingleDeleteView, HorillaSingleFormView
 from horilla_utils.middlewares import _thread_local
 
@@ -141,14 +144,88 @@ class SaveCalendarPreferencesView(LoginRequiredMixin, View):
             return JsonResponse({"status": "error", "message": str(e)}, status=500)
 
 
-class GetCalendarEventsView(LoginRequiredMixin, View):
+class GetCalendarEventsView(AsyncLoginRequiredMixin, View):
     """View to fetch calendar events based on user preferences."""
 
-    def get(self, request, *args, **kwargs):
+    def get_activity_event(self, activity):
+        """Calendar event of an activity whose assignees are prefetched."""
+        event = {
+            "title": activity.title or activity.subject,
+            "start": (
+                activity.get_start_date().isoformat()
+                if not isinstance(activity.get_start_date(), str)
+                else activity.created_at.isoformat()
+            ),
+            "end": (
+                activity.get_end_date().isoformat()
+                if not isinstance(activity.get_end_date(), str)
+                and activity.get_end_date()
+                else None
+            ),
+            "calendarType": activity.activity_type,
+            "description": activity.description or "",
+            "subject": activity.subject or "",
+            "assignedTo": [
+                {
+                    "id": user.id,
+                    "first_name": user.first_name,
+                    "last_name": user.last_name,
+                    "email": user.email,
+                }
+                for user in activity.assigned_to.all()
+            ],
+            "status": activity.status,
+            "id": activity.id,
+            "url": (
+                activity.get_activity_edit_url()
+                if activity.activity_type != "email"
+                else None
+            ),
+            "deleteUrl": (
+                activity.get_delete_url() if activity.activity_type != "email" else None
+            ),
+            "detailUrl": (
+                activity.get_detail_url() if activity.activity_type != "email" else None
+            ),
+            "textColor": "#FFFFFF",
+        }
+        if activity.activity_type in ["event", "meeting"] and activity.is_all_day:
+            event["allDay"] = True
+        return event
+
+    def get_unavailability_event(self, unavailability):
+        """Calendar event of a user unavailability."""
+        return {
+            "title": "User Unavailable",
+            "start": unavailability.from_datetime.isoformat(),
+            "end": (
+                unavailability.to_datetime.isoformat()
+                if unavailability.to_datetime
+                else None
+            ),
+            "calendarType": "unavailability",
+            "description": unavailability.reason or "No reason provided",
+            "id": f"unavailability_{unavailability.id}",
+            "url": (
+                unavailability.update_mark_unavailability_url()
+                if unavailability.pk
+                else None
+            ),
+            "deleteUrl": (
+                unavailability.delete_mark_unavailability_url()
+                if unavailability.pk
+                else None
+            ),
+            "backgroundColor": "#F51414",
+            "borderColor": "#F51414",
+            "textColor": "#FFFFFF",
+        }
+
+    async def get(self, request, *args, **kwargs):
         """Handle AJAX GET request to fetch calendar events."""
 
         if not request.headers.get("X-Requested-With") == "XMLHttpRequest":
-            return render(request, "error/405.html", status=405)
+            return await sync_to_async(render)(request, "error/405.html", status=405)
 
         try:
             selected_types = request.GET.getlist("calendar_types[]")
@@ -156,114 +233,44 @@ class GetCalendarEventsView(LoginRequiredMixin, View):
                 return JsonResponse({"status": "success", "events": []})
 
             if not selected_types:
-                selected_types = UserCalendarPreference.objects.filter(
-                    user=request.user, is_selected=True
-                ).values_list("calendar_type", flat=True)
+                selected_types = [
+                    calendar_type
+                    async for calendar_type in UserCalendarPreference.objects.filter(
+                        user=request.user, is_selected=True
+                    ).values_list("calendar_type", flat=True)
+                ]
                 if not selected_types:
                     selected_types = ["task", "event", "meeting", "unavailability"]
 
             events = []
-            if selected_types:
-                # Fetch Activity events
-                activity_types = [t for t in selected_types if t != "unavailability"]
-                if activity_types:
-                    activities = (
-                        Activity.objects.filter(
-                            activity_type__in=activity_types,
-                            assigned_to=request.user,
-                        )
-                        | Activity.objects.filter(
-                            activity_type__in=activity_types, participants=request.user
-                        )
-                        | Activity.objects.filter(
-                            activity_type__in=activity_types, owner=request.user
-                        )
-                        | Activity.objects.filter(
-                            activity_type__in=activity_types, meeting_host=request.user
-                        )
+            # Fetch Activity events
+            activity_types = [t for t in selected_types if t != "unavailability"]
+            if activity_types:
+                activities = (
+                    Activity.objects.filter(activity_type__in=activity_types)
+                    .filter(
+                        Q(assigned_to=request.user)
+                        | Q(participants=request.user)
+                        | Q(owner=request.user)
+                        | Q(meeting_host=request.user)
                     )
+                    .distinct()
+                    .prefetch_related("assigned_to")
+                )
+                events.extend(
+                    [self.get_activity_event(activity) async for activity in activities]
+                )
 
-                    for activity in activities.distinct():
-                        event = {
-                            "title": activity.title or activity.subject,
-                            "start": (
-                                activity.get_start_date().isoformat()
-                                if not isinstance(activity.get_start_date(), str)
-                                else activity.created_at.isoformat()
-                            ),
-                            "end": (
-                                activity.get_end_date().isoformat()
-                                if not isinstance(activity.get_end_date(), str)
-                                and activity.get_end_date()
-                                else None
-                            ),
-                            "calendarType": activity.activity_type,
-                            "description": activity.description or "",
-                            "subject": activity.subject or "",
-                            "assignedTo": list(
-                                activity.assigned_to.values(
-                                    "id", "first_name", "last_name", "email"
-                                )
-                            ),
-                            "status": activity.status,
-                            "id": activity.id,
-                            "url": (
-                                activity.get_activity_edit_url()
-                                if activity.activity_type != "email"
-                                else None
-                            ),
-                            "deleteUrl": (
-                                activity.get_delete_url()
-                                if activity.activity_type != "email"
-                                else None
-                            ),
-                            "detailUrl": (
-                                activity.get_detail_url()
-                                if activity.activity_type != "email"
-                                else None
-                            ),
-                            "textColor": "#FFFFFF",
-                        }
-                        if (
-                            activity.activity_type in ["event", "meeting"]
-                            and activity.is_all_day
-                        ):
-                            event["allDay"] = True
-                        events.append(event)
-
-                # Fetch UserAvailability events if selected
-                if "unavailability" in selected_types:
-                    unavailabilities = UserAvailability.objects.filter(
-                        user=self.request.user
-                    )
-                    for unavailability in unavailabilities:
-                        event = {
-                            "title": "User Unavailable",
-                            "start": unavailability.from_datetime.isoformat(),
-                            "end": (
-                                unavailability.to_datetime.isoformat()
-                                if unavailability.to_datetime
-                                else None
-                            ),
-                            "calendarType": "unavailability",
-                            "description": unavailability.reason
-                            or "No reason provided",
-                            "id": f"unavailability_{unavailability.id}",
-                            "url": (
-                                unavailability.update_mark_unavailability_url()
-                                if unavailability.pk
-                                else None
-                            ),
-                            "deleteUrl": (
-                                unavailability.delete_mark_unavailability_url()
-                                if unavailability.pk
-                                else None
-                            ),
-                            "backgroundColor": "#F51414",
-                            "borderColor": "#F51414",
-                            "textColor": "#FFFFFF",
-                        }
-                        events.append(event)
+            # Fetch UserAvailability events if selected
+            if "unavailability" in selected_types:
+                events.extend(
+                    [
+                        self.get_unavailability_event(unavailability)
+                        async for unavailability in UserAvailability.objects.filter(
+                            user=request.user
+                        )
+                    ]
+                )
 
             return JsonResponse({"status": "success", "events": events})
         except Exception as e:
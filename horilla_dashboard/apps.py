@@ -44,6 +44,15 @@ class HorillaDashboardConfig(AppConfig):
 
             __import__("horilla_dashboard.menu")
             __import__("horilla_dashboard.signals")
+
+            from django.conf import settings
+
+            from .celery_schedules import HORILLA_DASHBOARD_BEAT_SCHEDULE
+
+            if not hasattr(settings, "CELERY_BEAT_SCHEDULE"):
+                settings.CELERY_BEAT_SCHEDULE = {}
+
+            settings.CELERY_BEAT_SCHEDULE.update(HORILLA_DASHBOARD_BEAT_SCHEDULE)
         except Exception as e:
             import logging
 
@@ -0,0 +1,8 @@
+from celery.schedules import crontab
+
+HORILLA_DASHBOARD_BEAT_SCHEDULE = {
+    "refresh-dashboard-snapshots": {
+        "task": "horilla_dashboard.tasks.refresh_dashboard_snapshots",
+        "schedule": crontab(minute="*"),
+    },
+}
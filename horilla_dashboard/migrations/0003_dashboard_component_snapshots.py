@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:56
+
+import django.core.serializers.json
+import django.core.validators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('horilla_core', '0005_alter_department_department_name_and_more'),
+        ('horilla_dashboard', '0002_alter_componentcriteria_operator'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dashboardcomponent',
+            name='refresh_interval',
+            field=models.PositiveIntegerField(blank=True, help_text='Show precomputed results refreshed in the background at this interval. Leave empty to compute the results on every view.', null=True, validators=[django.core.validators.MinValueValidator(1)], verbose_name='Refresh Interval (Minutes)'),
+        ),
+        migrations.CreateModel(
+            name='DashboardComponentSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(max_length=50, verbose_name='Permission Scope')),
+                ('data', models.JSONField(blank=True, encoder=django.core.serializers.json.DjangoJSONEncoder, null=True, verbose_name='Data')),
+                ('computed_at', models.DateTimeField(verbose_name='Computed At')),
+                ('company', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='horilla_core.company', verbose_name='Company')),
+                ('component', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='snapshots', to='horilla_dashboard.dashboardcomponent', verbose_name='Component')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='dashboard_snapshots', to=settings.AUTH_USER_MODEL, verbose_name='Computed For')),
+            ],
+            options={
+                'verbose_name': 'Dashboard Component Snapshot',
+                'verbose_name_plural': 'Dashboard Component Snapshots',
+                'unique_together': {('component', 'company', 'scope')},
+            },
+        ),
+    ]
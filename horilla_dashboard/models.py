@@ -5,6 +5,7 @@ import logging
 
 from django.apps import apps
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import MinValueValidator
 from django.db import models, transaction
 from django.urls import reverse_lazy
@@ -320,6 +321,16 @@ class DashboardComponent(HorillaCoreModel):
         related_name="components",
         verbose_name=_("Component Owner"),
     )
+    refresh_interval = models.PositiveIntegerField(
+        blank=True,
+        null=True,
+        validators=[MinValueValidator(1)],
+        verbose_name=_("Refresh Interval (Minutes)"),
+        help_text=_(
+            "Show precomputed results refreshed in the background at this "
+            "interval. Leave empty to compute the results on every view."
+        ),
+    )
 
     OWNER_FIELDS = ["component_owner"]
 
@@ -485,3 +496,46 @@ class ComponentCriteria(HorillaCoreModel):
 
     def __str__(self):
         return f"{self.component.name} - {self.field} {self.operator} {self.value}"
+
+
+@permission_exempt_model
+class DashboardComponentSnapshot(models.Model):
+    """
+    Precomputed result of a KPI or chart component for one company and
+    permission scope, refreshed by the ``refresh_dashboard_snapshots`` task.
+    """
+
+    component = models.ForeignKey(
+        DashboardComponent,
+        on_delete=models.CASCADE,
+        related_name="snapshots",
+        verbose_name=_("Component"),
+    )
+    company = models.ForeignKey(
+        "horilla_core.Company",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        verbose_name=_("Company"),
+    )
+    scope = models.CharField(max_length=50, verbose_name=_("Permission Scope"))
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="dashboard_snapshots",
+        verbose_name=_("Computed For"),
+    )
+    data = models.JSONField(
+        encoder=DjangoJSONEncoder, null=True, blank=True, verbose_name=_("Data")
+    )
+    computed_at = models.DateTimeField(verbose_name=_("Computed At"))
+
+    class Meta:
+        """Meta class for DashboardComponentSnapshot"""
+
+        unique_together = ("component", "company", "scope")
+        verbose_name = _("Dashboard Component Snapshot")
+        verbose_name_plural = _("Dashboard Component Snapshots")
+
+    def __str__(self):
+        return f"{self.component} ({self.scope})"
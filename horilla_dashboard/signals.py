@@ -1,2 +1,26 @@
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
+
+from horilla_dashboard.models import (
+    ComponentCriteria,
+    DashboardComponent,
+    DashboardComponentSnapshot,
+)
+
+
+@receiver(post_save, sender=DashboardComponent)
+def clear_component_snapshots(sender, instance, **kwargs):
+    """
+    Drop the snapshots of a component whose configuration changed, so the
+    next view computes them again.
+    """
+    DashboardComponentSnapshot.objects.filter(component=instance).delete()
+
+
+@receiver(post_save, sender=ComponentCriteria)
+@receiver(post_delete, sender=ComponentCriteria)
+def clear_component_snapshots_on_condition_change(sender, instance, **kwargs):
+    """Drop the snapshots of a component whose conditions changed."""
+    DashboardComponentSnapshot.objects.filter(
+        component_id=instance.component_id
+    ).delete()
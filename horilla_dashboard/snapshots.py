@@ -0,0 +1,144 @@
+"""
+Precomputed results of dashboard KPI and chart components.
+
+Components with a ``refresh_interval`` are served from a
+``DashboardComponentSnapshot`` instead of being queried on every view. A
+snapshot is stored per component, active company and permission scope, so
+users who may see the same records share it. Snapshots are created on first
+view, kept up to date by the ``refresh_dashboard_snapshots`` beat task and
+recomputed on demand with the "refresh now" action.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.http import QueryDict
+from django.utils import timezone
+
+from horilla_dashboard.models import DashboardComponentSnapshot
+from horilla_utils.middlewares import _thread_local
+
+logger = logging.getLogger(__name__)
+
+# Snapshots older than this many refresh intervals are recomputed when viewed,
+# so components stay usable when the beat scheduler is not running.
+DASHBOARD_SNAPSHOT_STALE_FACTOR = getattr(
+    settings, "DASHBOARD_SNAPSHOT_STALE_FACTOR", 3
+)
+
+
+class SnapshotRequest:
+    """Minimal request used to recompute a snapshot outside of a request."""
+
+    def __init__(self, user, company):
+        self.user = user
+        self.active_company = company
+        self.GET = QueryDict()
+        self.META = {}
+
+
+def get_permission_scope(user, model):
+    """
+    Describe which records of ``model`` the user sees on a dashboard, matching
+    ``get_queryset_for_module``.
+    """
+    app_label = model._meta.app_label
+    model_name = model._meta.model_name
+    if user.has_perm(f"{app_label}.view_{model_name}"):
+        return "all"
+    if user.has_perm(f"{app_label}.view_own_{model_name}"):
+        return f"own:{user.pk}"
+    return "none"
+
+
+def compute_component_data(component, request):
+    """Compute the KPI or chart data of ``component`` for ``request``."""
+    from horilla_dashboard.views import DashboardComponentChartView
+
+    view = DashboardComponentChartView()
+    view.request = request
+    if component.component_type == "kpi":
+        return view.get_kpi_data(component)
+    if component.reports:
+        return view.get_report_chart_data(component)
+    return view.get_chart_data(component)
+
+
+def is_stale(snapshot):
+    """True when the snapshot is older than its component's refresh interval."""
+    interval = timedelta(minutes=snapshot.component.refresh_interval)
+    return snapshot.computed_at <= timezone.now() - interval
+
+
+def get_component_snapshot(component, request, force=False):
+    """
+    Return the snapshot of ``component`` for the current company and the
+    user's permission scope, computing it when missing, when ``force`` is set
+    or when it has not been refreshed for several intervals. Returns None for
+    components without a refresh interval.
+    """
+    if not component.refresh_interval or component.component_type == "table_data":
+        return None
+    model = component.module.model_class() if component.module else None
+    if not model:
+        return None
+
+    company = getattr(request, "active_company", None)
+    scope = get_permission_scope(request.user, model)
+    snapshot = (
+        DashboardComponentSnapshot.objects.filter(
+            component=component, company=company, scope=scope
+        )
+        .select_related("component")
+        .first()
+    )
+    if snapshot and not force:
+        stale_after = timedelta(
+            minutes=component.refresh_interval * DASHBOARD_SNAPSHOT_STALE_FACTOR
+        )
+        if snapshot.computed_at > timezone.now() - stale_after:
+            return snapshot
+
+    snapshot, _created = DashboardComponentSnapshot.objects.update_or_create(
+        component=component,
+        company=company,
+        scope=scope,
+        defaults={
+            "user": request.user,
+            "data": compute_component_data(component, request),
+            "computed_at": timezone.now(),
+        },
+    )
+    return snapshot
+
+
+def refresh_snapshot(snapshot):
+    """
+    Recompute ``snapshot`` as the user it was computed for. Snapshots whose
+    user no longer has the same permission scope are deleted instead; the
+    next view creates a new one.
+    """
+    component = snapshot.component
+    model = component.module.model_class() if component.module else None
+    user = snapshot.user
+    if (
+        not model
+        or not component.is_active
+        or not component.refresh_interval
+        or not user.is_active
+        or get_permission_scope(user, model) != snapshot.scope
+    ):
+        snapshot.delete()
+        return None
+
+    request = SnapshotRequest(user, snapshot.company)
+    _thread_local.request = request
+    try:
+        snapshot.data = compute_component_data(component, request)
+        snapshot.computed_at = timezone.now()
+        snapshot.save(update_fields=["data", "computed_at"])
+    finally:
+        if hasattr(_thread_local, "request"):
+            delattr(_thread_local, "request")
+    return snapshot
@@ -0,0 +1,49 @@
+"""Celery tasks for horilla_dashboard app."""
+
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def refresh_dashboard_snapshots():
+    """
+    Queue a refresh of every component snapshot that is older than its
+    component's refresh interval.
+    """
+    from .models import DashboardComponentSnapshot
+    from .snapshots import is_stale
+
+    snapshots = DashboardComponentSnapshot.objects.filter(
+        component__refresh_interval__isnull=False
+    ).select_related("component")
+
+    queued = 0
+    for snapshot in snapshots:
+        if is_stale(snapshot):
+            refresh_dashboard_snapshot.delay(snapshot.pk)
+            queued += 1
+
+    return f"Queued {queued} dashboard snapshots"
+
+
+@shared_task
+def refresh_dashboard_snapshot(snapshot_id):
+    """Recompute a single dashboard component snapshot."""
+    from .models import DashboardComponentSnapshot
+    from .snapshots import refresh_snapshot
+
+    snapshot = (
+        DashboardComponentSnapshot.objects.filter(pk=snapshot_id)
+        .select_related("component", "component__module", "company", "user")
+        .first()
+    )
+    if not snapshot:
+        return
+    try:
+        refresh_snapshot(snapshot)
+    except Exception as e:
+        logger.error(f"Error refreshing dashboard snapshot {snapshot_id}: {str(e)}")
+        logger.exception(e)
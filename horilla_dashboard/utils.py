@@ -4,8 +4,11 @@ import json
 import logging
 import traceback
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
+from django.conf import settings
 from django.core.paginator import Paginator
+from django.db import connection, connections
 from django.db.models import Q
 
 from horilla_utils.methods import get_section_info_for_model
@@ -13,6 +16,84 @@ from horilla_utils.middlewares import _thread_local
 
 logger = logging.getLogger(__name__)
 
+DASHBOARD_COMPONENT_WORKERS = getattr(settings, "DASHBOARD_COMPONENT_WORKERS", 4)
+
+
+def resolve_group_labels(model, field_name, values):
+    """
+    Map raw group values of ``field_name`` to their display labels.
+
+    Foreign keys are resolved with a single ``in_bulk`` query for all values
+    and choice fields from the field choices; any other value, or a related
+    object that no longer exists, is returned unchanged.
+    """
+    field = model._meta.get_field(field_name)
+    if field.is_relation and field.related_model:
+        pks = {value for value in values if value is not None}
+        related_objects = field.related_model.objects.in_bulk(pks) if pks else {}
+        return {
+            value: (str(related_objects[value]) if value in related_objects else value)
+            for value in values
+        }
+    if getattr(field, "choices", None):
+        choices = dict(field.flatchoices)
+        return {value: choices.get(value, value) for value in values}
+    return {value: value for value in values}
+
+
+def build_components_in_parallel(components, build, request):
+    """
+    Call ``build(component)`` for every component on a thread pool and
+    return ``{component.id: result}``.
+
+    Components are independent of each other, so their queries can run
+    concurrently. Each worker sees the current request through
+    ``_thread_local`` (used by the company filtered managers) and closes its
+    own database connections when done. A component that fails is logged and
+    left out of the result.
+
+    SQLite serialises access to the database anyway, so components are built
+    one after the other there.
+    """
+    components = list(components)
+    if (
+        len(components) <= 1
+        or DASHBOARD_COMPONENT_WORKERS <= 1
+        or connection.vendor == "sqlite"
+    ):
+        results = {}
+        for component in components:
+            try:
+                results[component.id] = build(component)
+            except Exception as e:
+                logger.error(
+                    "Error building dashboard component %s: %s", component.id, e
+                )
+        return results
+
+    def run(component):
+        _thread_local.request = request
+        try:
+            return build(component)
+        finally:
+            del _thread_local.request
+            connections.close_all()
+
+    results = {}
+    max_workers = min(DASHBOARD_COMPONENT_WORKERS, len(components))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            component.id: executor.submit(run, component) for component in components
+        }
+        for component_id, future in futures.items():
+            try:
+                results[component_id] = future.result()
+            except Exception as e:
+                logger.error(
+                    "Error building dashboard component %s: %s", component_id, e
+                )
+    return results
+
 
 class DefaultDashboardGenerator:
     """
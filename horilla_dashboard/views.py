@@ -4,7 +4,9 @@ import json
 import logging
 from urllib.parse import urlencode, urlparse
 
+from asgiref.sync import sync_to_async
 from django.apps import apps
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.views import redirect_to_login
@@ -37,7 +39,7 @@ from horilla_dashboard.models import (
     DashboardComponent,
     DashboardFolder,
 )
-from horilla_generics.mixins import RecentlyViewedMixin
+from horilla_generics.mixins import AsyncLoginRequiredMixin, RecentlyViewedMixin
 from horilla_generics.views import (
     HorillaListView,
     HorillaNavView,
@@ -48,10 +50,17 @@ from horilla_reports.models import Report
 from horilla_utils.methods import get_section_info_for_model
 from horilla_utils.middlewares import _thread_local
 
-from .utils import DefaultDashboardGenerator
+from .snapshots import get_component_snapshot
+from .utils import (
+    DefaultDashboardGenerator,
+    build_components_in_parallel,
+    resolve_group_labels,
+)
 
 logger = logging.getLogger(__name__)
 
+DASHBOARD_LAZY_COMPONENTS = getattr(settings, "DASHBOARD_LAZY_COMPONENTS", True)
+
 
 class HomePageView(LoginRequiredMixin, TemplateView):
     """View to render the home page, showing default or dynamic dashboard."""
@@ -364,6 +373,7 @@ class DashboardDetailView(RecentlyViewedMixin, LoginRequiredMixin, TemplateView)
     """
 
     model = Dashboard
+    lazy_components = DASHBOARD_LAZY_COMPONENTS
 
     def get_template_names(self):
         """
@@ -502,7 +512,8 @@ class DashboardDetailView(RecentlyViewedMixin, LoginRequiredMixin, TemplateView)
                     .order_by("-value")
                 )
 
-            if not chart_data.exists():
+            chart_data = list(chart_data)
+            if not chart_data:
                 return None
 
             labels = []
@@ -511,30 +522,18 @@ class DashboardDetailView(RecentlyViewedMixin, LoginRequiredMixin, TemplateView)
 
             section_info = get_section_info_for_model(model)
 
-            # In get_chart_data method, replace the label handling section:
+            # Display values for choice fields and foreign keys, resolved at once
+            try:
+                group_labels = resolve_group_labels(
+                    model, group_by_field, [item[group_by_field] for item in chart_data]
+                )
+            except Exception:
+                group_labels = {}
 
             for item in chart_data:
-                label_value = item[group_by_field]
-
-                # Handle display value for choice fields and foreign keys
-                try:
-                    field = model._meta.get_field(group_by_field)
-                    if hasattr(field, "choices") and field.choices:
-                        # Handle choice fields - convert key to display value
-                        for choice_value, choice_label in field.choices:
-                            if choice_value == label_value:
-                                label_value = choice_label
-                                break
-                    elif field.is_relation and label_value is not None:
-                        # Handle foreign key fields - get the string representation
-                        related_model = field.related_model
-                        try:
-                            related_obj = related_model.objects.get(pk=label_value)
-                            label_value = str(related_obj)
-                        except related_model.DoesNotExist:
-                            pass
-                except:
-                    pass
+                label_value = group_labels.get(
+                    item[group_by_field], item[group_by_field]
+                )
 
                 labels.append(
                     str(label_value) if label_value is not None else "Unknown"
@@ -543,12 +542,8 @@ class DashboardDetailView(RecentlyViewedMixin, LoginRequiredMixin, TemplateView)
 
                 # For the filter URL, use the original value (key for choices, ID for FK)
                 filter_value = item[group_by_field]
-                try:
-                    field = model._meta.get_field(group_by_field)
-                    if field.is_relation:
-                        filter_value = item.get(f"{group_by_field}_id", filter_value)
-                except:
-                    pass
+                if is_fk:
+                    filter_value = item.get(f"{group_by_field}_id", filter_value)
 
                 query = urlencode(
                     {
@@ -639,7 +634,8 @@ class DashboardDetailView(RecentlyViewedMixin, LoginRequiredMixin, TemplateView)
                     .order_by("-value")
                 )
 
-            if not chart_data.exists():
+            chart_data = list(chart_data)
+            if not chart_data:
                 return None
 
             labels = []
@@ -649,19 +645,18 @@ class DashboardDetailView(RecentlyViewedMixin, LoginRequiredMixin, TemplateView)
             # Get section info for generating filter URLs
             section_info = get_section_info_for_model(model)
 
-            for item in chart_data:
-                label_value = item[group_by_field]
+            # Display values for choice fields and foreign keys, resolved at once
+            try:
+                group_labels = resolve_group_labels(
+                    model, group_by_field, [item[group_by_field] for item in chart_data]
+                )
+            except Exception:
+                group_labels = {}
 
-                # Handle display value for choice fields
-                try:
-                    field = model._meta.get_field(group_by_field)
-                    if hasattr(field, "choices") and field.choices:
-                        for choice_value, choice_label in field.choices:
-                            if choice_value == label_value:
-                                label_value = choice_label
-                                break
-                except:
-                    pass
+            for item in chart_data:
+                label_value = group_labels.get(
+                    item[group_by_field], item[group_by_field]
+                )
 
                 labels.append(
                     str(label_value) if label_value is not None else "Unknown"
@@ -669,12 +664,8 @@ class DashboardDetailView(RecentlyViewedMixin, LoginRequiredMixin, TemplateView)
                 data.append(float(item["value"]) if item["value"] is not None else 0)
 
                 filter_value = item[group_by_field]
-                try:
-                    field = model._meta.get_field(group_by_field)
-                    if field.is_relation:
-                        filter_value = item.get(f"{group_by_field}_id", filter_value)
-                except:
-                    pass
+                if is_fk:
+                    filter_value = item.get(f"{group_by_field}_id", filter_value)
 
                 # Generate filter URL
                 query = urlencode(
@@ -1010,6 +1001,27 @@ class DashboardDetailView(RecentlyViewedMixin, LoginRequiredMixin, TemplateView)
 
         return model, context
 
+    def get_table_contexts(self, components):
+        """
+        Build the table context of every table component, running the
+        components' queries concurrently.
+        """
+        request = self.request
+
+        def build(component):
+            view = DashboardDetailView()
+            view.kwargs = self.kwargs
+            view.object = self.object
+            return view.get_table_data(component, request)
+
+        return {
+            component_id: table_context
+            for component_id, (model, table_context) in build_components_in_parallel(
+                components, build, request
+            ).items()
+            if model
+        }
+
     def post(self, request, *args, **kwargs):
         """Handle POST request for exporting table data from the first table component."""
         dashboard = self.get_object()
@@ -1052,26 +1064,15 @@ class DashboardDetailView(RecentlyViewedMixin, LoginRequiredMixin, TemplateView)
             dashboard=dashboard, is_active=True
         ).order_by("sequence")
 
-        # Process KPI components
-        kpi_data = []
-        for component in components.filter(component_type="kpi"):
-            kpi = self.get_kpi_data(component, self.request)
-            if kpi:
-                kpi_data.append(kpi)
-
-        # Process chart components
-        chart_data = []
-        for component in components.filter(component_type="chart"):
-            chart = self.get_chart_data(component, self.request)
-            if chart:
-                chart_data.append(chart)
-
-        # Process table components
+        # KPI and chart components are fetched by the page through their own
+        # HTMX endpoint (DashboardComponentChartView), table components
+        # through DashboardComponentTableDataView, so the dashboard shell
+        # renders without waiting on any component query.
         table_contexts = {}
-        for component in components.filter(component_type="table_data"):
-            model, table_context = self.get_table_data(component, self.request)
-            if model:
-                table_contexts[component.id] = table_context
+        if not self.lazy_components:
+            table_contexts = self.get_table_contexts(
+                components.filter(component_type="table_data")
+            )
 
         session_referer_key = f"dashboard_detail_referer_{dashboard.pk}"
         current_referer = self.request.META.get("HTTP_REFERER")
@@ -1101,9 +1102,8 @@ class DashboardDetailView(RecentlyViewedMixin, LoginRequiredMixin, TemplateView)
                 "dashboard": dashboard,
                 "components": components,
                 "has_components": components.exists(),
-                "kpi_data": kpi_data,
-                "chart_data": chart_data,
                 "table_contexts": table_contexts,
+                "lazy_components": self.lazy_components,
                 "view_id": "dashboard_components",
                 "is_home_view": is_home_view,
                 "section": section,
@@ -1120,21 +1120,47 @@ class DashboardDetailView(RecentlyViewedMixin, LoginRequiredMixin, TemplateView)
     ),
     name="dispatch",
 )
-class DashboardComponentTableDataView(LoginRequiredMixin, View):
+class DashboardComponentTableDataView(AsyncLoginRequiredMixin, View):
     """
     Handle AJAX requests for table data pagination and search
     """
 
-    def get(self, request, *args, **kwargs):
-        """Handle GET request to return table data for a dashboard component."""
-        component_id = kwargs.get("component_id")
-
+    async def get_component(self, component_id):
+        """The active table component, or None."""
         try:
-            component = DashboardComponent.objects.get(
-                id=component_id, component_type="table_data", is_active=True
-            )
+            return await DashboardComponent.objects.select_related(
+                "module", "dashboard"
+            ).aget(id=component_id, component_type="table_data", is_active=True)
         except DashboardComponent.DoesNotExist:
+            return None
+
+    async def get(self, request, *args, **kwargs):
+        """Handle GET request to return table data for a dashboard component."""
+        component = await self.get_component(kwargs.get("component_id"))
+        if not component:
             return HttpResponse("Component not found", status=404)
+        return await sync_to_async(self.render_table)(request, component)
+
+    async def post(self, request, *args, **kwargs):
+        """Handle bulk operations"""
+        component = await self.get_component(kwargs.get("component_id"))
+        if not component:
+            return HttpResponse("Component not found", status=404)
+        return await sync_to_async(self.bulk_action)(
+            request, component, *args, **kwargs
+        )
+
+    def render_table(self, request, component):
+        """Render a page, search or sort of the table of ``component``."""
+        if "page" not in request.GET:
+            # First page: the lazily loaded table of the dashboard page, or a
+            # search/sort of it, rendered with the full list view context.
+            detail_view = DashboardDetailView()
+            detail_view.kwargs = {"pk": component.dashboard_id}
+            model, table_context = detail_view.get_table_data(component, request)
+            if not model:
+                return HttpResponse("Model not found", status=404)
+            return render(request, "list_view.html", table_context)
 
         # Get model
         model = None
@@ -1291,18 +1317,9 @@ class DashboardComponentTableDataView(LoginRequiredMixin, View):
 
         return render(request, "list_view.html", context)
 
-    def post(self, request, *args, **kwargs):
-        """Handle bulk operations"""
+    def bulk_action(self, request, component, *args, **kwargs):
+        """Run a bulk operation (export) on the table of ``component``."""
         self.request = request
-        component_id = kwargs.get("component_id")
-
-        try:
-            component = DashboardComponent.objects.get(
-                id=component_id, component_type="table_data", is_active=True
-            )
-        except DashboardComponent.DoesNotExist:
-            return HttpResponse("Component not found", status=404)
-
         dashboard_view = DashboardDetailView()
         model, table_context = dashboard_view.get_table_data(component, request)
 
@@ -2144,7 +2161,7 @@ class ChartPreviewView(View):
     ),
     name="dispatch",
 )
-class DashboardComponentChartView(View):
+class DashboardComponentChartView(AsyncLoginRequiredMixin, View):
     """
     View to render chart data for dashboard components using ECharts.
     Handles chart components with ECharts and KPIs with custom HTML.
@@ -2359,35 +2376,30 @@ class DashboardComponentChartView(View):
                 urls = []
                 section_info = get_section_info_for_model(model)
 
-                for item in queryset:
-                    # Get the raw label value
-                    label = item.get(
-                        f"{component.grouping_field}__name"
-                        if field.is_relation
-                        and hasattr(field.remote_field.model, "name")
-                        else component.grouping_field
-                    )
+                label_key = (
+                    f"{component.grouping_field}__name"
+                    if field.is_relation and hasattr(field.remote_field.model, "name")
+                    else component.grouping_field
+                )
+                items = list(queryset)
 
-                    # Convert choice field keys to display values
+                # Convert choice keys and FK ids without a 'name' to display
+                # values with one lookup for the whole chart
+                group_labels = {}
+                if label_key == component.grouping_field:
                     try:
-                        if hasattr(field, "choices") and field.choices:
-                            original_label = label
-                            for choice_value, choice_label in field.choices:
-                                if choice_value == original_label:
-                                    label = choice_label
-                                    break
-                        elif field.is_relation and label is not None:
-                            # For FK fields without 'name' attribute, get string representation
-                            if not hasattr(field.remote_field.model, "name"):
-                                try:
-                                    related_obj = field.remote_field.model.objects.get(
-                                        pk=label
-                                    )
-                                    label = str(related_obj)
-                                except:
-                                    pass
-                    except:
-                        pass
+                        group_labels = resolve_group_labels(
+                            model,
+                            component.grouping_field,
+                            [item.get(label_key) for item in items],
+                        )
+                    except Exception:
+                        group_labels = {}
+
+                for item in items:
+                    # Get the raw label value
+                    label = item.get(label_key)
+                    label = group_labels.get(label, label)
 
                     if isinstance(label, (list, dict)):
                         label = str(label)
@@ -2438,44 +2450,28 @@ class DashboardComponentChartView(View):
             section_info = get_section_info_for_model(model)
 
             if field.is_relation and hasattr(field.remote_field.model, "name"):
-                categories = list(
-                    queryset.values_list(f"{component.grouping_field}__name", flat=True)
-                    .distinct()
-                    .order_by(f"{component.grouping_field}__name")
-                )
+                category_key = f"{component.grouping_field}__name"
             else:
-                categories = list(
-                    queryset.values_list(component.grouping_field, flat=True)
-                    .distinct()
-                    .order_by(component.grouping_field)
-                )
+                category_key = component.grouping_field
+            raw_categories = [
+                cat
+                for cat in queryset.values_list(category_key, flat=True)
+                .distinct()
+                .order_by(category_key)
+                if cat is not None
+            ]
 
             try:
-                if hasattr(field, "choices") and field.choices:
-                    category_display = {}
-                    for choice_value, choice_label in field.choices:
-                        category_display[choice_value] = choice_label
-                    categories = [
-                        (
-                            category_display.get(cat, str(cat))
-                            if cat is not None
-                            else "None"
-                        )
-                        for cat in categories
-                        if cat is not None
-                    ]
-                else:
-                    categories = [
-                        str(cat) if cat is not None else "None"
-                        for cat in categories
-                        if cat is not None
-                    ]
-            except:
-                categories = [
-                    str(cat) if cat is not None else "None"
-                    for cat in categories
-                    if cat is not None
-                ]
+                category_labels = (
+                    resolve_group_labels(
+                        model, component.grouping_field, raw_categories
+                    )
+                    if category_key == component.grouping_field
+                    else {}
+                )
+            except Exception:
+                category_labels = {}
+            categories = [str(category_labels.get(cat, cat)) for cat in raw_categories]
 
             secondary_field = (
                 model._meta.get_field(component.secondary_grouping)
@@ -2485,74 +2481,37 @@ class DashboardComponentChartView(View):
             if not secondary_field:
                 return None
 
-            if secondary_field.is_relation and hasattr(
-                secondary_field.remote_field.model, "name"
+            # Count every (category, secondary value) pair in a single query
+            grouped_counts = {}
+            for item in (
+                queryset.values(category_key, component.secondary_grouping)
+                .annotate(value=Count("id"))
+                .order_by(secondary_field.attname)
             ):
-                secondary_values = list(
-                    queryset.values_list(
-                        f"{component.secondary_grouping}__name", flat=True
-                    ).distinct()
-                )
-            else:
-                secondary_values = list(
-                    queryset.values_list(
-                        component.secondary_grouping, flat=True
-                    ).distinct()
-                )
+                secondary_value = item[component.secondary_grouping]
+                if secondary_value is None:
+                    continue
+                grouped_counts.setdefault(secondary_value, {})[
+                    item[category_key]
+                ] = item["value"]
 
-            secondary_values = [val for val in secondary_values if val is not None]
+            secondary_values = list(grouped_counts)
 
             if not secondary_values:
                 return None
 
+            secondary_labels = resolve_group_labels(
+                model, component.secondary_grouping, secondary_values
+            )
+
             series_data = []
 
             for secondary_value in secondary_values:
-                display_value = secondary_value
-
-                if secondary_field.is_relation and hasattr(
-                    secondary_field.remote_field.model, "name"
-                ):
-                    related_obj = secondary_field.remote_field.model.objects.filter(
-                        name=secondary_value
-                    ).first()
-                    if related_obj:
-                        display_value = str(related_obj)
-                elif isinstance(secondary_field, ForeignKey):
-                    related_obj = secondary_field.remote_field.model.objects.filter(
-                        pk=secondary_value
-                    ).first()
-                    if related_obj:
-                        display_value = str(related_obj)
-                elif hasattr(secondary_field, "choices") and secondary_field.choices:
-                    for choice_value, choice_label in secondary_field.choices:
-                        if choice_value == secondary_value:
-                            display_value = choice_label
-                            break
-
-                filtered_queryset = queryset.filter(
-                    **{component.secondary_grouping: secondary_value}
-                )
-
-                if field.is_relation and hasattr(field.remote_field.model, "name"):
-                    grouped_data = filtered_queryset.values(
-                        f"{component.grouping_field}__name"
-                    ).annotate(value=Count("id"))
-                    grouped_dict = {
-                        item[f"{component.grouping_field}__name"]: item["value"]
-                        for item in grouped_data
-                    }
-                else:
-                    grouped_data = filtered_queryset.values(
-                        component.grouping_field
-                    ).annotate(value=Count("id"))
-                    grouped_dict = {
-                        str(item[component.grouping_field]): item["value"]
-                        for item in grouped_data
-                    }
+                display_value = secondary_labels.get(secondary_value, secondary_value)
+                grouped_dict = grouped_counts[secondary_value]
 
                 series_values = []
-                for category in categories:
+                for category in raw_categories:
                     series_values.append(float(grouped_dict.get(category, 0)))
 
                 series_data.append(
@@ -2690,6 +2649,19 @@ class DashboardComponentChartView(View):
             data = []
             urls = []
             section_info = get_section_info_for_model(model)
+            aggregated_data = list(aggregated_data)
+
+            # Display values for choice fields and foreign keys, resolved at once
+            group_labels = {}
+            if not id_field_name:
+                try:
+                    group_labels = resolve_group_labels(
+                        model,
+                        component.grouping_field,
+                        [item.get(field_name) for item in aggregated_data],
+                    )
+                except Exception:
+                    group_labels = {}
 
             for item in aggregated_data:
                 if field.is_relation and id_field_name:
@@ -2697,18 +2669,7 @@ class DashboardComponentChartView(View):
                     label = item.get(field_name)
                 else:
                     filter_value = item.get(field_name)
-                    label = filter_value
-
-                # Handle choice fields
-                try:
-                    field_obj = model._meta.get_field(component.grouping_field)
-                    if hasattr(field_obj, "choices") and field_obj.choices:
-                        for choice_value, choice_label in field_obj.choices:
-                            if choice_value == label:
-                                label = choice_label
-                                break
-                except:
-                    pass
+                    label = group_labels.get(filter_value, filter_value)
 
                 if isinstance(label, (list, dict)):
                     label = str(label)
@@ -2748,16 +2709,38 @@ class DashboardComponentChartView(View):
             )
             return None
 
-    def get(self, request, *args, **kwargs):
+    async def get(self, request, *args, **kwargs):
         """
         Handle GET request to render the chart or KPI component.
         Uses ECharts for charts and custom HTML for KPIs with modern card design.
         """
-        component_id = kwargs.get("component_id")
         try:
-            component = DashboardComponent.objects.get(id=component_id)
+            component = await DashboardComponent.objects.select_related(
+                "module"
+            ).aget(id=kwargs.get("component_id"))
+        except DashboardComponent.DoesNotExist:
+            return HttpResponse(
+                '<div class="text-gray-500 text-sm flex items-center justify-center h-full">Component not found</div>'
+            )
+        return await sync_to_async(self.render_component)(request, component)
+
+    def render_component(self, request, component):
+        """Render the chart or KPI of ``component``."""
+        component_id = component.id
+        try:
+            snapshot = get_component_snapshot(
+                component, request, force=request.GET.get("refresh") == "true"
+            )
+            refresh_url = reverse_lazy(
+                "horilla_dashboard:component_chart",
+                kwargs={"component_id": component.id},
+            )
+            snapshot_context = {
+                "snapshot": snapshot,
+                "refresh_url": f"{refresh_url}?refresh=true",
+            }
             if component.component_type == "kpi":
-                kpi_data = self.get_kpi_data(component)
+                kpi_data = snapshot.data if snapshot else self.get_kpi_data(component)
                 if not kpi_data:
                     return HttpResponse(
                         '<div class="text-gray-500 text-sm flex items-center justify-center h-full">No KPI data available</div>'
@@ -2801,12 +2784,16 @@ class DashboardComponentChartView(View):
                     "icon_url": component.icon.url if component.icon else None,
                     "is_home_view": is_home_view,
                     "query_string": request.GET.urlencode(),
+                    "target_id": f"kpi-component-{component_id}",
+                    **snapshot_context,
                 }
 
                 return render(request, "kpi_components.html", context)
 
             if component.component_type == "chart":
-                if component.reports:
+                if snapshot:
+                    chart_data = snapshot.data
+                elif component.reports:
                     chart_data = self.get_report_chart_data(component)
                 else:
                     chart_data = self.get_chart_data(component)
@@ -2847,12 +2834,23 @@ class DashboardComponentChartView(View):
                 }})();
                 </script>
                 """
+                if snapshot:
+                    snapshot_html = render_to_string(
+                        "snapshot_status.html",
+                        {
+                            **snapshot_context,
+                            "target_id": f"component-chart-wrapper-{component.id}",
+                        },
+                        request=request,
+                    )
+                    html = f"""
+                <div id="component-chart-wrapper-{component.id}" class="w-full h-full relative">
+                    {html}
+                    <div class="absolute top-0 right-0 z-[1]">{snapshot_html}</div>
+                </div>
+                """
                 return HttpResponse(html)
 
-        except DashboardComponent.DoesNotExist:
-            return HttpResponse(
-                '<div class="text-gray-500 text-sm flex items-center justify-center h-full">Component not found</div>'
-            )
         except Exception as e:
             return HttpResponse(
                 f'<div class="text-gray-500 text-sm flex items-center justify-center h-full">Error: {str(e)}</div>'
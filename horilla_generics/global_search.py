@@ -1,12 +1,20 @@
+import asyncio
+import hashlib
+import json
 import re
+import time
 from functools import reduce
 from operator import or_
 from urllib.parse import parse_qs, unquote, urlencode, urlparse, urlunparse
 
+from asgiref.sync import sync_to_async
 from django.apps import apps
+from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.db.models import CharField, ForeignKey, ManyToManyField, Q, TextField
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from django.shortcuts import redirect, render
 from django.template.loader import render_to_string
 from django.urls import reverse_lazy
@@ -14,8 +22,19 @@ from django.utils.safestring import mark_safe
 from django.views import View
 
 from horilla.registry.feature import FEATURE_REGISTRY
+from horilla_generics.search_index import (
+    count_documents,
+    get_document_scope,
+    get_index_states,
+    get_search_fields,
+    search_documents,
+)
 from horilla_generics.views import HorillaListView
 from horilla_utils.methods import get_section_info_for_model
+from horilla_utils.middlewares import reset_current_request, set_current_request
+
+TYPEAHEAD_CACHE_TIMEOUT = getattr(settings, "GLOBAL_SEARCH_TYPEAHEAD_TIMEOUT", 30)
+TYPEAHEAD_DEBOUNCE = getattr(settings, "GLOBAL_SEARCH_TYPEAHEAD_DEBOUNCE", 0.15)
 
 
 class GlobalSearchView(LoginRequiredMixin, View):
@@ -90,18 +109,7 @@ class GlobalSearchView(LoginRequiredMixin, View):
                 continue
 
             # Get FIRST 5 searchable fields (CharField and TextField only)
-            search_fields = []
-            for field in model._meta.fields:
-                if (
-                    isinstance(field, (CharField, TextField))
-                    and field.name not in self.exclude_standard_fields
-                    and not field.auto_created
-                    and not field.is_relation
-                ):
-                    search_fields.append(field.name)
-
-                    if len(search_fields) >= 5:
-                        break
+            search_fields = get_search_fields(model, self.exclude_standard_fields)
 
             if not search_fields:
                 continue
@@ -235,6 +243,64 @@ class GlobalSearchView(LoginRequiredMixin, View):
 
         return base_queryset.none()
 
+    def get_search_queryset(self, request, config, query, index_states):
+        """
+        Records of a model matching ``query`` that the user can view. Models
+        whose search index is built for their search fields are matched on
+        their search documents, others on their own text fields.
+        """
+        model = config["model"]
+        content_type = ContentType.objects.get_for_model(model)
+        if index_states.get(content_type.pk) == config["search_fields"]:
+            matched_ids = (
+                search_documents(query)
+                .filter(content_type=content_type)
+                .values("object_id")
+            )
+            results = model.objects.filter(pk__in=matched_ids)
+        else:
+            q_objects = Q()
+            for field in config["search_fields"]:
+                q_objects |= Q(**{f"{field}__icontains": query})
+            results = model.objects.filter(q_objects)
+
+        return self.get_filtered_queryset(model, results, request)
+
+    def get_result_counts(self, request, model_config, query):
+        """
+        Count the matches of each model. Indexed models the user can fully
+        view are counted together with one grouped query on the search
+        documents; the others are counted one by one.
+        """
+        index_states = get_index_states()
+        counts = {}
+        scopes = {}
+        for model_name, config in model_config.items():
+            model = config["model"]
+            content_type = ContentType.objects.get_for_model(model)
+            scope = None
+            if index_states.get(
+                content_type.pk
+            ) == config["search_fields"] and request.user.has_perm(
+                f"{model._meta.app_label}.view_{model._meta.model_name}"
+            ):
+                scope = get_document_scope(model, request)
+            if scope is None:
+                counts[model_name] = self.get_search_queryset(
+                    request, config, query, index_states
+                ).count()
+            else:
+                scopes[content_type.pk] = (model_name, scope)
+
+        document_counts = count_documents(
+            search_documents(query),
+            {pk: scope for pk, (_model_name, scope) in scopes.items()},
+        )
+        for pk, (model_name, _scope) in scopes.items():
+            counts[model_name] = document_counts.get(pk, 0)
+        # Keep the registry order for models with the same count
+        return {model_name: counts[model_name] for model_name in model_config}
+
     def get_tab_content(self, request, model_name, query):
         """Generate tab content for a specific model"""
         model_config = self.get_dynamic_model_config()
@@ -243,15 +309,10 @@ class GlobalSearchView(LoginRequiredMixin, View):
             return '<div class="p-4">Model not found.</div>'
 
         config = model_config[model_name]
-        model = apps.get_model(config["app_name"], model_name)
-
-        q_objects = Q()
-        for field in config["search_fields"]:
-            q_objects |= Q(**{f"{field}__icontains": query})
-
-        results = model.objects.filter(q_objects)
-
-        results = self.get_filtered_queryset(model, results, request)
+        model = config["model"]
+        results = self.get_search_queryset(
+            request, config, query, get_index_states()
+        )
 
         def highlight_text(text):
             if not text:
@@ -411,27 +472,16 @@ class GlobalSearchView(LoginRequiredMixin, View):
             first_tab_content = ""
             first_model_name = None
 
-            for model_name, config in model_config.items():
-                model = apps.get_model(config["app_name"], model_name)
-
-                q_objects = Q()
-                for field in config["search_fields"]:
-                    q_objects |= Q(**{f"{field}__icontains": query})
-
-                results = model.objects.filter(q_objects)
-
-                results = self.get_filtered_queryset(model, results, request)
-
-                search_results[model_name] = results
-
-                if results.count() > 0:
-                    search_results_with_data[model_name] = results
-                    total_results += results.count()
+            search_results = self.get_result_counts(request, model_config, query)
+            for model_name, count in search_results.items():
+                if count > 0:
+                    search_results_with_data[model_name] = count
+                    total_results += count
 
             sorted_search_results_with_data = dict(
                 sorted(
                     search_results_with_data.items(),
-                    key=lambda x: x[1].count(),
+                    key=lambda x: x[1],
                     reverse=True,
                 )
             )
@@ -444,10 +494,7 @@ class GlobalSearchView(LoginRequiredMixin, View):
 
             if filter_type != "all":
                 model_name_filtered = filter_type.capitalize()
-                if (
-                    model_name_filtered in sorted_search_results_with_data
-                    and sorted_search_results_with_data[model_name_filtered].count() > 0
-                ):
+                if model_name_filtered in sorted_search_results_with_data:
                     sorted_search_results_with_data = {
                         model_name_filtered: sorted_search_results_with_data[
                             model_name_filtered
@@ -498,3 +545,177 @@ class GlobalSearchView(LoginRequiredMixin, View):
             "hx-on:click": "$('#header-search').val('')",
         }
         return htmx_attrs
+
+
+class GlobalSearchTypeaheadView(GlobalSearchView):
+    """
+    Search-as-you-type endpoint returning the top hits of each model as
+    newline-delimited JSON, one line per model as soon as it is searched,
+    followed by a ``{"done": true}`` line.
+
+    Each request supersedes the previous one of the same user: it waits
+    ``GLOBAL_SEARCH_TYPEAHEAD_DEBOUNCE`` seconds, and a superseded request
+    stops searching and ends with ``{"superseded": true}``. Results are
+    cached for ``GLOBAL_SEARCH_TYPEAHEAD_TIMEOUT`` seconds, and models with
+    no hits for a cached prefix of the query are not searched again.
+    """
+
+    min_query_length = 2
+    default_limit = 5
+    max_limit = 20
+
+    def get_limit(self, request):
+        try:
+            limit = int(request.GET.get("limit", self.default_limit))
+        except ValueError:
+            limit = self.default_limit
+        return max(1, min(limit, self.max_limit))
+
+    def get_latest_query_key(self, request):
+        return f"global_search_typeahead_latest_{request.user.pk}"
+
+    def get_results_key(self, request, query, limit):
+        company = getattr(request, "active_company", None)
+        digest = hashlib.sha256(query.lower().encode()).hexdigest()[:32]
+        return (
+            f"global_search_typeahead_{request.user.pk}_"
+            f"{getattr(company, 'pk', None)}_{limit}_{digest}"
+        )
+
+    def is_superseded(self, request, token):
+        return cache.get(self.get_latest_query_key(request)) != token
+
+    def get(self, request):
+        query = request.GET.get("q", "").strip()
+        limit = self.get_limit(request)
+        token = time.time_ns()
+        cache.set(self.get_latest_query_key(request), token, TYPEAHEAD_CACHE_TIMEOUT)
+        response = StreamingHttpResponse(
+            self.stream_results(request, query, limit, token),
+            content_type="application/x-ndjson",
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    def plan_search(self, request, query, limit):
+        """
+        Return ``(cached_results, models)``: the cached results of ``query``
+        or ``None``, and the ``(model_name, config)`` pairs left to search,
+        models searched on the index first.
+        """
+        cached = cache.get(self.get_results_key(request, query, limit))
+        if cached is not None:
+            return cached, []
+
+        prefix_keys = [
+            self.get_results_key(request, query[:length], limit)
+            for length in range(self.min_query_length, len(query))
+        ]
+        empty_models = set()
+        for prefix_results in cache.get_many(prefix_keys).values():
+            empty_models.update(
+                model_name for model_name, hits in prefix_results.items() if not hits
+            )
+
+        index_states = get_index_states()
+        models = []
+        for model_name, config in self.get_dynamic_model_config().items():
+            if model_name in empty_models:
+                continue
+            content_type = ContentType.objects.get_for_model(config["model"])
+            config["indexed"] = (
+                index_states.get(content_type.pk) == config["search_fields"]
+            )
+            models.append((model_name, config))
+        models.sort(key=lambda item: not item[1]["indexed"])
+        return None, models
+
+    def search_model_unless_superseded(
+        self, request, token, model_name, config, query, limit
+    ):
+        """
+        ``search_model`` in the same thread hop as the superseded check;
+        None when the request is superseded.
+        """
+        if self.is_superseded(request, token):
+            return None
+        return self.search_model(request, model_name, config, query, limit)
+
+    def search_model(self, request, model_name, config, query, limit):
+        """Top ``limit`` hits of one model, as a JSON-ready dict."""
+        # The streamed response outlives ThreadLocalMiddleware, and the
+        # company filtered managers read the request from it.
+        token = set_current_request(request)
+        try:
+            index_states = {}
+            if config["indexed"]:
+                content_type = ContentType.objects.get_for_model(config["model"])
+                index_states[content_type.pk] = config["search_fields"]
+            objects = list(
+                self.get_search_queryset(request, config, query, index_states)[
+                    : limit + 1
+                ]
+            )
+            hits = []
+            for obj in objects[:limit]:
+                summary = [
+                    str(getattr(obj, field))
+                    for field in config["summary_fields"][1:]
+                    if getattr(obj, field, None) not in (None, "")
+                ]
+                hits.append(
+                    {
+                        "id": obj.pk,
+                        "title": str(config["display_field"](obj)),
+                        "summary": " • ".join(summary),
+                        "url": (
+                            str(obj.get_detail_url())
+                            if hasattr(obj, "get_detail_url")
+                            else None
+                        ),
+                    }
+                )
+        finally:
+            reset_current_request(token)
+        return {
+            "model": model_name,
+            "verbose_name": str(config["verbose_name"]),
+            "results": hits,
+            "more": len(objects) > limit,
+        }
+
+    async def stream_results(self, request, query, limit, token):
+        if len(query) < self.min_query_length:
+            yield json.dumps({"done": True, "query": query}) + "\n"
+            return
+
+        cached, models = await sync_to_async(self.plan_search)(request, query, limit)
+        if cached is not None:
+            for line in cached.values():
+                if line["results"]:
+                    yield json.dumps(line) + "\n"
+            yield json.dumps({"done": True, "query": query}) + "\n"
+            return
+
+        if TYPEAHEAD_DEBOUNCE:
+            await asyncio.sleep(TYPEAHEAD_DEBOUNCE)
+
+        results = {}
+        for model_name, config in models:
+            line = await sync_to_async(self.search_model_unless_superseded)(
+                request, token, model_name, config, query, limit
+            )
+            if line is None:
+                yield json.dumps({"superseded": True, "query": query}) + "\n"
+                return
+            results[model_name] = line
+            if line["results"]:
+                yield json.dumps(line) + "\n"
+
+        await sync_to_async(cache.set)(
+            self.get_results_key(request, query, limit),
+            results,
+            TYPEAHEAD_CACHE_TIMEOUT,
+        )
+        yield json.dumps({"done": True, "query": query}) + "\n"
@@ -0,0 +1,45 @@
+"""
+Horilla management command to rebuild the global search index.
+"""
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from horilla_generics.search_index import get_search_models, rebuild_model_index
+
+
+class Command(BaseCommand):
+    """
+    Horilla management command to rebuild the global search index.
+    """
+
+    help = "Rebuilds the search documents of the global search models"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "models",
+            nargs="*",
+            type=str,
+            help="Models to rebuild, as app_label.ModelName (default: all)",
+        )
+
+    def handle(self, *args, **options):
+        search_models = get_search_models()
+        if options["models"]:
+            models = []
+            for label in options["models"]:
+                try:
+                    model = apps.get_model(label)
+                except (LookupError, ValueError) as e:
+                    raise CommandError(str(e))
+                if model not in search_models:
+                    raise CommandError(f"{label} is not a global search model")
+                models.append(model)
+        else:
+            models = search_models
+
+        for model in models:
+            written = rebuild_model_index(model)
+            self.stdout.write(
+                self.style.SUCCESS(f"Indexed {written} {model._meta.label} records")
+            )
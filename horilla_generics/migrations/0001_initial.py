@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:50
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('horilla_core', '0005_alter_department_department_name_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchIndexState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('search_fields', models.JSONField(default=list, verbose_name='Search Fields')),
+                ('built_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Built At')),
+                ('content_type', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype', verbose_name='Content Type')),
+            ],
+            options={
+                'verbose_name': 'Search Index State',
+                'verbose_name_plural': 'Search Index States',
+            },
+        ),
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveIntegerField(verbose_name='Object Id')),
+                ('content', models.TextField(verbose_name='Content')),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Updated At')),
+                ('company', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='horilla_core.company', verbose_name='Company')),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype', verbose_name='Content Type')),
+            ],
+            options={
+                'verbose_name': 'Search Document',
+                'verbose_name_plural': 'Search Documents',
+                'indexes': [models.Index(fields=['content_type', 'company'], name='horilla_gen_content_0f113c_idx')],
+                'unique_together': {('content_type', 'object_id')},
+            },
+        ),
+    ]
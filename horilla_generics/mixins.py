@@ -9,3 +9,18 @@ class RecentlyViewedMixin(LoginRequiredMixin):
         if hasattr(self, "object") and self.object and request.user.is_authenticated:
             RecentlyViewed.objects.add_viewed_item(request.user, self.object)
         return response
+
+
+class AsyncLoginRequiredMixin(LoginRequiredMixin):
+    """
+    LoginRequiredMixin for views with async handlers. The user is loaded
+    with ``request.auser()`` and set on the request, so sync code reading
+    ``request.user`` (templates, permission checks) does not query from the
+    event loop.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        request.user = await request.auser()
+        if not request.user.is_authenticated:
+            return self.handle_no_permission()
+        return await super(LoginRequiredMixin, self).dispatch(request, *args, **kwargs)
@@ -1,3 +1,66 @@
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from horilla.registry.permission_registry import permission_exempt_model
 
 # Create your horilla_generics models here.
+
+
+@permission_exempt_model
+class SearchDocument(models.Model):
+    """
+    Searchable text of one record of a global search model, kept up to date
+    by ``search_index`` so global search reads a single table.
+    """
+
+    content_type = models.ForeignKey(
+        ContentType, on_delete=models.CASCADE, verbose_name=_("Content Type")
+    )
+    object_id = models.PositiveIntegerField(verbose_name=_("Object Id"))
+    company = models.ForeignKey(
+        "horilla_core.Company",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        verbose_name=_("Company"),
+    )
+    content = models.TextField(verbose_name=_("Content"))
+    updated_at = models.DateTimeField(
+        default=timezone.now, verbose_name=_("Updated At")
+    )
+
+    class Meta:
+        """Meta class for SearchDocument"""
+
+        unique_together = ("content_type", "object_id")
+        indexes = [models.Index(fields=["content_type", "company"])]
+        verbose_name = _("Search Document")
+        verbose_name_plural = _("Search Documents")
+
+    def __str__(self):
+        return f"{self.content_type} #{self.object_id}"
+
+
+@permission_exempt_model
+class SearchIndexState(models.Model):
+    """
+    Marks the search documents of a model as complete for the listed search
+    fields. Models without a matching state are searched on their own table.
+    """
+
+    content_type = models.OneToOneField(
+        ContentType, on_delete=models.CASCADE, verbose_name=_("Content Type")
+    )
+    search_fields = models.JSONField(default=list, verbose_name=_("Search Fields"))
+    built_at = models.DateTimeField(default=timezone.now, verbose_name=_("Built At"))
+
+    class Meta:
+        """Meta class for SearchIndexState"""
+
+        verbose_name = _("Search Index State")
+        verbose_name_plural = _("Search Index States")
+
+    def __str__(self):
+        return str(self.content_type)
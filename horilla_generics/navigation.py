@@ -0,0 +1,123 @@
+"""
+Previous/next navigation between the records of a list view.
+
+Instead of storing every ordered primary key of the list in the session, the
+list view stores what rebuilds its queryset: the view class, its URL kwargs
+and the query parameters (filters, search, sort) of the request. Detail views
+rebuild the queryset from the session in whatever worker process serves them
+and resolve the neighbours of the shown record with keyset queries (see
+``pagination.KeysetPaginator``), so opening a record costs two indexed
+lookups whatever the size of the list.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+
+from django.http import QueryDict
+from django.utils.module_loading import import_string
+
+from horilla_generics.pagination import KeysetPaginator
+
+logger = logging.getLogger(__name__)
+
+
+def get_navigation_session_key(model):
+    """Session key holding the navigation state of ``model``'s list."""
+    return f"list_view_navigation_{model._meta.model_name}"
+
+
+def _is_dispatched(view):
+    """
+    Whether ``view`` serves the current URL. Lists configured by hand inside
+    another view cannot be rebuilt from their class.
+    """
+    match = getattr(view.request, "resolver_match", None)
+    view_class = getattr(getattr(match, "func", None), "view_class", None)
+    return view_class is type(view)
+
+
+def register_navigation(request, view):
+    """
+    Remember the list rendered by ``view`` as the list the user navigates
+    through and return its signature, or ``None`` when it cannot be rebuilt.
+    """
+    session_key = get_navigation_session_key(view.model)
+    if not _is_dispatched(view):
+        request.session.pop(session_key, None)
+        return None
+    view_class = type(view)
+    state = {
+        "view": f"{view_class.__module__}.{view_class.__qualname__}",
+        "kwargs": {
+            key: value if isinstance(value, (int, str)) else str(value)
+            for key, value in view.kwargs.items()
+        },
+        "params": request.GET.urlencode(),
+    }
+    payload = json.dumps([state, request.user.pk], sort_keys=True)
+    state["signature"] = hashlib.sha256(payload.encode()).hexdigest()[:32]
+    if request.session.get(session_key) != state:
+        request.session[session_key] = state
+    return state["signature"]
+
+
+def get_navigation_signature(request, model):
+    """Signature of the list registered for ``model``, or an empty string."""
+    state = request.session.get(get_navigation_session_key(model))
+    return state.get("signature", "") if isinstance(state, dict) else ""
+
+
+def get_navigation_queryset(request, model):
+    """
+    Rebuild the queryset of the list last registered for ``model`` by this
+    session, or return ``None`` when there is none or it cannot be rebuilt.
+    """
+    state = request.session.get(get_navigation_session_key(model))
+    if not isinstance(state, dict):
+        return None
+    try:
+        view = import_string(state["view"])()
+        list_request = copy.copy(request)
+        list_request.method = "GET"
+        list_request.GET = QueryDict(state["params"])
+        list_request.POST = QueryDict()
+        view.setup(list_request, **state["kwargs"])
+        queryset = view.get_queryset()
+    except Exception as e:
+        logger.warning(f"Could not rebuild the {model._meta.label} list: {e}")
+        return None
+    if queryset.model is not model:
+        return None
+    return queryset
+
+
+def get_neighbour_ids(queryset, obj, wrap=False):
+    """
+    Return the primary keys of the records before and after ``obj`` in
+    ``queryset``. With ``wrap`` the first and last records are each other's
+    neighbours; otherwise a missing neighbour is ``None``.
+    """
+    paginator = KeysetPaginator(queryset, 1)
+    if paginator.is_supported:
+        previous_id, next_id = paginator.get_neighbour_ids(obj)
+        if wrap and (previous_id is None or next_id is None):
+            first_id, last_id = paginator.get_edge_ids()
+            previous_id = last_id if previous_id is None else previous_id
+            next_id = first_id if next_id is None else next_id
+        return previous_id, next_id
+
+    # Orderings keyset queries cannot follow (expressions, relation paths):
+    # locate the record in the list of ids, only when a record is opened.
+    ids = list(queryset.values_list("pk", flat=True))
+    try:
+        index = ids.index(obj.pk)
+    except ValueError:
+        return (ids[-1], ids[0]) if wrap and ids else (None, None)
+    previous_id = ids[index - 1] if index > 0 else None
+    next_id = ids[index + 1] if index + 1 < len(ids) else None
+    if wrap:
+        previous_id = ids[-1] if previous_id is None else previous_id
+        next_id = ids[0] if next_id is None else next_id
+    return previous_id, next_id
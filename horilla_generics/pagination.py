@@ -0,0 +1,206 @@
+"""
+Keyset (cursor) pagination for list views.
+
+Instead of ``OFFSET n`` the next page is requested with a cursor holding the
+ordering values of the last row already shown, and fetched with a
+``WHERE (sort_field, id) > (last value, last id)`` condition, so deep pages
+cost the same as the first one and no ``COUNT(*)`` is needed.
+
+Keyset pagination needs a deterministic ordering on concrete columns. The
+queryset ordering is completed with the primary key as tie breaker, and NULL
+values are ordered as the smallest values on every database. Orderings that
+cannot be expressed this way (expressions, relation paths) are reported by
+``KeysetPaginator.is_supported`` so callers can fall back to ``Paginator``.
+"""
+
+import base64
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import F, Q
+
+
+class InvalidCursor(Exception):
+    """Raised when a cursor cannot be decoded for the current ordering."""
+
+
+class KeysetPage:
+    """A page of a keyset paginated queryset."""
+
+    def __init__(self, object_list, next_cursor, paginator):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.paginator = paginator
+        self.number = None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return False
+
+    def has_other_pages(self):
+        return self.has_next()
+
+    def next_page_number(self):
+        return None
+
+
+class KeysetPaginator:
+    """
+    Paginate ``queryset`` by its ordering fields plus the primary key.
+    """
+
+    def __init__(self, queryset, per_page):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.ordering = self._get_ordering()
+
+    @property
+    def is_supported(self):
+        """True when the queryset ordering can be paginated by keyset."""
+        return self.ordering is not None
+
+    def _get_ordering(self):
+        opts = self.queryset.model._meta
+        order_by = list(self.queryset.query.order_by)
+        if not order_by and self.queryset.query.default_ordering:
+            order_by = list(opts.ordering)
+
+        ordering = []
+        for item in order_by:
+            if not isinstance(item, str) or item == "?":
+                return None
+            descending = item.startswith("-")
+            name = item.lstrip("-")
+            if "__" in name:
+                return None
+            if name == "pk":
+                field = opts.pk
+            else:
+                try:
+                    field = opts.get_field(name)
+                except FieldDoesNotExist:
+                    return None
+            if not field.concrete or field.many_to_many:
+                return None
+            if field.is_relation and name != field.attname:
+                # Ordering by the relation follows the related Meta.ordering.
+                return None
+            ordering.append((field, descending))
+            if field.primary_key:
+                break
+        else:
+            descending = ordering[-1][1] if ordering else False
+            ordering.append((opts.pk, descending))
+        return ordering
+
+    def _reversed_ordering(self):
+        # NULLs are first ascending and last descending, so flipping every
+        # direction gives exactly the reverse order.
+        return [(field, not descending) for field, descending in self.ordering]
+
+    def _order_expressions(self, ordering=None):
+        expressions = []
+        for field, descending in ordering or self.ordering:
+            if descending:
+                expressions.append(F(field.attname).desc(nulls_last=True))
+            else:
+                expressions.append(F(field.attname).asc(nulls_first=True))
+        return expressions
+
+    def _after(self, field, descending, value):
+        """Rows strictly after ``value`` in the ordering of ``field``."""
+        name = field.attname
+        if value is None:
+            # NULLs come first ascending and last descending.
+            if descending:
+                return Q(pk__in=[])
+            return Q(**{f"{name}__isnull": False})
+        lookup = "lt" if descending else "gt"
+        condition = Q(**{f"{name}__{lookup}": value})
+        if descending:
+            condition |= Q(**{f"{name}__isnull": True})
+        return condition
+
+    def _equal(self, field, value):
+        if value is None:
+            return Q(**{f"{field.attname}__isnull": True})
+        return Q(**{field.attname: value})
+
+    def _cursor_filter(self, values, ordering=None):
+        condition = Q(pk__in=[])
+        equal = Q()
+        for (field, descending), value in zip(ordering or self.ordering, values):
+            condition |= equal & self._after(field, descending, value)
+            equal &= self._equal(field, value)
+        return condition
+
+    def encode_cursor(self, obj):
+        """Encode the ordering values of ``obj`` as an opaque cursor."""
+        values = [
+            (
+                None
+                if getattr(obj, field.attname) is None
+                else field.value_to_string(obj)
+            )
+            for field, _ in self.ordering
+        ]
+        data = json.dumps(values).encode()
+        return base64.urlsafe_b64encode(data).decode()
+
+    def decode_cursor(self, cursor):
+        """Decode a cursor into ordering values, converted to Python types."""
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise InvalidCursor(cursor)
+            return [
+                None if value is None else field.to_python(value)
+                for (field, _), value in zip(self.ordering, values)
+            ]
+        except (ValueError, TypeError, ValidationError) as e:
+            raise InvalidCursor(cursor) from e
+
+    def page(self, cursor=None):
+        """Return the page following ``cursor``, or the first page."""
+        queryset = self.queryset.order_by(*self._order_expressions())
+        if cursor:
+            queryset = queryset.filter(self._cursor_filter(self.decode_cursor(cursor)))
+        object_list = list(queryset[: self.per_page + 1])
+        next_cursor = None
+        if len(object_list) > self.per_page:
+            object_list = object_list[: self.per_page]
+            next_cursor = self.encode_cursor(object_list[-1])
+        return KeysetPage(object_list, next_cursor, self)
+
+    def get_neighbour_ids(self, obj):
+        """
+        Return the primary keys of the rows before and after ``obj`` in the
+        queryset ordering, ``None`` where there is no such row.
+        """
+        values = [getattr(obj, field.attname) for field, _ in self.ordering]
+        neighbours = []
+        for ordering in (self._reversed_ordering(), self.ordering):
+            neighbours.append(
+                self.queryset.order_by(*self._order_expressions(ordering))
+                .filter(self._cursor_filter(values, ordering))
+                .values_list("pk", flat=True)
+                .first()
+            )
+        return tuple(neighbours)
+
+    def get_edge_ids(self):
+        """Return the primary keys of the first and last rows."""
+        return tuple(
+            self.queryset.order_by(*self._order_expressions(ordering))
+            .values_list("pk", flat=True)
+            .first()
+            for ordering in (self.ordering, self._reversed_ordering())
+        )
@@ -0,0 +1,154 @@
+"""
+Related-object loading plans for list views.
+
+List cells are rendered by walking ``__`` paths such as ``lead_owner__email``
+or ``contacts__account`` on every row (see the ``get_field`` and ``format``
+template filters), which loads each relation with its own query per row.
+``plan_related_lookups`` reads the paths a list renders and works out the
+``select_related`` paths (single-valued relations), the ``prefetch_related``
+paths (multi-valued relations and what follows them) and, on request, the
+``only()`` field list that makes rendering a page query-free.
+
+Paths that end in a method or property cannot be analysed. They still get
+their relations up to that point planned, and are reported as opaque.
+"""
+
+import re
+from functools import lru_cache
+
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+
+PLACEHOLDER_REGEX = re.compile(r"{([^}]*)}")
+
+
+def get_attr_placeholders(attrs_list):
+    """Return the ``{path}`` placeholders used in a list of attribute dicts."""
+    paths = []
+    for attrs in attrs_list or []:
+        values = attrs.values() if isinstance(attrs, dict) else [attrs]
+        for value in values:
+            if isinstance(value, dict):
+                paths.extend(get_attr_placeholders([value]))
+            elif isinstance(value, str):
+                paths.extend(PLACEHOLDER_REGEX.findall(value))
+    return paths
+
+
+def _resolve_path(model, path):
+    """
+    Walk ``path`` on ``model`` and return ``(relations, field_name, opaque)``:
+    the relation hops as ``(path, field, many)``, the top-level model field
+    the path starts with, and whether the path ends in something other than
+    a model field.
+    """
+    relations = []
+    top_level = None
+    current_model = model
+    prefix = []
+    many = False
+    for part in path.split("__"):
+        if part.startswith("get_") and part.endswith("_display"):
+            part = part[4:-8]
+        try:
+            field = current_model._meta.get_field(part)
+        except FieldDoesNotExist:
+            return relations, top_level, True
+        if top_level is None:
+            top_level = field.name
+        if isinstance(field, GenericForeignKey):
+            prefix.append(part)
+            relations.append(("__".join(prefix), field, True))
+            return relations, top_level, True
+        if not field.is_relation:
+            return relations, top_level, False
+        prefix.append(field.name)
+        many = many or field.many_to_many or field.one_to_many
+        relations.append(("__".join(prefix), field, many))
+        current_model = field.related_model
+    return relations, top_level, False
+
+
+@lru_cache(maxsize=512)
+def plan_related_lookups(model, paths, extra_paths=(), only_fields=False):
+    """
+    Plan how to load what rendering ``paths`` on ``model`` rows reads.
+
+    ``extra_paths`` are read outside the cells (attribute placeholders, owner
+    fields); their relations are planned but, being mostly URL helpers, their
+    opaque ones do not prevent ``only()``.
+
+    Returns a dict with the ``select_related`` paths, the ``prefetch_related``
+    paths, the ``only`` field names (``None`` unless ``only_fields`` is set
+    and every cell path resolves to model fields) and the ``opaque`` paths.
+    """
+    select_related = []
+    prefetch_related = []
+    opaque = []
+    only = {model._meta.pk.name}
+    for path in list(paths) + list(extra_paths):
+        relations, top_level, is_opaque = _resolve_path(model, path)
+        if is_opaque and path in paths:
+            opaque.append(path)
+        if top_level:
+            only.add(top_level)
+        for lookup, field, many in relations:
+            target = prefetch_related if many else select_related
+            if lookup not in target:
+                target.append(lookup)
+
+    # Nested lookups already load their parents.
+    select_related = [
+        path
+        for path in select_related
+        if not any(other.startswith(f"{path}__") for other in select_related)
+    ]
+    return {
+        "select_related": select_related,
+        "prefetch_related": prefetch_related,
+        "only": sorted(only) if only_fields and not opaque else None,
+        "opaque": opaque,
+    }
+
+
+def _get_prefetch(model, path):
+    """
+    Prefetch ``path`` in the order ``Manager.first()`` reads it, so the
+    ``get_field`` filter shows the same first related object.
+    """
+    field = None
+    current_model = model
+    for part in path.split("__"):
+        field = current_model._meta.get_field(part)
+        current_model = field.related_model
+    if isinstance(field, GenericForeignKey) or not (
+        field.many_to_many or field.one_to_many
+    ):
+        return path
+    queryset = current_model._default_manager.all()
+    if not queryset.ordered:
+        queryset = queryset.order_by("pk")
+    return Prefetch(path, queryset=queryset)
+
+
+def apply_query_plan(queryset, plan):
+    """Apply a plan from ``plan_related_lookups`` to ``queryset``."""
+    if plan["select_related"]:
+        queryset = queryset.select_related(*plan["select_related"])
+    if plan["prefetch_related"]:
+        queryset = queryset.prefetch_related(
+            *[_get_prefetch(queryset.model, path) for path in plan["prefetch_related"]]
+        )
+    if plan["only"]:
+        queryset = queryset.only(*plan["only"])
+    return queryset
+
+
+def describe_query_plan(model, plan):
+    """Return a readable report of ``plan`` for debug logging."""
+    lines = [f"Query plan for {model._meta.label} list:"]
+    for key in ("select_related", "prefetch_related", "only", "opaque"):
+        value = plan[key]
+        lines.append(f"  {key}: {', '.join(value) if value else '-'}")
+    return "\n".join(lines)
@@ -0,0 +1,266 @@
+"""
+Search index of the global search models.
+
+Global search used to run an ``icontains`` query over five text fields of
+every registered model, and count each result set several times. The
+searchable text of each record is now kept, lower-cased, in one
+``SearchDocument`` row maintained by post_save/post_delete signals (see
+``signals.py``), so a search reads a single table and the matches of every
+model are counted with one grouped query. Bulk writes, which send no
+signals, refresh the documents of the records they wrote with
+``index_records``.
+
+Documents of existing records are built with ``rebuild_search_index``
+(management command or Celery task). Each build records the search fields
+it used in ``SearchIndexState``; a model without a state matching its
+current search fields keeps being searched on its own table.
+"""
+
+import logging
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import CharField, Count, ForeignKey, Q, TextField
+from django.utils import timezone
+
+from horilla.registry.feature import FEATURE_REGISTRY
+from horilla_core.models import Company, CompanyFilteredManager
+from horilla_generics.models import SearchDocument, SearchIndexState
+
+logger = logging.getLogger(__name__)
+
+SEARCH_INDEX_BATCH_SIZE = getattr(settings, "SEARCH_INDEX_BATCH_SIZE", 1000)
+
+# Standard fields that are never searched
+EXCLUDED_SEARCH_FIELDS = [
+    "is_active",
+    "additional_info",
+    "company",
+    "created_at",
+    "created_by",
+    "updated_at",
+    "updated_by",
+    "history",
+    "id",
+    "password",
+]
+
+
+def get_search_models():
+    """Models registered for global search."""
+    return list(FEATURE_REGISTRY.get("global_search_models", []))
+
+
+def get_search_fields(model, exclude_fields=None, limit=5):
+    """First ``limit`` text fields (CharField and TextField) of ``model``."""
+    if exclude_fields is None:
+        exclude_fields = EXCLUDED_SEARCH_FIELDS
+    search_fields = []
+    for field in model._meta.fields:
+        if (
+            isinstance(field, (CharField, TextField))
+            and field.name not in exclude_fields
+            and not field.auto_created
+            and not field.is_relation
+        ):
+            search_fields.append(field.name)
+            if len(search_fields) >= limit:
+                break
+    return search_fields
+
+
+def _has_company(model):
+    try:
+        field = model._meta.get_field("company")
+    except Exception:
+        return False
+    return isinstance(field, ForeignKey) and field.related_model is Company
+
+
+def build_content(instance, search_fields):
+    """Lower-cased searchable text of ``instance``, one field per line."""
+    values = []
+    for field_name in search_fields:
+        value = getattr(instance, field_name, None)
+        if value is None:
+            continue
+        value = str(value).strip()
+        if value:
+            values.append(value.lower())
+    return "\n".join(values)
+
+
+def _build_document(instance, content_type, search_fields, has_company):
+    return SearchDocument(
+        content_type=content_type,
+        object_id=instance.pk,
+        company_id=instance.company_id if has_company else None,
+        content=build_content(instance, search_fields),
+        updated_at=timezone.now(),
+    )
+
+
+def index_instance(instance):
+    """Create or refresh the search document of ``instance``."""
+    model = type(instance)
+    document = _build_document(
+        instance,
+        ContentType.objects.get_for_model(model),
+        get_search_fields(model),
+        _has_company(model),
+    )
+    SearchDocument.objects.update_or_create(
+        content_type=document.content_type,
+        object_id=document.object_id,
+        defaults={
+            "company_id": document.company_id,
+            "content": document.content,
+            "updated_at": document.updated_at,
+        },
+    )
+
+
+def unindex_instance(instance):
+    """Delete the search document of ``instance``."""
+    SearchDocument.objects.filter(
+        content_type=ContentType.objects.get_for_model(type(instance)),
+        object_id=instance.pk,
+    ).delete()
+
+
+def index_records(model, pks):
+    """
+    Refresh the search documents of the ``model`` records with primary keys
+    ``pks``. Bulk writes (``bulk_create``, ``bulk_update``,
+    ``QuerySet.update``) send no post_save signal, so their callers index
+    the written records with this. Does nothing for other models.
+    """
+    if model not in get_search_models():
+        return 0
+    pks = list(pks)
+    if any(pk is None for pk in pks):
+        # bulk_create did not return the new primary keys on this backend
+        mark_index_stale(model)
+        return 0
+    content_type = ContentType.objects.get_for_model(model)
+    search_fields = get_search_fields(model)
+    has_company = _has_company(model)
+    only = [model._meta.pk.name, *search_fields]
+    if has_company:
+        only.append("company")
+
+    written = 0
+    for start in range(0, len(pks), SEARCH_INDEX_BATCH_SIZE):
+        batch = [
+            _build_document(instance, content_type, search_fields, has_company)
+            for instance in model._base_manager.only(*only).filter(
+                pk__in=pks[start : start + SEARCH_INDEX_BATCH_SIZE]
+            )
+        ]
+        SearchDocument.objects.bulk_create(
+            batch,
+            update_conflicts=True,
+            unique_fields=["content_type", "object_id"],
+            update_fields=["company", "content", "updated_at"],
+        )
+        written += len(batch)
+    return written
+
+
+def mark_index_stale(model):
+    """
+    Drop the index state of ``model`` so it is searched on its own table
+    until ``rebuild_search_index`` builds its documents again.
+    """
+    SearchIndexState.objects.filter(
+        content_type=ContentType.objects.get_for_model(model)
+    ).delete()
+
+
+def rebuild_model_index(model):
+    """
+    Rebuild the search documents of every record of ``model`` and mark its
+    index as complete. Returns the number of documents written.
+    """
+    content_type = ContentType.objects.get_for_model(model)
+    search_fields = get_search_fields(model)
+    has_company = _has_company(model)
+    only = [model._meta.pk.name, *search_fields]
+    if has_company:
+        only.append("company")
+
+    written = 0
+    with transaction.atomic():
+        SearchDocument.objects.filter(content_type=content_type).delete()
+        batch = []
+        for instance in (
+            model._base_manager.only(*only)
+            .order_by("pk")
+            .iterator(chunk_size=SEARCH_INDEX_BATCH_SIZE)
+        ):
+            batch.append(
+                _build_document(instance, content_type, search_fields, has_company)
+            )
+            if len(batch) >= SEARCH_INDEX_BATCH_SIZE:
+                SearchDocument.objects.bulk_create(batch)
+                written += len(batch)
+                batch = []
+        if batch:
+            SearchDocument.objects.bulk_create(batch)
+            written += len(batch)
+        SearchIndexState.objects.update_or_create(
+            content_type=content_type,
+            defaults={"search_fields": search_fields, "built_at": timezone.now()},
+        )
+    logger.info(f"Indexed {written} {model._meta.label} records for global search")
+    return written
+
+
+def get_index_states():
+    """``{content_type_id: search_fields}`` of the models with a built index."""
+    return dict(
+        SearchIndexState.objects.values_list("content_type_id", "search_fields")
+    )
+
+
+def search_documents(query):
+    """Search documents containing ``query``, case-insensitively."""
+    return SearchDocument.objects.filter(content__contains=query.lower())
+
+
+def get_document_scope(model, request):
+    """
+    Condition limiting search documents to the records ``model.objects``
+    returns in ``request``, or ``None`` when the manager filters on more
+    than the documents record (the matches must then be counted on the
+    model itself).
+    """
+    manager = model.objects
+    if type(manager) is CompanyFilteredManager:
+        company = getattr(request, "active_company", None)
+        return Q(company=company) if company else Q()
+    if not manager.all().query.has_filters():
+        return Q()
+    return None
+
+
+def count_documents(documents, scopes):
+    """
+    Count ``documents`` per content type with one grouped query. ``scopes``
+    maps the content type ids to count to their ``get_document_scope``.
+    """
+    if not scopes:
+        return {}
+    condition = reduce(
+        or_,
+        (Q(content_type_id=pk) & scope for pk, scope in scopes.items()),
+    )
+    return dict(
+        documents.filter(condition)
+        .values("content_type")
+        .annotate(count=Count("id"))
+        .values_list("content_type", "count")
+    )
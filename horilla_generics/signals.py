@@ -1,8 +1,17 @@
+import logging
+
 from django.core.cache import cache
 from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
 from horilla_core.models import ListColumnVisibility
+from horilla_generics.search_index import (
+    get_search_models,
+    index_instance,
+    unindex_instance,
+)
+
+logger = logging.getLogger(__name__)
 
 # Define your horilla_generics signals here
 
@@ -14,3 +23,34 @@ def clear_cache_on_delete(sender, instance, **kwargs):
     """
     cache_key = f"visible_columns_{instance.user.id}_{instance.app_label}_{instance.model_name}_{instance.context}_{instance.url_name}"
     cache.delete(cache_key)
+
+
+def update_search_document(sender, instance, **kwargs):
+    """Keep the search document of a global search record up to date."""
+    try:
+        index_instance(instance)
+    except Exception as e:
+        logger.error(f"Error indexing {sender._meta.label} {instance.pk}: {e}")
+
+
+def delete_search_document(sender, instance, **kwargs):
+    """Drop the search document of a deleted global search record."""
+    try:
+        unindex_instance(instance)
+    except Exception as e:
+        logger.error(f"Error unindexing {sender._meta.label} {instance.pk}: {e}")
+
+
+# Connected per model: a receiver for every sender would stop Django from
+# fast-deleting cascaded rows of unrelated models.
+for search_model in get_search_models():
+    post_save.connect(
+        update_search_document,
+        sender=search_model,
+        dispatch_uid=f"search_index_save_{search_model._meta.label_lower}",
+    )
+    post_delete.connect(
+        delete_search_document,
+        sender=search_model,
+        dispatch_uid=f"search_index_delete_{search_model._meta.label_lower}",
+    )
@@ -0,0 +1,28 @@
+"""Celery tasks for horilla_generics app."""
+
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def rebuild_search_index(model_label=None):
+    """
+    Rebuild the global search documents of one model (``app_label.Model``)
+    or, without a label, of every global search model.
+    """
+    from django.apps import apps
+
+    from .search_index import get_search_models, rebuild_model_index
+
+    models = [apps.get_model(model_label)] if model_label else get_search_models()
+    written = 0
+    for model in models:
+        try:
+            written += rebuild_model_index(model)
+        except Exception as e:
+            logger.error(f"Error rebuilding search index of {model._meta.label}: {e}")
+            logger.exception(e)
+    return f"Indexed {written} records"
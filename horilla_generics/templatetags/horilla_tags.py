@@ -18,7 +18,7 @@ from django.utils.translation import gettext_lazy as _
 
 from horilla.menu.sub_section_menu import get_sub_section_menu
 from horilla.registry.js_registry import get_registered_js
-from horilla_core.models import MultipleCurrency
+from horilla_core.currency import get_currency_context
 from horilla_core.utils import get_currency_display_value
 from horilla_utils.middlewares import _thread_local
 
@@ -41,8 +41,14 @@ def get_field(obj, field_path):
         for part in parts:
             parent = current  # keep track of the parent object before resolving part
             current = getattr(current, part)
-            if isinstance(current, (Manager, QuerySet)):
-                current = current.first()
+            if isinstance(current, Manager):
+                current = current.all()
+            if isinstance(current, QuerySet):
+                if current._result_cache is not None:
+                    # Prefetched by the list view's query plan.
+                    current = next(iter(current._result_cache), None)
+                else:
+                    current = current.first()
                 if not current:
                     return ""
             elif callable(current):
@@ -922,7 +928,9 @@ def format_currency(value, user):
     if not value:
         return ""
 
-    user_currency = MultipleCurrency.get_user_currency(user)
+    user_currency = get_currency_context(
+        getattr(user, "company_id", None), user
+    ).user_currency
     if user_currency:
         return user_currency.display_with_symbol(value)
 
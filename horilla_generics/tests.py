@@ -1,3 +1,304 @@
-from django.test import TestCase
+import base64
+import json
+from unittest import mock
+
+from django.contrib.sessions.backends.db import SessionStore
+from django.test import RequestFactory, TestCase
+from django.urls import resolve, reverse
+
+from horilla_core.middlewares import ActiveCompanyMiddleware
+from horilla_core.departments import DepartmentListView
+from horilla_core.models import Company, Department, HorillaUser
+from horilla_generics.global_search import GlobalSearchView
+from horilla_generics.navigation import (
+    get_navigation_queryset,
+    get_navigation_signature,
+    get_neighbour_ids,
+    register_navigation,
+)
+from horilla_generics.pagination import InvalidCursor, KeysetPaginator
+from horilla_generics.search_index import get_search_models, rebuild_model_index
+from horilla_generics.views import HorillaKanbanView, HorillaListView
+from horilla_utils.middlewares import reset_current_request, set_current_request
 
 # Create your horilla_generics tests here.
+
+
+class ListNavigationTest(TestCase):
+    """
+    The list a user navigates through is rebuilt from the session, so a
+    detail view served by any worker process follows its filters and sort.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = Company.objects.create(
+            name="Main", no_of_employees=1, email="main@example.com"
+        )
+        cls.user = HorillaUser.objects.create_superuser(
+            "navigator", "navigator@example.com", "password", company=cls.company
+        )
+        for name in ["Sales East", "Support", "Sales West", "Finance", "Sales North"]:
+            Department.objects.create(
+                department_name=name,
+                company=cls.company,
+                created_by=cls.user,
+                updated_by=cls.user,
+            )
+
+    def make_request(self, path, session):
+        request = RequestFactory().get(path)
+        request.user = self.user
+        request.session = session
+        request.resolver_match = resolve(request.path)
+        ActiveCompanyMiddleware(lambda request: None)(request)
+        token = set_current_request(request)
+        self.addCleanup(reset_current_request, token)
+        return request
+
+    def render_list(self, session, query):
+        request = self.make_request(
+            f"{reverse('horilla_core:department_list_view')}?{query}", session
+        )
+        view = DepartmentListView()
+        view.setup(request)
+        view.object_list = view.get_queryset()
+        self.assertTrue(register_navigation(request, view))
+        return list(view.object_list.values_list("pk", flat=True))
+
+    def test_list_is_rebuilt_from_the_session(self):
+        session = SessionStore()
+        listed = self.render_list(
+            session, "search=sales&sort=department_name&direction=desc"
+        )
+        self.assertEqual(
+            [Department.objects.get(pk=pk).department_name for pk in listed],
+            ["Sales West", "Sales North", "Sales East"],
+        )
+        session.save()
+
+        # Another worker process: only the stored session is shared
+        request = self.make_request("/", SessionStore(session.session_key))
+        queryset = get_navigation_queryset(request, Department)
+        self.assertEqual(list(queryset.values_list("pk", flat=True)), listed)
+        middle = Department.objects.get(pk=listed[1])
+        self.assertEqual(get_neighbour_ids(queryset, middle), (listed[0], listed[2]))
+        first = Department.objects.get(pk=listed[0])
+        self.assertEqual(
+            get_neighbour_ids(queryset, first, wrap=True), (listed[-1], listed[1])
+        )
+        self.assertTrue(get_navigation_signature(request, Department))
+
+    def test_hand_configured_list_is_not_registered(self):
+        session = SessionStore()
+        self.render_list(session, "")
+        request = self.make_request("/", session)
+        view = HorillaListView()
+        view.request = request
+        view.model = Department
+        view.kwargs = {}
+        self.assertIsNone(register_navigation(request, view))
+        self.assertIsNone(get_navigation_queryset(request, Department))
+        self.assertEqual(get_navigation_signature(request, Department), "")
+
+
+class KeysetPaginatorTest(TestCase):
+    """
+    Keyset pages and neighbours follow the same order as the queryset,
+    with NULLs, descending orderings and ties on the ordering values.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        company = Company.objects.create(
+            name="Main", no_of_employees=1, email="main@example.com"
+        )
+        user = HorillaUser.objects.create_superuser(
+            "pager", "pager@example.com", "password", company=company
+        )
+        for name, description in [
+            ("Sales", "B"),
+            ("Support", None),
+            ("Finance", "A"),
+            ("Legal", None),
+            ("Operations", "B"),
+            ("Research", "C"),
+            ("Marketing", "A"),
+        ]:
+            Department.all_objects.create(
+                department_name=name,
+                description=description,
+                company=company,
+                created_by=user,
+                updated_by=user,
+            )
+        cls.queryset = Department.all_objects.filter(company=company)
+
+    def expected_ids(self, ordering):
+        """The ids in ``ordering``, NULLs smallest and the pk breaking ties."""
+        rows = list(self.queryset)
+        last_descending = ordering[-1].startswith("-")
+        rows.sort(key=lambda row: row.pk, reverse=last_descending)
+        for item in reversed(ordering):
+            name = item.lstrip("-")
+            rows.sort(
+                key=lambda row: (
+                    getattr(row, name) is not None,
+                    getattr(row, name) or "",
+                ),
+                reverse=item.startswith("-"),
+            )
+        return [row.pk for row in rows]
+
+    def test_pages_and_neighbours_follow_the_ordering(self):
+        for ordering in (
+            ["description"],
+            ["-description"],
+            ["-description", "department_name"],
+            ["description", "-department_name"],
+            ["-pk"],
+        ):
+            with self.subTest(ordering=ordering):
+                paginator = KeysetPaginator(self.queryset.order_by(*ordering), 2)
+                self.assertTrue(paginator.is_supported)
+                expected = self.expected_ids(ordering)
+
+                ids, cursor = [], None
+                while True:
+                    page = paginator.page(cursor)
+                    ids.extend(row.pk for row in page)
+                    if not page.has_next():
+                        break
+                    cursor = page.next_cursor
+                self.assertEqual(ids, expected)
+
+                padded = [None, *expected, None]
+                for row in self.queryset:
+                    position = padded.index(row.pk)
+                    self.assertEqual(
+                        paginator.get_neighbour_ids(row),
+                        (padded[position - 1], padded[position + 1]),
+                    )
+                self.assertEqual(paginator.get_edge_ids(), (expected[0], expected[-1]))
+
+    def test_unsupported_orderings(self):
+        self.assertFalse(
+            KeysetPaginator(self.queryset.order_by("company__name"), 2).is_supported
+        )
+        self.assertFalse(KeysetPaginator(self.queryset.order_by("?"), 2).is_supported)
+
+    def test_invalid_cursors(self):
+        paginator = KeysetPaginator(self.queryset.order_by("description"), 2)
+        for cursor in (
+            "not a cursor",
+            base64.urlsafe_b64encode(b"{}").decode(),
+            base64.urlsafe_b64encode(json.dumps(["A"]).encode()).decode(),
+            base64.urlsafe_b64encode(json.dumps(["A", "x"]).encode()).decode(),
+        ):
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(InvalidCursor):
+                    paginator.page(cursor)
+
+
+class KanbanColumnTest(TestCase):
+    """
+    The column counts and first pages read in one query each match the
+    per-column querysets they replace, including the column of empty values.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        company = Company.objects.create(
+            name="Main", no_of_employees=1, email="main@example.com"
+        )
+        cls.users = [
+            HorillaUser.objects.create_superuser(
+                f"owner{index}", f"owner{index}@example.com", "password"
+            )
+            for index in range(3)
+        ]
+        owners = [cls.users[0]] * 4 + [cls.users[1]] * 2 + [None] * 3
+        for index, owner in enumerate(owners):
+            Department.all_objects.create(
+                department_name=f"Department {index}",
+                company=company,
+                created_by=cls.users[0],
+                updated_by=owner,
+            )
+        cls.queryset = Department.all_objects.filter(company=company)
+
+    def test_columns_match_per_column_querysets(self):
+        view = HorillaKanbanView()
+        view.paginate_by = 3
+        field = Department._meta.get_field("updated_by")
+        counts = view.get_column_counts(self.queryset, field)
+        first_pages = view.get_column_first_pages(self.queryset, field)
+
+        for user in [*self.users, None]:
+            with self.subTest(user=user):
+                column = self.queryset.filter(updated_by=user).order_by("id")
+                key = user.pk if user else None
+                self.assertEqual(counts.get(key, 0), column.count())
+                self.assertEqual(
+                    [item.pk for item in first_pages.get(key, [])],
+                    [item.pk for item in column[: view.paginate_by]],
+                )
+        self.assertEqual(sum(counts.values()), self.queryset.count())
+
+
+class GlobalSearchCountTest(TestCase):
+    """
+    Global search counts read from the search index match the ``icontains``
+    counts of the models searched on their own tables.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = Company.objects.create(
+            name="Sales Main", no_of_employees=1, email="main@example.com"
+        )
+        other = Company.objects.create(
+            name="Branch", no_of_employees=1, email="sales@branch.example.com"
+        )
+        cls.user = HorillaUser.objects.create_superuser(
+            "searcher", "searcher@example.com", "password", company=cls.company
+        )
+        for company, name, description in [
+            (cls.company, "Sales East", None),
+            (cls.company, "Support", "Helps the SALES team"),
+            (cls.company, "Finance", "Budgets"),
+            (other, "Sales West", None),
+            (other, "Legal", "Sales contracts"),
+        ]:
+            Department.all_objects.create(
+                department_name=name,
+                description=description,
+                company=company,
+                created_by=cls.user,
+                updated_by=cls.user,
+            )
+
+    def get_counts(self, query):
+        request = RequestFactory().get("/")
+        request.user = self.user
+        request.active_company = self.company
+        token = set_current_request(request)
+        self.addCleanup(reset_current_request, token)
+        view = GlobalSearchView()
+        return view.get_result_counts(request, view.get_dynamic_model_config(), query)
+
+    def test_index_counts_match_table_counts(self):
+        queries = ["sales", "SALES", "example.com", "nothing like this"]
+        table_counts = {query: self.get_counts(query) for query in queries}
+        self.assertEqual(table_counts["sales"]["Department"], 2)
+
+        for model in get_search_models():
+            rebuild_model_index(model)
+        for query in queries:
+            with self.subTest(query=query):
+                with mock.patch.object(
+                    GlobalSearchView,
+                    "get_search_queryset",
+                    side_effect=AssertionError("counted on the model table"),
+                ):
+                    self.assertEqual(self.get_counts(query), table_counts[query])
@@ -1,7 +1,7 @@
 from django.urls import path
 
 from horilla_generics import horilla_support_views as view
-from horilla_generics.global_search import GlobalSearchView
+from horilla_generics.global_search import GlobalSearchTypeaheadView, GlobalSearchView
 
 from . import views
 
@@ -79,6 +79,11 @@ urlpatterns = [
         name="model_select2",
     ),
     path("search/", GlobalSearchView.as_view(), name="global_search"),
+    path(
+        "search/typeahead/",
+        GlobalSearchTypeaheadView.as_view(),
+        name="global_search_typeahead",
+    ),
     path(
         "remove-condition-row/<str:row_id>/",
         view.RemoveConditionRowView.as_view(),
@@ -31,9 +31,10 @@ from django.core.exceptions import (
     ValidationError,
 )
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
 from django.db import IntegrityError, models, transaction
-from django.db.models import Case, ForeignKey, Max, Q, When
+from django.db.models import Case, Count, F, ForeignKey, Max, Q, When, Window
+from django.db.models.functions import RowNumber
 from django.db.models.fields.related import ForeignKey, ManyToManyField
 from django.forms import ValidationError
 from django.http import Http404, HttpResponse, QueryDict
@@ -70,6 +71,7 @@ from horilla_core.models import (
     RecentlyViewed,
     RecycleBin,
 )
+from horilla_core.signals import records_bulk_changed
 from horilla_core.utils import get_field_permissions_for_model
 from horilla_generics.forms import (
     HorillaAttachmentForm,
@@ -77,7 +79,22 @@ from horilla_generics.forms import (
     HorillaModelForm,
     HorillaMultiStepForm,
 )
-from horilla_utils.methods import closest_numbers, get_section_info_for_model
+from horilla_generics.navigation import (
+    get_navigation_queryset,
+    get_navigation_session_key,
+    get_navigation_signature,
+    get_neighbour_ids,
+    register_navigation,
+)
+from horilla_generics.pagination import InvalidCursor, KeysetPaginator
+from horilla_generics.query_plan import (
+    apply_query_plan,
+    describe_query_plan,
+    get_attr_placeholders,
+    plan_related_lookups,
+)
+from horilla_generics.search_index import index_records
+from horilla_utils.methods import get_section_info_for_model
 from horilla_utils.middlewares import _thread_local
 
 logger = logging.getLogger(__name__)
@@ -292,12 +309,15 @@ class HorillaListView(ListView):
     owner_filtration = True
     sorting_target = None
     exclude_columns_from_sorting = []
+    keyset_pagination = False
+    cursor_kwarg = "cursor"
+    only_column_fields = False
 
     def __init__(self, **kwargs):
         self._model_fields_cache = None
         super().__init__(**kwargs)
         if self.store_ordered_ids:
-            self.ordered_ids_key = f"ordered_ids_{self.model.__name__.lower()}"
+            self.ordered_ids_key = get_navigation_session_key(self.model)
         self.kwargs = kwargs
 
         if self.columns:
@@ -355,10 +375,9 @@ class HorillaListView(ListView):
             )
 
         if view_type == "recently_viewed":
-            recently_viewed_items = RecentlyViewed.objects.get_recently_viewed(
+            pks = RecentlyViewed.objects.get_recently_viewed_ids(
                 user=self.request.user, model_class=self.model
             )
-            pks = [item.pk for item in recently_viewed_items if item]
             queryset = queryset.filter(pk__in=pks)
 
         elif view_type in ("recently_created", "recently_modified"):
@@ -427,7 +446,9 @@ class HorillaListView(ListView):
         elif self.default_sort_field:
             # Use default_sort_field if specified in child class
             order_prefix = "-" if self.default_sort_direction == "desc" else ""
-            queryset = queryset.order_by(f"{order_prefix}{self.default_sort_field}")
+            queryset = queryset.order_by(
+                f"{order_prefix}{self.default_sort_field}", f"{order_prefix}pk"
+            )
         else:
             queryset = queryset.order_by("-id")
         # elif sort_field:
@@ -439,10 +460,6 @@ class HorillaListView(ListView):
         # else:
         #     queryset = queryset.order_by("-id")
 
-        if self.store_ordered_ids:
-            ordered_ids = list(queryset.values_list("pk", flat=True))
-            self.request.session[self.ordered_ids_key] = ordered_ids
-
         if self.owner_filtration:
             user = self.request.user
             app_label = self.model._meta.app_label
@@ -615,9 +632,12 @@ class HorillaListView(ListView):
             pass
 
         order_field = f"-{mapped_field}" if direction == "desc" else mapped_field
+        # The primary key breaks ties so the rows have one stable order for
+        # pagination and for previous/next navigation from detail views.
+        tie_breaker = "-pk" if direction == "desc" else "pk"
 
         try:
-            return queryset.order_by(order_field)
+            return queryset.order_by(order_field, tie_breaker)
         except Exception as e:
             import logging
 
@@ -625,6 +645,55 @@ class HorillaListView(ListView):
             logger.warning(f"Could not sort by field '{mapped_field}': {str(e)}")
             return queryset
 
+    def get_column_query_plan(self):
+        """
+        Plan the ``select_related``/``prefetch_related``/``only()`` lookups
+        that the visible columns, the cell and row attributes and the action
+        permission checks read on each row.
+        """
+        if getattr(self, "_column_query_plan", None) is None:
+            columns = self._get_columns() or self.columns
+            paths = tuple(col[1] for col in columns if len(col) >= 2 and col[1])
+            extra_paths = get_attr_placeholders(
+                list(self.col_attrs or [])
+                + [self.raw_attrs or {}]
+                + [action for action in self.actions or [] if isinstance(action, dict)]
+            )
+            extra_paths += list(getattr(self.model, "OWNER_FIELDS", []))
+            for sort_field in (self.request.GET.get("sort"), self.default_sort_field):
+                if sort_field:
+                    extra_paths.append(sort_field)
+            self._column_query_plan = plan_related_lookups(
+                self.model,
+                paths,
+                tuple(dict.fromkeys(extra_paths)),
+                self.only_column_fields,
+            )
+            logger.debug(describe_query_plan(self.model, self._column_query_plan))
+        return self._column_query_plan
+
+    def paginate_queryset(self, queryset, page_size):
+        """
+        Paginate by keyset (``?cursor=``) when ``keyset_pagination`` is
+        enabled and the ordering allows it, otherwise by page number.
+        """
+        queryset = apply_query_plan(queryset, self.get_column_query_plan())
+        if self.keyset_pagination:
+            paginator = KeysetPaginator(queryset, page_size)
+            if paginator.is_supported:
+                try:
+                    page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+                except InvalidCursor:
+                    raise Http404(_("Invalid cursor."))
+                return (paginator, page, page.object_list, page.has_next())
+        return super().paginate_queryset(queryset, page_size)
+
+    def is_cursor_request(self):
+        """True when this request fetches a following keyset page."""
+        return self.keyset_pagination and bool(
+            self.request.GET.get(self.cursor_kwarg)
+        )
+
     def render_to_response(self, context, **response_kwargs):
         """Override to handle different types of requests appropriately."""
         is_htmx = self.request.headers.get("HX-Request") == "true"
@@ -1942,7 +2011,16 @@ class HorillaListView(ListView):
             content_type = ContentType.objects.get_for_model(self.model)
             user = self.request.user if self.request.user.is_authenticated else None
 
-            updated_count = queryset.update(**update_dict)
+            audit_fields = {}
+            field_names = {field.name for field in self.model._meta.fields}
+            if "updated_at" in field_names:
+                audit_fields["updated_at"] = timezone.now()
+            if "updated_by" in field_names and user:
+                audit_fields["updated_by"] = user
+
+            updated_count = queryset.update(**{**audit_fields, **update_dict})
+            index_records(self.model, records_before)
+            records_bulk_changed.send(sender=self.model, pks=list(records_before))
 
             if updated_count > 0:
                 for record_id in record_ids:
@@ -2171,9 +2249,11 @@ class HorillaListView(ListView):
     def get_context_data(self, **kwargs):
         """Enhance context with column and filtering information."""
         context = super().get_context_data(**kwargs)
+        if not self.is_cursor_request():
+            # Following keyset pages belong to an already registered list.
+            register_navigation(self.request, self)
         if self.store_ordered_ids:
             context["ordered_ids_key"] = self.ordered_ids_key
-            context["ordered_ids"] = self.request.session.get(self.ordered_ids_key, [])
 
         filter_fields = self._get_model_fields()
         view_type = self.request.GET.get("view_type") or self.get_default_view_type()
@@ -2263,10 +2343,14 @@ class HorillaListView(ListView):
         context["is_htmx_request"] = self.request.headers.get("HX-Request") == "true"
         context["has_next"] = False
         context["next_page"] = None
+        context["next_cursor"] = None
         if "page_obj" in context and context["page_obj"] is not None:
             context["has_next"] = context["page_obj"].has_next()
             if context["has_next"]:
                 context["next_page"] = context["page_obj"].next_page_number()
+                context["next_cursor"] = getattr(
+                    context["page_obj"], "next_cursor", None
+                )
         context["search_url"] = self.search_url or self.request.path
         context["main_url"] = self.main_url or self.request.path
         query_params = {
@@ -2380,8 +2464,26 @@ class HorillaListView(ListView):
 
         context["model_name"] = self.model.__name__
         context["app_label"] = self.model._meta.app_label
-        context["total_records_count"] = self.get_queryset().count()
-        context["selected_ids"] = list(self.get_queryset().values_list("id", flat=True))
+        is_cursor_request = self.is_cursor_request()
+        if is_cursor_request:
+            # Following keyset pages only append rows to the table, so the
+            # totals and the ids used by "select all" are not recomputed;
+            # the total is counted only when asked for with ?count=true.
+            context["total_records_count"] = (
+                self.get_queryset().count()
+                if self.request.GET.get("count") == "true"
+                else None
+            )
+            context["selected_ids"] = []
+        else:
+            context["selected_ids"] = list(
+                self.get_queryset().values_list("id", flat=True)
+            )
+            context["total_records_count"] = (
+                len(context["selected_ids"])
+                if self.keyset_pagination
+                else self.get_queryset().count()
+            )
         context["selected_ids_json"] = json.dumps(context["selected_ids"])
         context["custom_bulk_actions"] = self.custom_bulk_actions
         context["additional_action_button"] = self.additional_action_button
@@ -2395,12 +2497,10 @@ class HorillaListView(ListView):
         context["enable_sorting"] = self.enable_sorting
         context["sorting_target"] = self.sorting_target
         context["bulk_delete_enabled"] = self.bulk_delete_enabled
-        queryset_ids = list(self.get_queryset().values_list("id", flat=True))
-        session_key = f"list_view_queryset_ids_{self.model._meta.model_name}"
-        self.request.session[session_key] = queryset_ids
         query_params = self.request.GET.copy()
-        if "page" in query_params:
-            del query_params["page"]
+        for param in ("page", self.cursor_kwarg, "count"):
+            if param in query_params:
+                del query_params[param]
         context["search_params"] = query_params.urlencode()
         # context["bulk_delete_url"] = reverse("horilla_generics:generic_bulk_delete")
         context["filter_set_class"] = self.filterset_class
@@ -2449,37 +2549,132 @@ class HorillaKanbanView(HorillaListView):
 
         return super().dispatch(request, *args, **kwargs)
 
+    def get_modify_permission(self):
+        """
+        Resolve once per request how the user may modify items: ``"all"``
+        with the change permission, ``"own"`` with the change_own permission,
+        or None.
+        """
+        if not hasattr(self, "_modify_permission"):
+            user = self.request.user
+            app_label = self.model._meta.app_label
+            model_name = self.model._meta.model_name
+            if user.has_perm(f"{app_label}.change_{model_name}"):
+                self._modify_permission = "all"
+            elif user.has_perm(f"{app_label}.change_own_{model_name}"):
+                self._modify_permission = "own"
+            else:
+                self._modify_permission = None
+        return self._modify_permission
+
+    def get_modifiable_item_ids(self, items):
+        """
+        Return the pks of the items the user is allowed to modify, deciding
+        for a whole page of cards at once. Ownership is read from the owner
+        foreign key columns, so no related owner is loaded.
+        """
+        permission = self.get_modify_permission()
+        if permission == "all":
+            return {item.pk for item in items}
+        if permission != "own":
+            return set()
+
+        user = self.request.user
+        owner_fields = []
+        for owner_field in getattr(self.model, "OWNER_FIELDS", []):
+            try:
+                field = self.model._meta.get_field(owner_field)
+            except FieldDoesNotExist:
+                continue
+            if field.many_to_one:
+                owner_fields.append((field.attname, user.pk))
+            else:
+                owner_fields.append((owner_field, user))
+
+        modifiable = set()
+        for item in items:
+            for attribute, owner in owner_fields:
+                if getattr(item, attribute, None) == owner:
+                    modifiable.add(item.pk)
+                    break
+        return modifiable
+
     def can_user_modify_item(self, item):
         """
         Check if the user has permission to modify the item.
         Returns True if user can modify, False otherwise.
         """
-        user = self.request.user
-        model = self.model
-        app_label = model._meta.app_label
-        model_name = model._meta.model_name
+        return item.pk in self.get_modifiable_item_ids([item])
 
-        # Check if user has global change permission
-        change_perm = f"{app_label}.change_{model_name}"
-        if user.has_perm(change_perm):
-            return True
+    def get_card_columns(self, group_by):
+        """
+        Compile, once per view, how each card column is read: the columns
+        shown on the cards with an accessor per column, and the
+        ``select_related`` paths that make those accessors query-free.
+        """
+        if not hasattr(self, "_card_columns"):
+            self._card_columns = {}
+        if group_by in self._card_columns:
+            return self._card_columns[group_by]
+
+        opts = self.model._meta
+        columns = []
+        select_related = []
+        for verbose_name, field_name in self.columns:
+            if field_name == group_by:
+                continue
+            column = {"name": field_name, "label": verbose_name, "call": True}
+            display_field = None
+            if field_name.startswith("get_") and field_name.endswith("_display"):
+                display_field = field_name[4:-8]
+            try:
+                field = opts.get_field(display_field or field_name)
+            except FieldDoesNotExist:
+                field = None
+            if field is not None and field.concrete:
+                column["call"] = display_field is not None
+                if field.many_to_one or field.one_to_one:
+                    select_related.append(field.name)
+            columns.append(column)
+
+        # Card actions check ownership through the owner relations.
+        for owner_field in getattr(self.model, "OWNER_FIELDS", []):
+            try:
+                field = opts.get_field(owner_field)
+            except FieldDoesNotExist:
+                continue
+            if field.many_to_one and field.name not in select_related:
+                select_related.append(field.name)
 
-        # Check for change_own permission
-        change_own_perm = f"{app_label}.change_own_{model_name}"
-        if user.has_perm(change_own_perm):
-            # Get owner fields from model
-            owner_fields = getattr(model, "OWNER_FIELDS", [])
+        self._card_columns[group_by] = (columns, select_related)
+        return columns, select_related
 
-            # Check if user owns this item
-            for owner_field in owner_fields:
+    def set_card_attributes(self, items, columns, stringify=False):
+        """
+        Set ``can_drag`` and ``display_columns`` on a page of cards using the
+        batched permission check and the compiled card columns.
+        """
+        modifiable = self.get_modifiable_item_ids(items)
+        for item in items:
+            item.can_drag = item.pk in modifiable
+            item.display_columns = []
+            for column in columns:
+                field_name = column["name"]
                 try:
-                    owner_value = getattr(item, owner_field, None)
-                    if owner_value == user:
-                        return True
+                    value = getattr(item, field_name)
+                    if column["call"] and callable(value):
+                        value = value()
                 except AttributeError:
-                    continue
-
-        return False
+                    value = None
+                if stringify:
+                    value = str(value) if value is not None else "N/A"
+                item.display_columns.append(
+                    {
+                        "name": field_name,
+                        "label": column["label"],
+                        "value": value,
+                    }
+                )
 
     def post(self, request, *args, **kwargs):
         self.object_list = self.get_queryset()
@@ -2737,6 +2932,41 @@ class HorillaKanbanView(HorillaListView):
         ).first()
         return default_group.field_name if default_group else self.group_by_field
 
+    def get_column_counts(self, queryset, field):
+        """
+        Return the number of items in every column, ``{group value: count}``,
+        with a single GROUP BY query.
+        """
+        rows = (
+            queryset.order_by()
+            .values(field.attname)
+            .annotate(kanban_total=Count("pk"))
+            .order_by()
+        )
+        return {row[field.attname]: row["kanban_total"] for row in rows}
+
+    def get_column_first_pages(self, queryset, field):
+        """
+        Return the first page of items of every column, ``{group value:
+        [items]}``, with a single query numbering the rows of each column
+        with ``ROW_NUMBER() OVER (PARTITION BY group_by ORDER BY id)``.
+        """
+        ranked = (
+            queryset.annotate(
+                kanban_row=Window(
+                    RowNumber(),
+                    partition_by=[F(field.attname)],
+                    order_by=F("id").asc(),
+                )
+            )
+            .filter(kanban_row__lte=self.paginate_by)
+            .order_by(field.attname, "id")
+        )
+        first_pages = {}
+        for item in ranked:
+            first_pages.setdefault(getattr(item, field.attname), []).append(item)
+        return first_pages
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         if not hasattr(self, "object_list"):
@@ -2780,55 +3010,22 @@ class HorillaKanbanView(HorillaListView):
             context["group_by_label"] = field.verbose_name
             context["allow_column_reorder"] = allow_column_reorder
 
-            grouped_items = {}
-            paginated_groups = {}
+            card_columns, card_select_related = self.get_card_columns(group_by)
+            if card_select_related:
+                queryset = queryset.select_related(*card_select_related)
+
+            column_counts = self.get_column_counts(queryset, field)
+            kanban_columns = []
 
             if hasattr(field, "choices") and field.choices:
                 num_columns = len(field.choices)
+                choice_values = set()
                 for value, label in field.choices:
-                    grouped_items[value] = {
-                        "label": label,
-                        "items": queryset.filter(**{group_by: value}),
-                    }
-                existing_values = set(queryset.values_list(group_by, flat=True))
-                for value in existing_values:
-                    if value not in grouped_items:
-                        grouped_items[value] = {
-                            "label": f"Unknown ({value})",
-                            "items": queryset.filter(**{group_by: value}),
-                        }
-
-                sorted_items = {}
-                for value, _ in field.choices:
-                    if value in grouped_items:
-                        sorted_items[value] = grouped_items[value]
-                for key, group in grouped_items.items():
-                    if key not in sorted_items:
-                        sorted_items[key] = group
-
-                for key, group in sorted_items.items():
-                    total_count = group["items"].count()
-                    ordered_items = group["items"].order_by(
-                        "id"
-                    )  # Use 'id' or 'created_at'
-                    paginator = Paginator(ordered_items, self.paginate_by)
-                    page = self.request.GET.get(f"page_{key}", 1)
-                    try:
-                        page_obj = paginator.page(page)
-                    except PageNotAnInteger:
-                        page_obj = paginator.page(1)
-                    except EmptyPage:
-                        page_obj = paginator.page(paginator.num_pages)
-                    paginated_groups[key] = {
-                        "label": group["label"],
-                        "items": page_obj.object_list,
-                        "page_obj": page_obj,
-                        "has_next": page_obj.has_next(),
-                        "next_page": (
-                            page_obj.next_page_number() if page_obj.has_next() else None
-                        ),
-                        "total_count": total_count,
-                    }
+                    choice_values.add(value)
+                    kanban_columns.append((value, label, None))
+                for value in column_counts:
+                    if value not in choice_values:
+                        kanban_columns.append((value, f"Unknown ({value})", None))
 
             elif isinstance(field, ForeignKey):
                 queryset = queryset.prefetch_related(group_by)
@@ -2839,88 +3036,65 @@ class HorillaKanbanView(HorillaListView):
                     related_items = related_model.objects.all().order_by("pk")
 
                 for related_item in related_items:
-                    grouped_items[related_item.pk] = {
-                        "label": str(related_item),
-                        "items": queryset.filter(
-                            **{f"{group_by}__pk": related_item.pk}
-                        ),
-                        "color": (
-                            getattr(related_item, "color", None)
-                            if has_colour_field
-                            else None
-                        ),
-                    }
+                    kanban_columns.append(
+                        (
+                            related_item.pk,
+                            str(related_item),
+                            (
+                                getattr(related_item, "color", None)
+                                if has_colour_field
+                                else None
+                            ),
+                        )
+                    )
+                num_columns = len(related_items)
 
-                if field.null:
-                    grouped_items[None] = {
-                        "label": "None",
-                        "items": queryset.filter(**{f"{group_by}__isnull": True}),
-                        "color": None,
-                    }
-                    num_columns = len(related_items) + 1
-                else:
-                    num_columns = len(related_items)
+                if field.null and column_counts.get(None):
+                    kanban_columns.append((None, "None", None))
+                    num_columns += 1
 
-                if None in grouped_items and not grouped_items[None]["items"].exists():
-                    del grouped_items[None]
-                    if field.null:
-                        num_columns -= 1
+            first_pages = self.get_column_first_pages(queryset, field)
 
-                sorted_items = {}
-                for related_item in related_items:
-                    if related_item.pk in grouped_items:
-                        sorted_items[related_item.pk] = grouped_items[related_item.pk]
-                if None in grouped_items:
-                    sorted_items[None] = grouped_items[None]
-
-                for key, group in sorted_items.items():
-                    total_count = group["items"].count()
-                    ordered_items = group["items"].order_by(
-                        "id"
-                    )  # Use 'id' or 'created_at'
-                    paginator = Paginator(ordered_items, self.paginate_by)
-                    page = self.request.GET.get(f"page_{key}", 1)
+            paginated_groups = {}
+            for key, label, colour in kanban_columns:
+                total_count = column_counts.get(key, 0)
+                page = self.request.GET.get(f"page_{key}", 1)
+                if str(page) == "1":
+                    paginator = Paginator([], self.paginate_by)
+                    paginator.count = total_count
+                    page_obj = Page(first_pages.get(key, []), 1, paginator)
+                else:
+                    paginator = Paginator(
+                        queryset.filter(**{field.attname: key}).order_by("id"),
+                        self.paginate_by,
+                    )
                     try:
                         page_obj = paginator.page(page)
                     except PageNotAnInteger:
                         page_obj = paginator.page(1)
                     except EmptyPage:
                         page_obj = paginator.page(paginator.num_pages)
-                    paginated_groups[key] = {
-                        "label": group["label"],
-                        "items": page_obj.object_list,
-                        "page_obj": page_obj,
-                        "has_next": page_obj.has_next(),
-                        "next_page": (
-                            page_obj.next_page_number() if page_obj.has_next() else None
-                        ),
-                        "total_count": total_count,
-                        "colour": group["color"],
-                    }
+                paginated_groups[key] = {
+                    "label": label,
+                    "items": page_obj.object_list,
+                    "page_obj": page_obj,
+                    "has_next": page_obj.has_next(),
+                    "next_page": (
+                        page_obj.next_page_number() if page_obj.has_next() else None
+                    ),
+                    "total_count": total_count,
+                }
+                if isinstance(field, ForeignKey):
+                    paginated_groups[key]["colour"] = colour
 
-            display_columns = []
-            for verbose_name, field_name in self.columns:
-                if field_name != group_by:
-                    display_columns.append({"name": field_name, "label": verbose_name})
+            display_columns = [
+                {"name": column["name"], "label": column["label"]}
+                for column in card_columns
+            ]
             for key, group in paginated_groups.items():
+                group["items"] = list(group["items"])
                 group["count"] = len(group["items"])
-                for item in group["items"]:
-                    item.can_drag = self.can_user_modify_item(item)
-                    item.display_columns = []
-                    for column in display_columns:
-                        field_name = column["name"]
-                        value = None
-                        if hasattr(item, field_name):
-                            value = getattr(item, field_name)
-                            if callable(value):
-                                value = value()
-                        item.display_columns.append(
-                            {
-                                "name": field_name,
-                                "label": column["label"],
-                                "value": value,
-                            }
-                        )
+                self.set_card_attributes(group["items"], card_columns)
 
             context.update(
                 {
@@ -2978,6 +3152,10 @@ class HorillaKanbanView(HorillaListView):
                         "id"
                     )
 
+            card_columns, card_select_related = self.get_card_columns(group_by)
+            if card_select_related:
+                items = items.select_related(*card_select_related)
+
             paginate_by = getattr(self, "paginate_by", 10)
             paginator = Paginator(items, paginate_by)
             try:
@@ -2987,29 +3165,8 @@ class HorillaKanbanView(HorillaListView):
             except EmptyPage:
                 return HttpResponse("")  # Return empty response for no more items
 
-            display_columns = []
-            for verbose_name, field_name in self.columns:
-                if field_name != group_by:
-                    display_columns.append({"name": field_name, "label": verbose_name})
-
-            for item in page_obj.object_list:
-                item.can_drag = self.can_user_modify_item(item)
-                item.display_columns = []
-                for column in display_columns:
-                    field_name = column["name"]
-                    try:
-                        value = getattr(item, field_name)
-                        if callable(value):
-                            value = value()
-                    except AttributeError:
-                        value = None
-                    item.display_columns.append(
-                        {
-                            "name": field_name,
-                            "label": column["label"],
-                            "value": str(value) if value is not None else "N/A",
-                        }
-                    )
+            page_obj.object_list = list(page_obj.object_list)
+            self.set_card_attributes(page_obj.object_list, card_columns, stringify=True)
 
             context = {
                 "group": {
@@ -3294,30 +3451,17 @@ class HorillaDetailView(DetailView):
         else:
             context["final_stage_action"] = self.final_stage_action
 
-        session_key = f"list_view_queryset_ids_{self.model._meta.model_name}"
-
-        queryset_ids = self.request.session.get(session_key, [])
-        if not queryset_ids:
-            from horilla_generics.views import HorillaListView
-
+        queryset = get_navigation_queryset(self.request, self.model)
+        if queryset is None:
             list_view = HorillaListView()
             list_view.request = self.request
             list_view.model = self.model
             queryset = list_view.get_queryset()
-            queryset_ids = list(queryset.values_list("id", flat=True))
-            self.request.session["list_view_queryset_ids"] = queryset_ids
-        try:
-            current_index = queryset_ids.index(current_id)
-        except ValueError:
-            current_index = -1
-        context["has_previous"] = current_index > 0
-        context["has_next"] = current_index < len(queryset_ids) - 1
-        context["previous_id"] = (
-            queryset_ids[current_index - 1] if context["has_previous"] else None
-        )
-        context["next_id"] = (
-            queryset_ids[current_index + 1] if context["has_next"] else None
-        )
+        previous_id, next_id = get_neighbour_ids(queryset, current_obj)
+        context["has_previous"] = previous_id is not None
+        context["has_next"] = next_id is not None
+        context["previous_id"] = previous_id
+        context["next_id"] = next_id
         url = resolve(self.request.path)
         context["url_name"] = url.url_name
         context["app_label"] = self.model._meta.app_label
@@ -7578,12 +7722,12 @@ class HorillaModalDetailView(DetailView):
 
     def get_queryset(self):
         """
-        Filter queryset based on instance_ids from session.
+        Restrict the queryset to the records of the list being navigated.
         """
         queryset = super().get_queryset()
-        instance_ids = self.request.session.get(self.ordered_ids_key, [])
-        if instance_ids:
-            queryset = queryset.filter(pk__in=instance_ids)
+        navigation_queryset = get_navigation_queryset(self.request, self.model)
+        if navigation_queryset is not None:
+            queryset = queryset.filter(pk__in=navigation_queryset.values("pk"))
         return queryset
 
     def get_object(self, queryset=None):
@@ -7596,10 +7740,6 @@ class HorillaModalDetailView(DetailView):
         return self.instance
 
     def get(self, request, *args, **kwargs):
-        if not self.request.GET.get(self.ids_key) and not self.request.session.get(
-            self.ordered_ids_key
-        ):
-            self.request.session[self.ordered_ids_key] = []
         response = super().get(request, *args, **kwargs)
         if not self.instance and self.empty_template:
             return render(request, self.empty_template, context=self.get_context_data())
@@ -7610,7 +7750,7 @@ class HorillaModalDetailView(DetailView):
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
-        self.ordered_ids_key = f"ordered_ids_{self.model.__name__.lower()}"
+        self.ordered_ids_key = get_navigation_session_key(self.model)
         request = getattr(_thread_local, "request", None)
         self.request = request
         # update_initial_cache(request, CACHE, HorillaDetailedView)
@@ -7623,7 +7763,7 @@ class HorillaModalDetailView(DetailView):
             return context
 
         pk = obj.pk
-        instance_ids = self.request.session.get(self.ordered_ids_key, [])
+        navigation_queryset = get_navigation_queryset(self.request, self.model)
         url_info = resolve(self.request.path)
         url_name = url_info.url_name
         key = next(iter(url_info.kwargs), "pk")
@@ -7636,8 +7776,10 @@ class HorillaModalDetailView(DetailView):
         context["action_method"] = self.action_method
         context["cols"] = self.cols
 
-        if instance_ids:
-            prev_id, next_id = closest_numbers(instance_ids, pk)
+        if navigation_queryset is not None:
+            prev_id, next_id = get_neighbour_ids(navigation_queryset, obj, wrap=True)
+            prev_id = pk if prev_id is None else prev_id
+            next_id = pk if next_id is None else next_id
 
             full_url_name = (
                 f"{url_info.namespaces[0]}:{url_name}"
@@ -7646,7 +7788,9 @@ class HorillaModalDetailView(DetailView):
             )
             context.update(
                 {
-                    "instance_ids": str(instance_ids),
+                    "instance_ids": get_navigation_signature(
+                        self.request, self.model
+                    ),
                     "ids_key": self.ids_key,
                     "next_url": reverse_lazy(full_url_name, kwargs={key: next_id}),
                     "previous_url": reverse_lazy(full_url_name, kwargs={key: prev_id}),
@@ -5,6 +5,11 @@ from . import views
 app_name = "horilla_notifications"
 
 urlpatterns = [
+    path(
+        "notifications/",
+        views.NotificationListView.as_view(),
+        name="notification_list",
+    ),
     path(
         "notifications-read/<int:pk>/",
         views.MarkNotificationReadView.as_view(),
@@ -1,15 +1,84 @@
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import HttpResponse
+from django.db.models import Count, Q
+from django.http import HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, render
 from django.utils.decorators import method_decorator
 from django.views import View
 
 from horilla_core.decorators import htmx_required
+from horilla_generics.mixins import AsyncLoginRequiredMixin
 
 from .models import Notification
 
 
+class NotificationListView(AsyncLoginRequiredMixin, View):
+    """
+    Notifications of the current user as JSON, newest first, paginated with
+    ``page`` and ``page_size`` like the notifications API. ``read=true`` or
+    ``read=false`` filters on the read state.
+    """
+
+    page_size = 20
+    max_page_size = 100
+
+    def get_page_number(self, value, default):
+        try:
+            return max(int(value), 1)
+        except (TypeError, ValueError):
+            return default
+
+    async def get(self, request, *args, **kwargs):
+        page = self.get_page_number(request.GET.get("page"), 1)
+        page_size = min(
+            self.get_page_number(request.GET.get("page_size"), self.page_size),
+            self.max_page_size,
+        )
+
+        queryset = Notification.objects.filter(user=request.user)
+        totals = await queryset.aaggregate(
+            total=Count("id"), unread=Count("id", filter=Q(read=False))
+        )
+        read = request.GET.get("read")
+        if read in ("true", "false"):
+            queryset = queryset.filter(read=read == "true")
+            count = await queryset.acount()
+        else:
+            count = totals["total"]
+
+        offset = (page - 1) * page_size
+        results = [
+            {
+                "id": notification.id,
+                "message": notification.message,
+                "url": notification.url,
+                "read": notification.read,
+                "created_at": notification.created_at,
+                "sender": (
+                    {
+                        "id": notification.sender.id,
+                        "name": notification.sender.get_full_name()
+                        or notification.sender.username,
+                    }
+                    if notification.sender
+                    else None
+                ),
+            }
+            async for notification in queryset.select_related("sender").order_by(
+                "-created_at"
+            )[offset : offset + page_size]
+        ]
+        return JsonResponse(
+            {
+                "count": count,
+                "unread_count": totals["unread"],
+                "next": page + 1 if offset + page_size < count else None,
+                "previous": page - 1 if page > 1 else None,
+                "results": results,
+            }
+        )
+
+
 class MarkNotificationReadView(LoginRequiredMixin, View):
     def post(self, request, pk, *args, **kwargs):
         try:
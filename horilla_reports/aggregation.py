@@ -0,0 +1,293 @@
+"""
+Data sources used by the report detail and export views to build pivots.
+
+The pivot handlers only ever need record counts and aggregate values per
+group, so whenever a report configuration can be expressed in SQL the groups
+are computed with ``values(...).annotate(...)`` GROUP BY queries. Reports that
+group or aggregate on something the database cannot handle fall back to
+loading the rows into a pandas DataFrame.
+
+Both sources expose the same API and key their results the way pandas does:
+a plain value when grouping by one field and a tuple when grouping by several.
+Groups with an empty (NULL) value in any grouping field are skipped, matching
+``DataFrame.groupby``.
+"""
+
+import logging
+
+import pandas as pd
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models import Avg, Count, Max, Min, Sum
+
+logger = logging.getLogger(__name__)
+
+SQL_AGGREGATES = {"sum": Sum, "avg": Avg, "min": Min, "max": Max}
+
+NUMERIC_FIELD_TYPES = (
+    models.IntegerField,
+    models.BigIntegerField,
+    models.SmallIntegerField,
+    models.PositiveIntegerField,
+    models.PositiveSmallIntegerField,
+    models.FloatField,
+    models.DecimalField,
+)
+
+
+def get_report_fields(report):
+    """Return the model fields a report reads, without duplicates."""
+    fields = []
+    fields.extend(report.selected_columns_list)
+    fields.extend(report.row_groups_list)
+    fields.extend(report.column_groups_list)
+    for agg in report.aggregate_columns_dict:
+        if agg.get("field"):
+            fields.append(agg["field"])
+    return list(dict.fromkeys(fields))
+
+
+def can_aggregate_in_db(model_class, report):
+    """
+    Check whether every grouping and aggregate of the report maps to a
+    concrete column that the database can GROUP BY or aggregate over.
+    """
+    opts = model_class._meta
+    try:
+        for field_name in report.row_groups_list + report.column_groups_list:
+            field = opts.get_field(field_name)
+            if not field.concrete or field.many_to_many:
+                return False
+        for agg in report.aggregate_columns_dict:
+            aggfunc = agg.get("aggfunc", "sum")
+            if aggfunc not in SQL_AGGREGATES:
+                continue
+            field = opts.get_field(agg["field"])
+            if not field.concrete or field.is_relation:
+                return False
+            if aggfunc in ("sum", "avg") and not isinstance(
+                field, NUMERIC_FIELD_TYPES
+            ):
+                return False
+    except FieldDoesNotExist:
+        return False
+    return True
+
+
+def build_report_data(queryset, report):
+    """
+    Return the data source for ``report`` over an already filtered queryset,
+    preferring database aggregation over loading rows into pandas.
+    """
+    columns = get_report_fields(report)
+    if can_aggregate_in_db(queryset.model, report):
+        return QuerySetReportData(queryset, report, columns)
+    logger.debug(
+        "Report %s cannot be aggregated in the database, using pandas", report.pk
+    )
+    return DataFrameReportData(queryset, report, columns)
+
+
+class BaseReportData:
+    """
+    Common interface of report data sources.
+    """
+
+    def __init__(self, report, columns):
+        self.report = report
+        self.columns = columns
+
+    @property
+    def empty(self):
+        """True when the filtered report has no records."""
+        return self.count() == 0
+
+    def count(self):
+        """Total number of records in the report."""
+        raise NotImplementedError
+
+    def group_counts(self, group_fields):
+        """Number of records per group, ordered by the group values."""
+        raise NotImplementedError
+
+    def group_aggregate(self, group_fields, field, aggfunc):
+        """Aggregate of ``field`` per group; unknown functions count records."""
+        raise NotImplementedError
+
+    def total(self, field, aggfunc):
+        """Aggregate of ``field`` over every record of the report."""
+        raise NotImplementedError
+
+    def unique(self, field):
+        """Distinct non-empty values of ``field``, in sorted order."""
+        raise NotImplementedError
+
+
+class QuerySetReportData(BaseReportData):
+    """
+    Report data computed with GROUP BY queries.
+
+    Each distinct grouping is fetched once, together with every aggregate
+    column of the report, and reused by the pivot and chart handlers.
+    """
+
+    def __init__(self, queryset, report, columns):
+        super().__init__(report, columns)
+        self.model = queryset.model
+        self.queryset = queryset.order_by()
+        self.value_aggregates = list(
+            dict.fromkeys(
+                (agg["field"], agg.get("aggfunc", "sum"))
+                for agg in report.aggregate_columns_dict
+                if agg.get("aggfunc", "sum") in SQL_AGGREGATES
+            )
+        )
+        self._count = None
+        self._totals = None
+        self._summaries = {}
+
+    def _aggregate_expressions(self):
+        return {
+            f"_agg_{index}": SQL_AGGREGATES[aggfunc](field)
+            for index, (field, aggfunc) in enumerate(self.value_aggregates)
+        }
+
+    def _normalize(self, aggfunc, value):
+        # pandas sums empty groups to 0, SQL returns NULL
+        if value is None and aggfunc == "sum":
+            return 0
+        return value
+
+    def _attname(self, field_name):
+        # Order by the raw column so FK groups are not joined to the related
+        # model's Meta.ordering, which would also split the GROUP BY.
+        return self.model._meta.get_field(field_name).attname
+
+    def summarise(self, group_fields):
+        """
+        Return ``{group_key: {"count": n, (field, aggfunc): value}}`` for the
+        given grouping, computed with a single query.
+        """
+        group_fields = tuple(group_fields)
+        if group_fields not in self._summaries:
+            expressions = self._aggregate_expressions()
+            rows = (
+                self.queryset.filter(
+                    **{f"{field}__isnull": False for field in group_fields}
+                )
+                .values(*group_fields)
+                .annotate(_count=Count("pk"), **expressions)
+                .order_by(*[self._attname(field) for field in group_fields])
+            )
+            summary = {}
+            for row in rows:
+                if len(group_fields) == 1:
+                    key = row[group_fields[0]]
+                else:
+                    key = tuple(row[field] for field in group_fields)
+                values = {"count": row["_count"]}
+                for index, (field, aggfunc) in enumerate(self.value_aggregates):
+                    values[(field, aggfunc)] = self._normalize(
+                        aggfunc, row[f"_agg_{index}"]
+                    )
+                summary[key] = values
+            self._summaries[group_fields] = summary
+        return self._summaries[group_fields]
+
+    def count(self):
+        if self._count is None:
+            self._count = self.queryset.count()
+        return self._count
+
+    def group_counts(self, group_fields):
+        return {
+            key: values["count"] for key, values in self.summarise(group_fields).items()
+        }
+
+    def group_aggregate(self, group_fields, field, aggfunc):
+        if aggfunc not in SQL_AGGREGATES:
+            return self.group_counts(group_fields)
+        return {
+            key: values[(field, aggfunc)]
+            for key, values in self.summarise(group_fields).items()
+        }
+
+    def total(self, field, aggfunc):
+        if aggfunc not in SQL_AGGREGATES:
+            return self.count()
+        if self._totals is None:
+            result = self.queryset.aggregate(**self._aggregate_expressions())
+            self._totals = {
+                (agg_field, agg_func): self._normalize(
+                    agg_func, result[f"_agg_{index}"]
+                )
+                for index, (agg_field, agg_func) in enumerate(self.value_aggregates)
+            }
+        return self._totals[(field, aggfunc)]
+
+    def unique(self, field):
+        return list(
+            self.queryset.filter(**{f"{field}__isnull": False})
+            .order_by(self._attname(field))
+            .values_list(field, flat=True)
+            .distinct()
+        )
+
+
+class DataFrameReportData(BaseReportData):
+    """
+    Fallback report data that loads the report rows into a pandas DataFrame.
+    """
+
+    def __init__(self, queryset, report, columns):
+        super().__init__(report, columns)
+        data = list(queryset.values(*columns)) if columns else list(queryset.values())
+        self.df = pd.DataFrame(data)
+        if not columns:
+            self.columns = list(self.df.columns)
+
+    def _grouped(self, group_fields):
+        group_fields = list(group_fields)
+        return self.df.groupby(
+            group_fields[0] if len(group_fields) == 1 else group_fields
+        )
+
+    def count(self):
+        return len(self.df)
+
+    def group_counts(self, group_fields):
+        if self.df.empty:
+            return {}
+        return self._grouped(group_fields).size().to_dict()
+
+    def group_aggregate(self, group_fields, field, aggfunc):
+        if self.df.empty:
+            return {}
+        grouped = self._grouped(group_fields)
+        if aggfunc == "sum":
+            return grouped[field].sum().to_dict()
+        if aggfunc == "avg":
+            return grouped[field].mean().to_dict()
+        if aggfunc == "min":
+            return grouped[field].min().to_dict()
+        if aggfunc == "max":
+            return grouped[field].max().to_dict()
+        return grouped.size().to_dict()
+
+    def total(self, field, aggfunc):
+        if aggfunc not in SQL_AGGREGATES:
+            return len(self.df)
+        if self.df.empty or field not in self.df.columns:
+            return 0 if aggfunc == "sum" else None
+        if aggfunc == "sum":
+            return self.df[field].sum()
+        if aggfunc == "avg":
+            return self.df[field].mean()
+        if aggfunc == "min":
+            return self.df[field].min()
+        return self.df[field].max()
+
+    def unique(self, field):
+        if self.df.empty:
+            return []
+        return sorted(value for value in self.df[field].unique() if pd.notna(value))
@@ -1,11 +1,13 @@
 import json
 
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
 from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 
 from horilla.registry.feature import feature_enabled
+from horilla.registry.permission_registry import permission_exempt_model
 from horilla_core.models import HorillaContentType, HorillaCoreModel
 from horilla_reports.methods import limit_content_types
 from horilla_utils.methods import render_template
@@ -320,3 +322,26 @@ class Report(HorillaCoreModel):
             path="reports/report_actions_detail.html",
             context={"instance": self},
         )
+
+
+@permission_exempt_model
+class ReportDataVersion(models.Model):
+    """
+    Data version of a model used by reports, bumped whenever its records
+    change. Kept in the database so every worker process invalidates the
+    same cached report results.
+    """
+
+    content_type = models.OneToOneField(
+        ContentType, on_delete=models.CASCADE, verbose_name=_("Content Type")
+    )
+    version = models.BigIntegerField(default=0, verbose_name=_("Version"))
+
+    class Meta:
+        """Meta class for ReportDataVersion"""
+
+        verbose_name = _("Report Data Version")
+        verbose_name_plural = _("Report Data Versions")
+
+    def __str__(self):
+        return f"{self.content_type} v{self.version}"
@@ -0,0 +1,174 @@
+"""
+Result cache for report detail pages.
+
+Computed pivots and chart data are cached under a key built from the
+effective report configuration (including unsaved preview changes kept in the
+session), the active company, the user's permission scope on the report
+module, the active language and a data version per model. The data versions
+are ``ReportDataVersion`` rows bumped after the commit of every save, delete
+and bulk write (``records_bulk_changed``) of the model (see ``signals.py``),
+so a change made in any worker process invalidates the cached results of
+all of them. They are read with one query per request.
+"""
+
+import hashlib
+import json
+import logging
+from functools import lru_cache, partial
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import DatabaseError, transaction
+from django.db.models import F
+from django.utils import translation
+
+from horilla.registry.feature import FEATURE_REGISTRY
+from horilla_reports.models import ReportDataVersion
+from horilla_utils.middlewares import get_current_request
+
+logger = logging.getLogger(__name__)
+
+REPORT_CACHE_TIMEOUT = getattr(settings, "REPORT_CACHE_TIMEOUT", 600)
+
+REPORT_CONFIG_FIELDS = [
+    "selected_columns",
+    "row_groups",
+    "column_groups",
+    "aggregate_columns",
+    "filters",
+    "chart_type",
+    "chart_field",
+    "chart_field_stacked",
+]
+
+
+def _get_request_versions():
+    request = get_current_request()
+    if request is None:
+        return {}
+    return request.__dict__.setdefault("_report_data_versions", {})
+
+
+def get_data_versions(models):
+    """
+    Return ``{model: data version}`` of ``models``, read from the database
+    once per request.
+    """
+    versions = _get_request_versions()
+    content_types = ContentType.objects.get_for_models(*models)
+    missing = [
+        content_type.pk
+        for content_type in content_types.values()
+        if content_type.pk not in versions
+    ]
+    if missing:
+        found = dict(
+            ReportDataVersion.objects.filter(content_type_id__in=missing).values_list(
+                "content_type_id", "version"
+            )
+        )
+        for content_type_id in missing:
+            versions[content_type_id] = found.get(content_type_id, 0)
+    return {
+        model: versions[content_type.pk]
+        for model, content_type in content_types.items()
+    }
+
+
+def _increment_data_version(content_type_id):
+    _get_request_versions().pop(content_type_id, None)
+    try:
+        versions = ReportDataVersion.objects.filter(content_type_id=content_type_id)
+        if versions.update(version=F("version") + 1):
+            return
+        _version, created = ReportDataVersion.objects.get_or_create(
+            content_type_id=content_type_id, defaults={"version": 1}
+        )
+        if not created:
+            versions.update(version=F("version") + 1)
+    except DatabaseError as e:
+        # e.g. while migrating, before the table exists
+        logger.warning(f"Could not bump report data version: {e}")
+
+
+def bump_data_version(model):
+    """
+    Invalidate every cached report result that depends on ``model`` once the
+    current transaction commits.
+    """
+    content_type_id = ContentType.objects.get_for_model(model).pk
+    _get_request_versions().pop(content_type_id, None)
+    transaction.on_commit(partial(_increment_data_version, content_type_id))
+
+
+@lru_cache(maxsize=None)
+def get_tracked_models():
+    """
+    Models whose changes affect report results: the reportable models and
+    the models their relations point to, which provide the group labels.
+    """
+    tracked = set()
+    for model in FEATURE_REGISTRY["report_models"]:
+        tracked.add(model)
+        for field in model._meta.get_fields():
+            if field.concrete and field.is_relation and field.related_model:
+                tracked.add(field.related_model)
+    return frozenset(tracked)
+
+
+def get_dependent_models(report):
+    """Return the report model and the related models used for its groups."""
+    model_class = report.model_class
+    models = [model_class]
+    for field_name in report.row_groups_list + report.column_groups_list:
+        try:
+            field = model_class._meta.get_field(field_name)
+        except Exception:
+            continue
+        if field.is_relation and field.related_model:
+            models.append(field.related_model)
+    return list(dict.fromkeys(models))
+
+
+def get_permission_scope(user, model_class):
+    """Describe which records of ``model_class`` the user is allowed to see."""
+    app_label = model_class._meta.app_label
+    model_name = model_class._meta.model_name
+    if user.has_perm(f"{app_label}.view_{model_name}"):
+        return "all"
+    return f"own:{user.pk}"
+
+
+def get_report_cache_key(report, preview_data, request):
+    """Build the result cache key of ``report`` for the current request."""
+    company = getattr(request, "active_company", None)
+    payload = {
+        "report": report.pk,
+        "module": report.module_id,
+        "config": {field: getattr(report, field) for field in REPORT_CONFIG_FIELDS},
+        "preview": preview_data,
+        "company": company.pk if company else None,
+        "scope": get_permission_scope(request.user, report.model_class),
+        "language": translation.get_language(),
+        "versions": [
+            [model._meta.label_lower, version]
+            for model, version in get_data_versions(
+                get_dependent_models(report)
+            ).items()
+        ],
+    }
+    digest = hashlib.sha256(
+        json.dumps(payload, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return f"report_results_{report.pk}_{digest}"
+
+
+def get_cached_report_results(cache_key, compute):
+    """Return cached report results, computing and storing them on a miss."""
+    results = cache.get(cache_key)
+    if results is None:
+        results = compute()
+        if "error" not in results and "error" not in results.get("chart_data", {}):
+            cache.set(cache_key, results, REPORT_CACHE_TIMEOUT)
+    return results
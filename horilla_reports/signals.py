@@ -1,2 +1,36 @@
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
+
+from horilla_core.signals import records_bulk_changed
+from horilla_reports.report_cache import bump_data_version, get_tracked_models
+
+
+def bump_report_data_version(sender, instance, **kwargs):
+    """
+    Bump the report data version of the saved or deleted model so cached
+    report results built from it are no longer used.
+    """
+    if not kwargs.get("raw"):
+        bump_data_version(sender)
+
+
+@receiver(records_bulk_changed)
+def bump_report_data_version_in_bulk(sender, **kwargs):
+    """Bump the report data version of a model written in bulk."""
+    if sender in get_tracked_models():
+        bump_data_version(sender)
+
+
+# Connected per model: a receiver for every sender would stop Django from
+# fast-deleting cascaded rows of unrelated models.
+for tracked_model in get_tracked_models():
+    post_save.connect(
+        bump_report_data_version,
+        sender=tracked_model,
+        dispatch_uid=f"report_data_version_save_{tracked_model._meta.label_lower}",
+    )
+    post_delete.connect(
+        bump_report_data_version,
+        sender=tracked_model,
+        dispatch_uid=f"report_data_version_delete_{tracked_model._meta.label_lower}",
+    )
@@ -1,3 +1,169 @@
-from django.test import TestCase
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pandas as pd
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import post_delete
+from django.test import RequestFactory, TestCase
+
+from horilla_core.models import Company, HorillaUser
+from horilla_core.signals import records_bulk_changed
+from horilla_crm.leads.models import Lead, LeadStatus
+from horilla_reports.aggregation import (
+    DataFrameReportData,
+    QuerySetReportData,
+    build_report_data,
+    get_report_fields,
+)
+from horilla_reports.models import ReportDataVersion
+from horilla_reports.report_cache import get_data_versions, get_tracked_models
+from horilla_utils.middlewares import reset_current_request, set_current_request
 
 # Create your reports tests here.
+
+
+class ReportDataVersionTest(TestCase):
+    """
+    Report data versions are shared by every process through the database
+    and change after every save, delete and bulk write of the model.
+    """
+
+    def start_request(self):
+        token = set_current_request(RequestFactory().get("/"))
+        self.addCleanup(reset_current_request, token)
+
+    def test_versions_change_after_commit(self):
+        self.start_request()
+        company = Company.objects.create(
+            name="Main", no_of_employees=1, email="main@example.com"
+        )
+        version = get_data_versions([LeadStatus])[LeadStatus]
+        with self.captureOnCommitCallbacks(execute=True):
+            status = LeadStatus.all_objects.create(
+                name="New", order=1, probability=10, company=company
+            )
+        self.assertEqual(get_data_versions([LeadStatus])[LeadStatus], version + 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            records_bulk_changed.send(sender=LeadStatus, pks=[status.pk])
+        with self.captureOnCommitCallbacks(execute=True):
+            status.delete()
+        self.assertEqual(get_data_versions([LeadStatus])[LeadStatus], version + 3)
+
+    def test_versions_read_once_per_request(self):
+        self.start_request()
+        models = [LeadStatus, HorillaUser]
+        with self.assertNumQueries(1):
+            get_data_versions(models)
+        # Written by another process
+        ReportDataVersion.objects.create(
+            content_type=ContentType.objects.get_for_model(LeadStatus), version=10
+        )
+        with self.assertNumQueries(0):
+            self.assertEqual(get_data_versions(models)[LeadStatus], 0)
+
+        self.start_request()
+        self.assertEqual(get_data_versions(models)[LeadStatus], 10)
+
+    def test_delete_receivers_only_for_tracked_models(self):
+        tracked = get_tracked_models()
+        self.assertTrue(post_delete.has_listeners(LeadStatus))
+        self.assertIn(LeadStatus, tracked)
+        self.assertNotIn(ReportDataVersion, tracked)
+        self.assertFalse(post_delete.has_listeners(ReportDataVersion))
+
+
+class ReportDataSourceTest(TestCase):
+    """
+    The GROUP BY data source returns what the pandas fallback returns for
+    the same pivot, including groups with empty values.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        owner = HorillaUser.objects.create_user(
+            "reporter", "reporter@example.com", "password"
+        )
+        status = LeadStatus.all_objects.create(name="New", order=1, probability=10)
+        rows = [
+            ("email", "Demo", 10, "1000.00"),
+            ("email", "Demo", None, "250.50"),
+            ("email", None, 30, "10.00"),
+            ("website", "Quote", 5, "99.99"),
+            ("website", None, None, "0.00"),
+            ("referral", "Demo", 7, "500.00"),
+            ("referral", "Quote", 12, "75.25"),
+        ]
+        Lead.all_objects.bulk_create(
+            Lead(
+                lead_owner=owner,
+                lead_status=status,
+                first_name=f"Lead {index}",
+                last_name="Report",
+                email=f"lead{index}@example.com",
+                lead_company="Acme",
+                lead_source=source,
+                requirements=requirements,
+                no_of_employees=employees,
+                annual_revenue=Decimal(revenue),
+            )
+            for index, (source, requirements, employees, revenue) in enumerate(rows)
+        )
+
+    def get_sources(self, row_groups, column_groups=()):
+        report = SimpleNamespace(
+            pk=None,
+            selected_columns_list=["first_name"],
+            row_groups_list=list(row_groups),
+            column_groups_list=list(column_groups),
+            aggregate_columns_dict=[
+                {"field": field, "aggfunc": aggfunc}
+                for field in ("no_of_employees", "annual_revenue")
+                for aggfunc in ("sum", "avg", "min", "max")
+            ],
+        )
+        queryset = Lead.all_objects.all()
+        self.assertIsInstance(build_report_data(queryset, report), QuerySetReportData)
+        columns = get_report_fields(report)
+        return (
+            QuerySetReportData(queryset, report, columns),
+            DataFrameReportData(queryset, report, columns),
+        )
+
+    def assertSameValues(self, sql_values, pandas_values):
+        self.assertEqual(list(sql_values), list(pandas_values))
+        for key, value in pandas_values.items():
+            if pd.isna(value):
+                self.assertIsNone(sql_values[key], key)
+            else:
+                self.assertAlmostEqual(float(sql_values[key]), float(value), 6, key)
+
+    def test_single_and_nested_groups(self):
+        for groups in (
+            ["lead_source"],
+            ["requirements"],
+            ["lead_source", "requirements"],
+        ):
+            sql, pandas = self.get_sources(groups)
+            with self.subTest(groups=groups):
+                self.assertEqual(sql.group_counts(groups), pandas.group_counts(groups))
+                for field in ("no_of_employees", "annual_revenue"):
+                    for aggfunc in ("sum", "avg", "min", "max", "count"):
+                        self.assertSameValues(
+                            sql.group_aggregate(groups, field, aggfunc),
+                            pandas.group_aggregate(groups, field, aggfunc),
+                        )
+
+    def test_totals_and_unique_values(self):
+        sql, pandas = self.get_sources(["lead_source"], ["requirements"])
+        self.assertEqual(sql.count(), pandas.count())
+        for field in ("no_of_employees", "annual_revenue"):
+            for aggfunc in ("sum", "avg", "min", "max"):
+                self.assertAlmostEqual(
+                    float(sql.total(field, aggfunc)),
+                    float(pandas.total(field, aggfunc)),
+                    6,
+                )
+        for field in ("lead_source", "requirements"):
+            self.assertEqual(sql.unique(field), pandas.unique(field))
+        self.assertNotIn(None, sql.group_counts(["requirements"]))
@@ -8,7 +8,6 @@ from functools import cached_property
 from urllib.parse import urlencode, urlparse
 
 import openpyxl
-import pandas as pd
 from django import forms
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
@@ -45,9 +44,14 @@ from horilla_generics.views import (
     HorillaSingleDeleteView,
     HorillaSingleFormView,
 )
+from horilla_reports.aggregation import build_report_data
 from horilla_reports.filters import ReportFilter
 from horilla_reports.forms import ChangeChartReportForm, ReportForm
 from horilla_reports.models import Report, ReportFolder
+from horilla_reports.report_cache import (
+    get_cached_report_results,
+    get_report_cache_key,
+)
 from horilla_utils.methods import get_section_info_for_model
 from horilla_utils.middlewares import _thread_local
 
@@ -390,24 +394,6 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
             if query:
                 queryset = queryset.filter(query)
 
-        # Convert queryset to DataFrame
-        fields = []
-        if temp_report.selected_columns_list:
-            fields.extend(temp_report.selected_columns_list)
-        if temp_report.row_groups_list:
-            fields.extend(temp_report.row_groups_list)
-        if temp_report.column_groups_list:
-            fields.extend(temp_report.column_groups_list)
-        for agg in aggregate_columns_dict:
-            if agg.get("field"):
-                fields.append(agg["field"])
-
-        # Remove duplicates while preserving order
-        fields = list(dict.fromkeys(fields))
-
-        data = list(queryset.values(*fields)) if fields else list(queryset.values())
-        df = pd.DataFrame(data)
-
         # Initialize context
         context["panel_open"] = bool(preview_data)
         context["hierarchical_data"] = []
@@ -431,42 +417,16 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
             for field_name in temp_report.column_groups_list
         ]
 
-        # Handle different configurations
-        row_count = len(temp_report.row_groups_list)
-        col_count = len(temp_report.column_groups_list)
-
-        if row_count == 0 and col_count == 0:
-            self.handle_0_row_0_col(df, temp_report, context)
-        elif row_count == 1 and col_count == 0:
-            self.handle_1_row_0_col(df, temp_report, context)
-        elif row_count == 1 and col_count == 1:
-            self.handle_1_row_1_col(df, temp_report, context)
-        elif row_count == 1 and col_count == 2:
-            self.handle_1_row_2_col(df, temp_report, context)
-        elif row_count == 2 and col_count == 0:
-            self.handle_2_row_0_col(df, temp_report, context)
-        elif row_count == 2 and col_count == 1:
-            self.handle_2_row_1_col(df, temp_report, context)
-        elif row_count == 3 and col_count == 0:
-            self.handle_3_row_0_col(df, temp_report, context)
-        else:
-            context["error"] = (
-                f"Configuration not supported: {row_count} rows, {col_count} columns"
+        # Pivot and chart results are cached until the report, its preview
+        # changes or the underlying records change
+        cache_key = get_report_cache_key(temp_report, preview_data, self.request)
+        context.update(
+            get_cached_report_results(
+                cache_key,
+                lambda: self.get_report_results(
+                    queryset, temp_report, aggregate_columns_dict
+                ),
             )
-
-        # Chart data
-        chart_data = self.generate_chart_data(df, temp_report)
-        context["chart_data"] = chart_data
-        context["total_count"] = len(data)
-        context["total_amount"] = sum(
-            [
-                float(
-                    df[agg["field"]].sum()
-                    if agg["field"] in df.columns and agg.get("aggfunc") == "sum"
-                    else 0
-                )
-                for agg in aggregate_columns_dict
-            ]
         )
 
         columns = []
@@ -544,6 +504,53 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
         )
         return context
 
+    def get_report_results(self, queryset, temp_report, aggregate_columns_dict):
+        """Compute the pivot, chart and total values of the report."""
+        results = {}
+
+        # Group and aggregate in the database where the configuration allows
+        data = build_report_data(queryset, temp_report)
+
+        # Handle different configurations
+        row_count = len(temp_report.row_groups_list)
+        col_count = len(temp_report.column_groups_list)
+
+        if row_count == 0 and col_count == 0:
+            self.handle_0_row_0_col(data, temp_report, results)
+        elif row_count == 1 and col_count == 0:
+            self.handle_1_row_0_col(data, temp_report, results)
+        elif row_count == 1 and col_count == 1:
+            self.handle_1_row_1_col(data, temp_report, results)
+        elif row_count == 1 and col_count == 2:
+            self.handle_1_row_2_col(data, temp_report, results)
+        elif row_count == 2 and col_count == 0:
+            self.handle_2_row_0_col(data, temp_report, results)
+        elif row_count == 2 and col_count == 1:
+            self.handle_2_row_1_col(data, temp_report, results)
+        elif row_count == 3 and col_count == 0:
+            self.handle_3_row_0_col(data, temp_report, results)
+        else:
+            results["error"] = (
+                f"Configuration not supported: {row_count} rows, {col_count} columns"
+            )
+
+        # Chart data
+        chart_data = self.generate_chart_data(data, temp_report)
+        results["chart_data"] = chart_data
+        results["total_count"] = data.count()
+        results["total_amount"] = sum(
+            [
+                float(
+                    data.total(agg["field"], "sum")
+                    if agg["field"] in data.columns and agg.get("aggfunc") == "sum"
+                    else 0
+                )
+                for agg in aggregate_columns_dict
+            ]
+        )
+
+        return results
+
     def create_temp_report(self, original_report, preview_data):
         temp_report = copy.copy(original_report)
         if "selected_columns" in preview_data:
@@ -576,7 +583,7 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
         except:
             return field_name.title()
 
-    def handle_0_row_0_col(self, df, report, context):
+    def handle_0_row_0_col(self, data, report, context):
         try:
             aggregate_columns = []
             if report.aggregate_columns_dict:
@@ -584,19 +591,8 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
                     aggregate_field = agg.get("field")
                     aggfunc = agg.get("aggfunc", "sum")
                     aggregate_column_name = f"{aggfunc.title()} of {self.get_verbose_name(aggregate_field, report.model_class)}"
-                    if aggregate_field and not df.empty:
-                        if aggfunc == "sum":
-                            total_value = df[aggregate_field].sum()
-                        elif aggfunc == "avg":
-                            total_value = df[aggregate_field].mean()
-                        elif aggfunc == "min":
-                            total_value = df[aggregate_field].min()
-                        elif aggfunc == "max":
-                            total_value = df[aggregate_field].max()
-                        elif aggfunc == "count":
-                            total_value = len(df)
-                        else:
-                            total_value = len(df)
+                    if aggregate_field and not data.empty:
+                        total_value = data.total(aggregate_field, aggfunc)
                         aggregate_columns.append(
                             {
                                 "name": aggregate_column_name,
@@ -612,7 +608,9 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
                         else "Records"
                     ),
                     "value": (
-                        aggregate_columns[0]["value"] if aggregate_columns else len(df)
+                        aggregate_columns[0]["value"]
+                        if aggregate_columns
+                        else data.count()
                     ),
                     "function": (
                         aggregate_columns[0]["function"]
@@ -623,7 +621,7 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
             else:
                 context["simple_aggregate"] = {
                     "field": "Records",
-                    "value": len(df),
+                    "value": data.count(),
                     "function": "count",
                 }
             context["aggregate_columns"] = aggregate_columns
@@ -631,9 +629,9 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
             context["error"] = f"Error in 0x0 configuration: {str(e)}"
             context["aggregate_columns"] = []
 
-    def handle_1_row_0_col(self, df, report, context):
+    def handle_1_row_0_col(self, data, report, context):
         try:
-            if df.empty:
+            if data.empty:
                 context["pivot_index"] = []
                 context["pivot_table"] = {}
                 context["pivot_columns"] = ["Count"]
@@ -644,7 +642,7 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
             row_field = report.row_groups_list[0]
 
             # Always compute counts
-            count_grouped = df.groupby(row_field).size().to_dict()
+            count_grouped = data.group_counts([row_field])
             display_grouped = {}
             display_rows = []
             pivot_columns = ["Count"]
@@ -656,27 +654,9 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
                 aggfunc = agg.get("aggfunc", "sum")
                 aggregate_column_name = f"{aggfunc.title()} of {self.get_verbose_name(aggregate_field, model_class)}"
                 pivot_columns.append(aggregate_column_name)
-
-                if aggfunc == "sum":
-                    aggregate_data = (
-                        df.groupby(row_field)[aggregate_field].sum().to_dict()
-                    )
-                elif aggfunc == "avg":
-                    aggregate_data = (
-                        df.groupby(row_field)[aggregate_field].mean().to_dict()
-                    )
-                elif aggfunc == "min":
-                    aggregate_data = (
-                        df.groupby(row_field)[aggregate_field].min().to_dict()
-                    )
-                elif aggfunc == "max":
-                    aggregate_data = (
-                        df.groupby(row_field)[aggregate_field].max().to_dict()
-                    )
-                elif aggfunc == "count":
-                    aggregate_data = df.groupby(row_field).size().to_dict()
-                else:
-                    aggregate_data = df.groupby(row_field).size().to_dict()
+                aggregate_data = data.group_aggregate(
+                    [row_field], aggregate_field, aggfunc
+                )
 
                 aggregate_columns.append(
                     {
@@ -711,9 +691,9 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
             context["error"] = f"Error in 1x0 configuration: {str(e)}"
             context["aggregate_columns"] = []
 
-    def handle_1_row_1_col(self, df, report, context):
+    def handle_1_row_1_col(self, data, report, context):
         try:
-            if df.empty:
+            if data.empty:
                 context["pivot_index"] = []
                 context["pivot_table"] = {}
                 context["pivot_columns"] = []
@@ -725,22 +705,19 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
             col_field = report.column_groups_list[0]
 
             # Compute count-based pivot table
-            pivot_table = pd.pivot_table(
-                df, index=[row_field], columns=[col_field], aggfunc="size", fill_value=0
-            )
-
-            # Convert to display format
-            pivot_dict = pivot_table.to_dict("index")
+            pivot_counts = data.group_counts([row_field, col_field])
             transposed_dict = {}
-            all_rows = pivot_table.index.tolist()
-            all_columns = pivot_table.columns.tolist()
+            all_rows = list(dict.fromkeys(row for row, _ in pivot_counts))
+            all_columns = sorted({col for _, col in pivot_counts})
 
             # Convert row indices to display values
             display_rows = []
             display_columns = []
+            row_composites = {}
             for row in all_rows:
                 display_info = self.get_display_value(row, row_field, model_class)
                 composite_key = display_info["composite_key"]
+                row_composites[row] = composite_key
                 display_rows.append(composite_key)
                 transposed_dict[composite_key] = {
                     "total": 0,
@@ -752,7 +729,7 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
                     col_composite = col_info["composite_key"]
                     if col_composite not in display_columns:
                         display_columns.append(col_composite)
-                    value = pivot_dict.get(row, {}).get(col, 0)
+                    value = pivot_counts.get((row, col), 0)
                     transposed_dict[composite_key][col_composite] = value
                     transposed_dict[composite_key]["total"] += value
 
@@ -762,33 +739,13 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
                 aggregate_field = agg["field"]
                 aggfunc = agg.get("aggfunc", "sum")
                 aggregate_column_name = f"{aggfunc.title()} of {self.get_verbose_name(aggregate_field, model_class)}"
-                if aggfunc == "sum":
-                    aggregate_data = (
-                        df.groupby(row_field)[aggregate_field].sum().to_dict()
-                    )
-                elif aggfunc == "avg":
-                    aggregate_data = (
-                        df.groupby(row_field)[aggregate_field].mean().to_dict()
-                    )
-                elif aggfunc == "min":
-                    aggregate_data = (
-                        df.groupby(row_field)[aggregate_field].min().to_dict()
-                    )
-                elif aggfunc == "max":
-                    aggregate_data = (
-                        df.groupby(row_field)[aggregate_field].max().to_dict()
-                    )
-                elif aggfunc == "count":
-                    aggregate_data = df.groupby(row_field).size().to_dict()
-                else:
-                    aggregate_data = df.groupby(row_field).size().to_dict()
+                aggregate_data = data.group_aggregate(
+                    [row_field], aggregate_field, aggfunc
+                )
 
                 # Add aggregate values to transposed_dict
                 for row in all_rows:
-                    display_value = self.get_display_value(row, row_field, model_class)
-                    display_info = self.get_display_value(row, row_field, model_class)
-                    composite_key = display_info["composite_key"]
-                    transposed_dict[composite_key][aggregate_column_name] = (
+                    transposed_dict[row_composites[row]][aggregate_column_name] = (
                         aggregate_data.get(row, 0)
                     )
                 display_columns.append(aggregate_column_name)
@@ -809,9 +766,9 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
             context["error"] = f"Error in 1x1 configuration: {str(e)}"
             context["aggregate_columns"] = []
 
-    def handle_1_row_2_col(self, df, report, context):
+    def handle_1_row_2_col(self, data, report, context):
         try:
-            if df.empty:
+            if data.empty:
                 context["pivot_index"] = []
                 context["pivot_table"] = {}
                 context["pivot_columns"] = []
@@ -825,22 +782,17 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
             col_field2 = report.column_groups_list[1]
 
             # Compute count-based pivot table
-            pivot_table = pd.pivot_table(
-                df,
-                index=[row_field],
-                columns=[col_field1, col_field2],
-                aggfunc="size",
-                fill_value=0,
-            )
+            pivot_counts = data.group_counts([row_field, col_field1, col_field2])
 
             # Handle multi-level columns
-            pivot_dict = pivot_table.to_dict("index")
             transposed_dict = {}
-            all_rows = pivot_table.index.tolist()
+            all_rows = list(dict.fromkeys(key[0] for key in pivot_counts))
+            all_columns = sorted({key[1:] for key in pivot_counts})
+            column_keys = {}
             column_hierarchy = []
             multi_level_columns = []
 
-            for col_tuple in pivot_table.columns:
+            for col_tuple in all_columns:
                 col1_info = self.get_display_value(
                     col_tuple[0], col_field1, model_class
                 )
@@ -850,6 +802,7 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
                 col1_composite = col1_info["composite_key"]
                 col2_composite = col2_info["composite_key"]
                 column_key = f"{col1_composite}|{col2_composite}"
+                column_keys[col_tuple] = column_key
                 multi_level_columns.append(column_key)
                 column_hierarchy.append(
                     {
@@ -863,26 +816,20 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
 
             # Convert row data
             display_rows = []
+            row_composites = {}
             for row in all_rows:
                 row_info = self.get_display_value(row, row_field, model_class)
                 row_composite = row_info["composite_key"]
+                row_composites[row] = row_composite
                 display_rows.append(row_composite)
                 transposed_dict[row_composite] = {
                     "total": 0,
                     "_display": row_info["display"],
                     "_id": row_info["id"],
                 }
-                for col_tuple in pivot_table.columns:
-                    col1_info = self.get_display_value(
-                        col_tuple[0], col_field1, model_class
-                    )
-                    col2_info = self.get_display_value(
-                        col_tuple[1], col_field2, model_class
-                    )
-                    col1_composite = col1_info["composite_key"]
-                    col2_composite = col2_info["composite_key"]
-                    column_key = f"{col1_composite}|{col2_composite}"
-                    value = pivot_dict.get(row, {}).get(col_tuple, 0)
+                for col_tuple in all_columns:
+                    column_key = column_keys[col_tuple]
+                    value = pivot_counts.get((row, *col_tuple), 0)
                     transposed_dict[row_composite][column_key] = value
                     transposed_dict[row_composite]["total"] += value
 
@@ -892,32 +839,13 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
                 aggregate_field = agg["field"]
                 aggfunc = agg.get("aggfunc", "sum")
                 aggregate_column_name = f"{aggfunc.title()} of {self.get_verbose_name(aggregate_field, model_class)}"
-                if aggfunc == "sum":
-                    aggregate_data = (
-                        df.groupby(row_field)[aggregate_field].sum().to_dict()
-                    )
-                elif aggfunc == "avg":
-                    aggregate_data = (
-                        df.groupby(row_field)[aggregate_field].mean().to_dict()
-                    )
-                elif aggfunc == "min":
-                    aggregate_data = (
-                        df.groupby(row_field)[aggregate_field].min().to_dict()
-                    )
-                elif aggfunc == "max":
-                    aggregate_data = (
-                        df.groupby(row_field)[aggregate_field].max().to_dict()
-                    )
-                elif aggfunc == "count":
-                    aggregate_data = df.groupby(row_field).size().to_dict()
-                else:
-                    aggregate_data = df.groupby(row_field).size().to_dict()
+                aggregate_data = data.group_aggregate(
+                    [row_field], aggregate_field, aggfunc
+                )
 
                 # Add aggregate values to transposed_dict
                 for row in all_rows:
-                    row_info = self.get_display_value(row, row_field, model_class)
-                    row_composite = row_info["composite_key"]
-                    transposed_dict[row_composite][aggregate_column_name] = (
+                    transposed_dict[row_composites[row]][aggregate_column_name] = (
                         aggregate_data.get(row, 0)
                     )
                 multi_level_columns.append(aggregate_column_name)
@@ -948,9 +876,9 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
             context["error"] = f"Error in 1x2 configuration: {str(e)}"
             context["aggregate_columns"] = []
 
-    def handle_2_row_0_col(self, df, report, context):
+    def handle_2_row_0_col(self, data, report, context):
         try:
-            if df.empty:
+            if data.empty:
                 context["hierarchical_data"] = {"groups": [], "grand_total": 0}
                 context["aggregate_columns"] = []
                 return
@@ -961,8 +889,8 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
             model_class = report.model_class
             pivot_columns = ["Count"]
 
-            # Group by primary group
-            primary_groups = df.groupby(primary_group)
+            # Group by primary and secondary group
+            group_counts = data.group_counts([primary_group, secondary_group])
             grand_total = 0
 
             # Compute aggregate columns
@@ -973,38 +901,9 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
                 aggfunc = agg.get("aggfunc", "sum")
                 aggregate_column_name = f"{aggfunc.title()} of {self.get_verbose_name(aggregate_field, model_class)}"
                 pivot_columns.append(aggregate_column_name)
-                if aggfunc == "sum":
-                    aggregate_data[aggregate_column_name] = (
-                        df.groupby([primary_group, secondary_group])[aggregate_field]
-                        .sum()
-                        .to_dict()
-                    )
-                elif aggfunc == "avg":
-                    aggregate_data[aggregate_column_name] = (
-                        df.groupby([primary_group, secondary_group])[aggregate_field]
-                        .mean()
-                        .to_dict()
-                    )
-                elif aggfunc == "min":
-                    aggregate_data[aggregate_column_name] = (
-                        df.groupby([primary_group, secondary_group])[aggregate_field]
-                        .min()
-                        .to_dict()
-                    )
-                elif aggfunc == "max":
-                    aggregate_data[aggregate_column_name] = (
-                        df.groupby([primary_group, secondary_group])[aggregate_field]
-                        .max()
-                        .to_dict()
-                    )
-                elif aggfunc == "count":
-                    aggregate_data[aggregate_column_name] = (
-                        df.groupby([primary_group, secondary_group]).size().to_dict()
-                    )
-                else:
-                    aggregate_data[aggregate_column_name] = (
-                        df.groupby([primary_group, secondary_group]).size().to_dict()
-                    )
+                aggregate_data[aggregate_column_name] = data.group_aggregate(
+                    [primary_group, secondary_group], aggregate_field, aggfunc
+                )
                 aggregate_columns.append(
                     {
                         "name": aggregate_column_name,
@@ -1013,42 +912,40 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
                     }
                 )
 
-            for primary_value, primary_df in primary_groups:
-                primary_info = self.get_display_value(
-                    primary_value, primary_group, model_class
-                )
-                primary_composite = primary_info["composite_key"]
-                group_data = {
-                    "primary_group": primary_composite,
-                    "primary_group_display": primary_info["display"],
-                    "primary_group_id": primary_info["id"],
-                    "items": [],
-                    "subtotal": 0,
-                }
-
-                # Group by secondary group within primary group
-                secondary_groups = primary_df.groupby(secondary_group)
-                for secondary_value, secondary_df in secondary_groups:
-                    secondary_info = self.get_display_value(
-                        secondary_value, secondary_group, model_class
+            groups_by_primary = {}
+            for (primary_value, secondary_value), count_value in group_counts.items():
+                if primary_value not in groups_by_primary:
+                    primary_info = self.get_display_value(
+                        primary_value, primary_group, model_class
                     )
-                    secondary_composite = secondary_info["composite_key"]
-                    count_value = len(secondary_df)
-                    item_data = {
-                        "secondary_group": secondary_composite,
-                        "secondary_group_display": secondary_info["display"],
-                        "secondary_group_id": secondary_info["id"],
-                        "values": {"Count": count_value},
-                        "total": count_value,
+                    groups_by_primary[primary_value] = {
+                        "primary_group": primary_info["composite_key"],
+                        "primary_group_display": primary_info["display"],
+                        "primary_group_id": primary_info["id"],
+                        "items": [],
+                        "subtotal": 0,
                     }
-                    for agg in aggregate_columns:
-                        key = (primary_value, secondary_value)
-                        item_data["values"][agg["name"]] = aggregate_data[
-                            agg["name"]
-                        ].get(key, 0)
-                    group_data["items"].append(item_data)
-                    group_data["subtotal"] += count_value
+                group_data = groups_by_primary[primary_value]
 
+                secondary_info = self.get_display_value(
+                    secondary_value, secondary_group, model_class
+                )
+                item_data = {
+                    "secondary_group": secondary_info["composite_key"],
+                    "secondary_group_display": secondary_info["display"],
+                    "secondary_group_id": secondary_info["id"],
+                    "values": {"Count": count_value},
+                    "total": count_value,
+                }
+                for agg in aggregate_columns:
+                    key = (primary_value, secondary_value)
+                    item_data["values"][agg["name"]] = aggregate_data[
+                        agg["name"]
+                    ].get(key, 0)
+                group_data["items"].append(item_data)
+                group_data["subtotal"] += count_value
+
+            for group_data in groups_by_primary.values():
                 hierarchical_data.append(group_data)
                 grand_total += group_data["subtotal"]
 
@@ -1063,9 +960,9 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
             context["error"] = f"Error in 2x0 configuration: {str(e)}"
             context["aggregate_columns"] = []
 
-    def handle_2_row_1_col(self, df, report, context):
+    def handle_2_row_1_col(self, data, report, context):
         try:
-            if df.empty:
+            if data.empty:
                 context["hierarchical_data"] = {"groups": [], "grand_total": 0}
                 context["pivot_columns"] = []
                 context["aggregate_columns"] = []
@@ -1077,7 +974,7 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
             col_field = report.column_groups_list[0]
 
             # Get unique column values for headers
-            unique_cols = df[col_field].unique().tolist()
+            unique_cols = data.unique(col_field)
             display_cols = []
             col_mapping = {}
             for col in unique_cols:
@@ -1094,38 +991,9 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
                 aggfunc = agg.get("aggfunc", "sum")
                 aggregate_column_name = f"{aggfunc.title()} of {self.get_verbose_name(aggregate_field, model_class)}"
                 display_cols.append(aggregate_column_name)
-                if aggfunc == "sum":
-                    aggregate_data[aggregate_column_name] = (
-                        df.groupby([primary_group, secondary_group])[aggregate_field]
-                        .sum()
-                        .to_dict()
-                    )
-                elif aggfunc == "avg":
-                    aggregate_data[aggregate_column_name] = (
-                        df.groupby([primary_group, secondary_group])[aggregate_field]
-                        .mean()
-                        .to_dict()
-                    )
-                elif aggfunc == "min":
-                    aggregate_data[aggregate_column_name] = (
-                        df.groupby([primary_group, secondary_group])[aggregate_field]
-                        .min()
-                        .to_dict()
-                    )
-                elif aggfunc == "max":
-                    aggregate_data[aggregate_column_name] = (
-                        df.groupby([primary_group, secondary_group])[aggregate_field]
-                        .max()
-                        .to_dict()
-                    )
-                elif aggfunc == "count":
-                    aggregate_data[aggregate_column_name] = (
-                        df.groupby([primary_group, secondary_group]).size().to_dict()
-                    )
-                else:
-                    aggregate_data[aggregate_column_name] = (
-                        df.groupby([primary_group, secondary_group]).size().to_dict()
-                    )
+                aggregate_data[aggregate_column_name] = data.group_aggregate(
+                    [primary_group, secondary_group], aggregate_field, aggfunc
+                )
                 aggregate_columns.append(
                     {
                         "name": aggregate_column_name,
@@ -1135,54 +1003,56 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
                 )
 
             hierarchical_data = []
-            primary_groups = df.groupby(primary_group)
+            group_counts = data.group_counts([primary_group, secondary_group])
+            cell_counts = data.group_counts([primary_group, secondary_group, col_field])
+            groups_by_primary = {}
             grand_total = 0
 
-            for primary_value, primary_df in primary_groups:
-                primary_info = self.get_display_value(
-                    primary_value, primary_group, model_class
+            for primary_value, secondary_value in group_counts:
+                if primary_value not in groups_by_primary:
+                    primary_info = self.get_display_value(
+                        primary_value, primary_group, model_class
+                    )
+                    groups_by_primary[primary_value] = {
+                        "primary_group": primary_info["composite_key"],
+                        "primary_group_display": primary_info["display"],
+                        "primary_group_id": primary_info["id"],
+                        "items": [],
+                        "subtotal": 0,
+                    }
+                group_data = groups_by_primary[primary_value]
+
+                secondary_info = self.get_display_value(
+                    secondary_value, secondary_group, model_class
                 )
-                primary_composite = primary_info["composite_key"]
-                group_data = {
-                    "primary_group": primary_composite,
-                    "primary_group_display": primary_info["display"],
-                    "primary_group_id": primary_info["id"],
-                    "items": [],
-                    "subtotal": 0,
+                item_data = {
+                    "secondary_group": secondary_info["composite_key"],
+                    "secondary_group_display": secondary_info["display"],
+                    "secondary_group_id": secondary_info["id"],
+                    "values": {},
+                    "total": 0,
                 }
 
-                secondary_groups = primary_df.groupby(secondary_group)
-                for secondary_value, secondary_df in secondary_groups:
-                    secondary_info = self.get_display_value(
-                        secondary_value, secondary_group, model_class
+                # Compute counts for column groups
+                for col_value in unique_cols:
+                    col_composite = col_mapping[col_value]
+                    value = cell_counts.get(
+                        (primary_value, secondary_value, col_value), 0
                     )
-                    secondary_composite = secondary_info["composite_key"]
-                    item_data = {
-                        "secondary_group": secondary_composite,
-                        "secondary_group_display": secondary_info["display"],
-                        "secondary_group_id": secondary_info["id"],
-                        "values": {},
-                        "total": 0,
-                    }
-
-                    # Compute counts for column groups
-                    for col_value in unique_cols:
-                        col_composite = col_mapping[col_value]
-                        filtered_df = secondary_df[secondary_df[col_field] == col_value]
-                        value = len(filtered_df)
-                        item_data["values"][col_composite] = value
-                        item_data["total"] += value
+                    item_data["values"][col_composite] = value
+                    item_data["total"] += value
 
-                    # Add aggregate values
-                    for agg in aggregate_columns:
-                        key = (primary_value, secondary_value)
-                        item_data["values"][agg["name"]] = aggregate_data[
-                            agg["name"]
-                        ].get(key, 0)
+                # Add aggregate values
+                for agg in aggregate_columns:
+                    key = (primary_value, secondary_value)
+                    item_data["values"][agg["name"]] = aggregate_data[
+                        agg["name"]
+                    ].get(key, 0)
 
-                    group_data["items"].append(item_data)
-                    group_data["subtotal"] += item_data["total"]
+                group_data["items"].append(item_data)
+                group_data["subtotal"] += item_data["total"]
 
+            for group_data in groups_by_primary.values():
                 hierarchical_data.append(group_data)
                 grand_total += group_data["subtotal"]
 
@@ -1197,9 +1067,9 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
             context["error"] = f"Error in 2x1 configuration: {str(e)}"
             context["aggregate_columns"] = []
 
-    def handle_3_row_0_col(self, df, report, context):
+    def handle_3_row_0_col(self, data, report, context):
         try:
-            if df.empty:
+            if data.empty:
                 context["three_level_data"] = {"groups": [], "grand_total": 0}
                 context["aggregate_columns"] = []
                 return
@@ -1208,6 +1078,7 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
             level1_field = report.row_groups_list[0]
             level2_field = report.row_groups_list[1]
             level3_field = report.row_groups_list[2]
+            group_fields = [level1_field, level2_field, level3_field]
 
             three_level_data = []
             grand_total = 0
@@ -1219,50 +1090,9 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
                 aggregate_field = agg["field"]
                 aggfunc = agg.get("aggfunc", "sum")
                 aggregate_column_name = f"{aggfunc.title()} of {self.get_verbose_name(aggregate_field, model_class)}"
-                if aggfunc == "sum":
-                    aggregate_data[aggregate_column_name] = (
-                        df.groupby([level1_field, level2_field, level3_field])[
-                            aggregate_field
-                        ]
-                        .sum()
-                        .to_dict()
-                    )
-                elif aggfunc == "avg":
-                    aggregate_data[aggregate_column_name] = (
-                        df.groupby([level1_field, level2_field, level3_field])[
-                            aggregate_field
-                        ]
-                        .mean()
-                        .to_dict()
-                    )
-                elif aggfunc == "min":
-                    aggregate_data[aggregate_column_name] = (
-                        df.groupby([level1_field, level2_field, level3_field])[
-                            aggregate_field
-                        ]
-                        .min()
-                        .to_dict()
-                    )
-                elif aggfunc == "max":
-                    aggregate_data[aggregate_column_name] = (
-                        df.groupby([level1_field, level2_field, level3_field])[
-                            aggregate_field
-                        ]
-                        .max()
-                        .to_dict()
-                    )
-                elif aggfunc == "count":
-                    aggregate_data[aggregate_column_name] = (
-                        df.groupby([level1_field, level2_field, level3_field])
-                        .size()
-                        .to_dict()
-                    )
-                else:
-                    aggregate_data[aggregate_column_name] = (
-                        df.groupby([level1_field, level2_field, level3_field])
-                        .size()
-                        .to_dict()
-                    )
+                aggregate_data[aggregate_column_name] = data.group_aggregate(
+                    group_fields, aggregate_field, aggfunc
+                )
                 aggregate_columns.append(
                     {
                         "name": aggregate_column_name,
@@ -1271,62 +1101,59 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
                     }
                 )
 
-            level1_groups = df.groupby(level1_field)
-            for level1_value, level1_df in level1_groups:
-                level1_info = self.get_display_value(
-                    level1_value, level1_field, model_class
-                )
-                level1_composite = level1_info["composite_key"]
-                level1_data = {
-                    "level1_group": level1_composite,
-                    "level1_group_display": level1_info["display"],
-                    "level1_group_id": level1_info["id"],
-                    "level2_groups": [],
-                    "level1_total": 0,
-                }
+            level1_groups = {}
+            level2_groups = {}
+            for key, count_value in data.group_counts(group_fields).items():
+                level1_value, level2_value, level3_value = key
+                if level1_value not in level1_groups:
+                    level1_info = self.get_display_value(
+                        level1_value, level1_field, model_class
+                    )
+                    level1_groups[level1_value] = {
+                        "level1_group": level1_info["composite_key"],
+                        "level1_group_display": level1_info["display"],
+                        "level1_group_id": level1_info["id"],
+                        "level2_groups": [],
+                        "level1_total": 0,
+                    }
+                level1_data = level1_groups[level1_value]
 
-                level2_groups = level1_df.groupby(level2_field)
-                for level2_value, level2_df in level2_groups:
+                if (level1_value, level2_value) not in level2_groups:
                     level2_info = self.get_display_value(
                         level2_value, level2_field, model_class
                     )
-                    level2_composite = level2_info["composite_key"]
                     level2_data = {
-                        "level2_group": level2_composite,
+                        "level2_group": level2_info["composite_key"],
                         "level2_group_display": level2_info["display"],
                         "level2_group_id": level2_info["id"],
                         "level3_items": [],
                         "level2_total": 0,
                     }
+                    level2_groups[(level1_value, level2_value)] = level2_data
+                    level1_data["level2_groups"].append(level2_data)
+                level2_data = level2_groups[(level1_value, level2_value)]
 
-                    level3_groups = level2_df.groupby(level3_field)
-                    for level3_value, level3_df in level3_groups:
-                        level3_info = self.get_display_value(
-                            level3_value, level3_field, model_class
-                        )
-                        level3_composite = level3_info["composite_key"]
-                        count_value = len(level3_df)
-                        aggregate_values = {
-                            agg["name"]: aggregate_data[agg["name"]].get(
-                                (level1_value, level2_value, level3_value), 0
-                            )
-                            for agg in aggregate_columns
-                        }
+                level3_info = self.get_display_value(
+                    level3_value, level3_field, model_class
+                )
+                aggregate_values = {
+                    agg["name"]: aggregate_data[agg["name"]].get(key, 0)
+                    for agg in aggregate_columns
+                }
 
-                        level3_item = {
-                            "level3_group": level3_composite,
-                            "level3_group_display": level3_info["display"],
-                            "level3_group_id": level3_info["id"],
-                            "count": count_value,
-                            "aggregate_values": aggregate_values,
-                        }
+                level3_item = {
+                    "level3_group": level3_info["composite_key"],
+                    "level3_group_display": level3_info["display"],
+                    "level3_group_id": level3_info["id"],
+                    "count": count_value,
+                    "aggregate_values": aggregate_values,
+                }
 
-                        level2_data["level3_items"].append(level3_item)
-                        level2_data["level2_total"] += count_value
-
-                    level1_data["level2_groups"].append(level2_data)
-                    level1_data["level1_total"] += level2_data["level2_total"]
+                level2_data["level3_items"].append(level3_item)
+                level2_data["level2_total"] += count_value
+                level1_data["level1_total"] += count_value
 
+            for level1_data in level1_groups.values():
                 three_level_data.append(level1_data)
                 grand_total += level1_data["level1_total"]
 
@@ -1375,7 +1202,7 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
                 "composite_key": str(value) if value is not None else "Unspecified (-)",
             }
 
-    def generate_chart_data(self, df, report):
+    def generate_chart_data(self, data, report):
         chart_data = {
             "labels": [],
             "data": [],
@@ -1386,7 +1213,7 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
             "urls": [],
         }
 
-        if df.empty:
+        if data.empty:
             return chart_data
 
         config_type = self.get_configuration_type(report)
@@ -1400,7 +1227,7 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
         try:
             if config_type == "0_row_0_col":
                 chart_data["labels"] = ["Records"]
-                chart_data["data"] = [len(df)]
+                chart_data["data"] = [data.count()]
                 chart_data["label_field"] = "Records"
                 chart_data["urls"] = [section_info["url"]]
 
@@ -1410,7 +1237,7 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
             ):
                 # Handle stacked charts with multiple grouping fields
                 chart_data.update(
-                    self._generate_stacked_chart_data(df, report, model_class)
+                    self._generate_stacked_chart_data(data, report, model_class)
                 )
 
             else:
@@ -1420,17 +1247,17 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
                 if (
                     hasattr(report, "chart_field")
                     and report.chart_field
-                    and report.chart_field in df.columns
+                    and report.chart_field in data.columns
                 ):
                     chart_field = report.chart_field
-                elif report.row_groups_list and report.row_groups_list[0] in df.columns:
+                elif report.row_groups_list and report.row_groups_list[0] in data.columns:
                     chart_field = report.row_groups_list[0]
                     if not report.chart_field:
                         report.chart_field = chart_field
                         report.save(update_fields=["chart_field"])
                 elif (
                     report.column_groups_list
-                    and report.column_groups_list[0] in df.columns
+                    and report.column_groups_list[0] in data.columns
                 ):
                     chart_field = report.column_groups_list[0]
                     if not report.chart_field:
@@ -1438,13 +1265,13 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
                         report.save(update_fields=["chart_field"])
 
                 if chart_field:
-                    grouped = df.groupby(chart_field).size()
+                    grouped = data.group_counts([chart_field])
 
                     # Create unique labels with counter for duplicates
                     display_labels = []
                     display_count = {}
 
-                    for k in grouped.index:
+                    for k in grouped:
                         display_info = self.get_display_value(
                             k, chart_field, model_class
                         )
@@ -1466,12 +1293,12 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
                         display_labels.append(unique_label)
 
                     chart_data["labels"] = display_labels
-                    chart_data["data"] = [float(v) for v in grouped.values]
+                    chart_data["data"] = [float(v) for v in grouped.values()]
                     chart_data["label_field"] = self.get_verbose_name(
                         chart_field, model_class
                     )
                     urls = []
-                    for value in grouped.index:
+                    for value in grouped:
                         query = urlencode(
                             {
                                 "section": section_info["section"],
@@ -1485,7 +1312,7 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
                     chart_data["urls"] = urls
                 else:
                     chart_data["labels"] = ["Records"]
-                    chart_data["data"] = [len(df)]
+                    chart_data["data"] = [data.count()]
                     chart_data["label_field"] = "Records"
                     chart_data["urls"] = [section_info["url"]]
 
@@ -1494,7 +1321,7 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
 
         return chart_data
 
-    def _generate_stacked_chart_data(self, df, report, model_class):
+    def _generate_stacked_chart_data(self, data, report, model_class):
         """Generate data for stacked charts when multiple grouping fields are available"""
 
         try:
@@ -1506,14 +1333,14 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
             if (
                 hasattr(report, "chart_field")
                 and report.chart_field
-                and report.chart_field in df.columns
+                and report.chart_field in data.columns
             ):
                 primary_field = report.chart_field
 
                 if (
                     hasattr(report, "chart_field_stacked")
                     and report.chart_field_stacked
-                    and report.chart_field_stacked in df.columns
+                    and report.chart_field_stacked in data.columns
                     and report.chart_field_stacked != primary_field
                 ):
                     secondary_field = report.chart_field_stacked
@@ -1522,12 +1349,12 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
             elif (
                 hasattr(report, "chart_field_stacked")
                 and report.chart_field_stacked
-                and report.chart_field_stacked in df.columns
+                and report.chart_field_stacked in data.columns
             ):
                 secondary_field = report.chart_field_stacked
                 all_fields = report.row_groups_list + report.column_groups_list
                 primary_field = next(
-                    (f for f in all_fields if f != secondary_field and f in df.columns),
+                    (f for f in all_fields if f != secondary_field and f in data.columns),
                     None,
                 )
 
@@ -1550,10 +1377,10 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
                         secondary_field = report.column_groups_list[1]
 
             if not primary_field or not secondary_field:
-                return self._fallback_chart_data(df, report, model_class)
+                return self._fallback_chart_data(data, report, model_class)
 
-            if primary_field not in df.columns or secondary_field not in df.columns:
-                return self._fallback_chart_data(df, report, model_class)
+            if primary_field not in data.columns or secondary_field not in data.columns:
+                return self._fallback_chart_data(data, report, model_class)
 
             # Save chart fields if not already set
             fields_to_update = []
@@ -1568,24 +1395,21 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
 
             # Create pivot table for stacked data
             try:
-                pivot_table = pd.pivot_table(
-                    df,
-                    index=[primary_field],
-                    columns=[secondary_field],
-                    aggfunc="size",
-                    fill_value=0,
-                )
+                pivot_counts = data.group_counts([primary_field, secondary_field])
             except Exception as pivot_error:
-                return self._fallback_chart_data(df, report, model_class)
+                return self._fallback_chart_data(data, report, model_class)
 
-            if pivot_table.empty:
-                return self._fallback_chart_data(df, report, model_class)
+            if not pivot_counts:
+                return self._fallback_chart_data(data, report, model_class)
+
+            pivot_index = list(dict.fromkeys(idx for idx, _ in pivot_counts))
+            pivot_columns = sorted({col for _, col in pivot_counts})
 
             # Prepare categories (x-axis labels) with unique names for duplicates
             categories = []
             category_count = {}
 
-            for idx in pivot_table.index:
+            for idx in pivot_index:
                 display_info = self.get_display_value(idx, primary_field, model_class)
                 if isinstance(display_info, dict):
                     base_display = display_info["display"]
@@ -1606,7 +1430,7 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
             series = []
             series_name_count = {}
 
-            for col in pivot_table.columns:
+            for col in pivot_columns:
                 col_display_info = self.get_display_value(
                     col, secondary_field, model_class
                 )
@@ -1625,17 +1449,9 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
                     series_name_count[base_col_display] = 1
                     col_display = base_col_display
 
-                series_data = []
-
-                for idx in pivot_table.index:
-                    try:
-                        value = pivot_table.loc[idx, col]
-                        series_data.append(int(value) if pd.notna(value) else 0)
-                    except Exception as val_error:
-                        logger.error(
-                            f"Value extraction error for {idx}, {col}: {str(val_error)}"
-                        )
-                        series_data.append(0)
+                series_data = [
+                    int(pivot_counts.get((idx, col), 0)) for idx in pivot_index
+                ]
 
                 series.append({"name": col_display, "data": series_data})
 
@@ -1647,7 +1463,7 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
 
             section_info = get_section_info_for_model(model_class)
             urls = []
-            for idx in pivot_table.index:
+            for idx in pivot_index:
                 query = urlencode(
                     {
                         "section": section_info["section"],
@@ -1680,34 +1496,34 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
             import traceback
 
             traceback.print_exc()
-            return self._fallback_chart_data(df, report, model_class)
+            return self._fallback_chart_data(data, report, model_class)
 
-    def _fallback_chart_data(self, df, report, model_class):
+    def _fallback_chart_data(self, data, report, model_class):
         """Fallback to simple chart when stacking fails"""
 
         fallback_field = None
         if (
             hasattr(report, "chart_field")
             and report.chart_field
-            and report.chart_field in df.columns
+            and report.chart_field in data.columns
         ):
             fallback_field = report.chart_field
-        elif report.row_groups_list and report.row_groups_list[0] in df.columns:
+        elif report.row_groups_list and report.row_groups_list[0] in data.columns:
             fallback_field = report.row_groups_list[0]
-        elif report.column_groups_list and report.column_groups_list[0] in df.columns:
+        elif report.column_groups_list and report.column_groups_list[0] in data.columns:
             fallback_field = report.column_groups_list[0]
 
         section_info = get_section_info_for_model(model_class)
 
         if fallback_field:
             try:
-                grouped = df.groupby(fallback_field).size()
+                grouped = data.group_counts([fallback_field])
 
                 # Create unique labels with counter for duplicates
                 display_labels = []
                 display_count = {}
 
-                for k in grouped.index:
+                for k in grouped:
                     display_info = self.get_display_value(
                         k, fallback_field, model_class
                     )
@@ -1727,7 +1543,7 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
                     display_labels.append(unique_label)
 
                 urls = []
-                for value in grouped.index:
+                for value in grouped:
                     query = urlencode(
                         {
                             "section": section_info["section"],
@@ -1741,7 +1557,7 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
 
                 return {
                     "labels": display_labels,
-                    "data": [float(v) for v in grouped.values],
+                    "data": [float(v) for v in grouped.values()],
                     "urls": urls,
                     "stacked_data": {},
                     "label_field": self.get_verbose_name(fallback_field, model_class),
@@ -1753,7 +1569,7 @@ class ReportDetailView(RecentlyViewedMixin, LoginRequiredMixin, DetailView):
         # Ultimate fallback
         return {
             "labels": ["Records"],
-            "data": [len(df)],
+            "data": [data.count()],
             "urls": [section_info["url"]],
             "stacked_data": {},
             "label_field": "Records",
@@ -4236,7 +4052,7 @@ class ReportExportView(LoginRequiredMixin, View):
         preview_data = request.session.get(session_key, {})
         temp_report = self.create_temp_report(report, preview_data)
 
-        df, context = self.get_report_data(temp_report, request)
+        data, context = self.get_report_data(temp_report, request)
 
         detail_view = ReportDetailView()
         detail_view.request = request
@@ -4246,11 +4062,11 @@ class ReportExportView(LoginRequiredMixin, View):
         detail_context = detail_view.get_context_data()
 
         if export_format == "excel":
-            return self.export_excel(report, df, detail_context, temp_report)
+            return self.export_excel(report, data, detail_context, temp_report)
         elif export_format == "csv":
-            return self.export_csv(report, df, detail_context, temp_report)
+            return self.export_csv(report, data, detail_context, temp_report)
         else:
-            return self.export_excel(report, df, detail_context, temp_report)
+            return self.export_excel(report, data, detail_context, temp_report)
 
     def create_temp_report(self, original_report, preview_data):
         """Create temporary report with preview data"""
@@ -4390,44 +4206,29 @@ class ReportExportView(LoginRequiredMixin, View):
             if query:
                 queryset = queryset.filter(query)
 
-        # Get fields and convert to DataFrame
-        fields = []
         aggregate_columns_dict = temp_report.aggregate_columns_dict
         if not isinstance(aggregate_columns_dict, list):
             aggregate_columns_dict = (
                 [aggregate_columns_dict] if aggregate_columns_dict else []
             )
 
-        if temp_report.selected_columns_list:
-            fields.extend(temp_report.selected_columns_list)
-        if temp_report.row_groups_list:
-            fields.extend(temp_report.row_groups_list)
-        if temp_report.column_groups_list:
-            fields.extend(temp_report.column_groups_list)
-
-        for agg in aggregate_columns_dict:
-            if agg.get("field"):
-                fields.append(agg["field"])
-
-        fields = list(dict.fromkeys(fields))
-        data = list(queryset.values(*fields)) if fields else list(queryset.values())
-        df = pd.DataFrame(data)
+        data = build_report_data(queryset, temp_report)
 
         # Create context for export
         context = {
-            "total_count": len(data),
+            "total_count": data.count(),
             "configuration_type": self.get_configuration_type(temp_report),
             "aggregate_columns_dict": aggregate_columns_dict,
         }
 
-        return df, context
+        return data, context
 
     def get_configuration_type(self, report):
         row_count = len(report.row_groups_list)
         col_count = len(report.column_groups_list)
         return f"{row_count}_row_{col_count}_col"
 
-    def export_excel(self, report, df, detail_context, temp_report):
+    def export_excel(self, report, data, detail_context, temp_report):
         """Export pivot table as Excel file"""
         response = HttpResponse(
             content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
@@ -4443,7 +4244,7 @@ class ReportExportView(LoginRequiredMixin, View):
 
         # Write pivot table data based on configuration type
         config_type = self.get_configuration_type(temp_report)
-        self._create_excel_sheet(ws, df, detail_context, temp_report, config_type)
+        self._create_excel_sheet(ws, data, detail_context, temp_report, config_type)
 
         # Add metadata sheet
         meta_ws = wb.create_sheet("Report Info")
@@ -4458,7 +4259,7 @@ class ReportExportView(LoginRequiredMixin, View):
         wb.save(response)
         return response
 
-    def _create_excel_sheet(self, ws, df, detail_context, temp_report, config_type):
+    def _create_excel_sheet(self, ws, data, detail_context, temp_report, config_type):
         """Route to appropriate sheet creation method based on configuration"""
         if config_type == "2_row_0_col":
             self._create_hierarchical_excel_sheet(
@@ -4474,7 +4275,7 @@ class ReportExportView(LoginRequiredMixin, View):
             )
         else:
             # Use existing pivot table logic for 0x0, 1x0, 1x1, 1x2
-            self._create_pivot_sheet(ws, df, detail_context, temp_report)
+            self._create_pivot_sheet(ws, data, detail_context, temp_report)
 
     def _create_hierarchical_excel_sheet(
         self, ws, detail_context, temp_report, hierarchy_type
@@ -4803,7 +4604,7 @@ class ReportExportView(LoginRequiredMixin, View):
             # Grand total
             writer.writerow(["", "Grand Total", grand_total])
 
-    def _create_pivot_sheet(self, ws, df, detail_context, temp_report):
+    def _create_pivot_sheet(self, ws, data, detail_context, temp_report):
         """Create pivot table sheet that matches the web detail view"""
         pivot_table = detail_context.get("pivot_table", {})
         pivot_index = detail_context.get("pivot_index", [])
@@ -5101,7 +4902,7 @@ class ReportExportView(LoginRequiredMixin, View):
                         start_color="E8F4FD", end_color="E8F4FD", fill_type="solid"
                     )
 
-    def export_csv(self, report, df, detail_context, temp_report):
+    def export_csv(self, report, data, detail_context, temp_report):
         """Export pivot table as CSV"""
         response = HttpResponse(content_type="text/csv")
         response["Content-Disposition"] = (
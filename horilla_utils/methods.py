@@ -11,6 +11,7 @@ import logging
 from django import template
 from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count, Max
 from django.http import HttpResponse
 from django.middleware.csrf import get_token
 from django.template import loader
@@ -43,6 +44,16 @@ def get_horilla_model_class(app_label, model):
     return model_class
 
 
+def get_data_stamp(queryset):
+    """
+    Return ``(row count, latest updated_at)`` of ``queryset``. It changes
+    with every create, save and delete of its rows, and every process reads
+    the same stamp, so it can validate caches kept in process memory.
+    """
+    stamp = queryset.aggregate(count=Count("pk"), latest=Max("updated_at"))
+    return (stamp["count"], stamp["latest"])
+
+
 def csrf_input(request):
     return format_html(
         '<input type="hidden" name="csrfmiddlewaretoken" value="{}">',
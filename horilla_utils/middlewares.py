@@ -1,24 +1,91 @@
-import threading
+"""
+Request context shared with code that has no access to the request
+(managers, model save, mail backends, template tags).
 
-_thread_local = threading.local()
+``_thread_local`` keeps the attribute API of the ``threading.local`` it
+replaces, but stores its attributes in a context variable: every request
+(sync view, async view or task) sees only its own attributes, async views
+can read them without a thread hop, and a pooled worker thread never keeps
+the request, or the company, of the previous request.
+"""
+
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+_context_data = ContextVar("horilla_request_context")
+
+
+class RequestContext:
+    """
+    Namespace object backed by a context variable, used like
+    ``threading.local``. The attributes are copied on write so a copied
+    context (``sync_to_async``, ``asyncio`` tasks) never changes its parent.
+    """
+
+    def __getattr__(self, key):
+        try:
+            return _context_data.get({})[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
+    def __setattr__(self, key, value):
+        data = dict(_context_data.get({}))
+        data[key] = value
+        _context_data.set(data)
+
+    def __delattr__(self, key):
+        data = dict(_context_data.get({}))
+        try:
+            del data[key]
+        except KeyError:
+            raise AttributeError(key) from None
+        _context_data.set(data)
+
+
+_thread_local = RequestContext()
+
+
+def set_current_request(request):
+    """
+    Start a new request context holding ``request`` and return the token to
+    pass to ``reset_current_request``.
+    """
+    return _context_data.set({"request": request})
+
+
+def reset_current_request(token):
+    """Restore the request context that was active before ``token``."""
+    _context_data.reset(token)
 
 
 class ThreadLocalMiddleware:
+    """Make the current request available through ``_thread_local``."""
+
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
-        # Store the request in thread local storageE
-        _thread_local.request = request
-
-        # Process the request
-        response = self.get_response(request)
-
-        # Clean up after the request is processed
-        if hasattr(_thread_local, "request"):
-            del _thread_local.request
-
-        return response
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        token = set_current_request(request)
+        try:
+            return self.get_response(request)
+        finally:
+            reset_current_request(token)
+
+    async def __acall__(self, request):
+        token = set_current_request(request)
+        try:
+            return await self.get_response(request)
+        finally:
+            reset_current_request(token)
 
 
 # Helper function to get the current request